@@ -1,7 +1,9 @@
 """
 .. include:: ../README.md
 """
-from .main import decision
+from .main import decision, decision_array, decision_batch
+from .pipeline import decision_chunked, decision_top_k
+from .prepared import PreparedDecision
 from .methods import vikor, vikor_ranking, ahp, ahp_cm, electre, topsis, wpm, wsm
 from .inout import load_data
 
@@ -10,9 +12,16 @@ from . import normalization
 from . import inout
 from . import methods
 from . import utils
+from . import pipeline
+from . import prepared
 
 __all__ = [
     "decision",
+    "decision_array",
+    "decision_batch",
+    "decision_chunked",
+    "decision_top_k",
+    "PreparedDecision",
     "load_data",
     "vikor",
     "vikor_ranking",
@@ -27,4 +36,6 @@ __all__ = [
     "weighting",
     "methods",
     "utils",
+    "pipeline",
+    "prepared",
 ]
@@ -6,6 +6,8 @@ import numpy as np
 from typing import Final
 
 from . import main
+from .methods.electre import MEMORY_LIMIT, DOMINANCE_OUTPUTS
+from .utils.cache import DecisionCache
 from .utils.framing import make_decision_matrix
 from .inout import load_data, save_result
 
@@ -13,6 +15,9 @@ OPTIONS = {
     "verbose": "-v",
     "normalization": "-n",
     "decision": "-d",
+    "cache": "-c",
+    "memory": "-m",
+    "output": "-o",
 }
 
 HELP_TEXT: Final = f"""Tool for handling Multiple Attribute Decision Making problems.
@@ -29,6 +34,9 @@ General Options for decision command:
 \t{OPTIONS['verbose']}\t\tGive more output.
 \t{OPTIONS['normalization']} <code_name>\tNormalization method name or "NONE".
 \t{OPTIONS['decision']} <code_name>\tDecision method name.
+\t{OPTIONS['cache']} <folder>\tFolder of the cache of loaded comparsion matrices and results.
+\t{OPTIONS['memory']} <bytes>\tMemory limit of one block of ELECTRE_BLOCKED and ELECTRE_RANKING.
+\t{OPTIONS['output']} <form>\tDominance relation of ELECTRE_BLOCKED, "edges" or "bitset".
 """
 
 METHODS_TEXT: Final = f"""
@@ -37,10 +45,14 @@ Decision making methods
 |-------------|--------------|
 | WSM | Weighted Sum Model |
 | WPM | Weighted Product Model |
+| WPM_LOG | Weighted Product Model in logarithmic domain |
 | TOPSIS | Technique for Order of Preference by Similarity to Ideal Solution |
 | VIKOR | VIKOR |
 | ELECTRE | Elimination and Choice Translating Reality |
+| ELECTRE_BLOCKED | ELECTRE with bounded memory |
+| ELECTRE_RANKING | ELECTRE ranked by the outranking graph |
 | AHP | Analytic hierarchy process |
+| PROMETHEE | Preference Ranking Organization Method for Enrichment Evaluation II |
 
 Normalization methods
 | Code name  | Method name  |
@@ -70,15 +82,20 @@ DECISION_METHODS: Final = [
     "AHP",
     "AHP_CM",
     "ELECTRE",
+    "ELECTRE_BLOCKED",
+    "ELECTRE_RANKING",
     "TOPSIS",
     "WPM",
+    "WPM_LOG",
     "WSM",
+    "PROMETHEE",
 ]
 
 ERROR_MISSING_ARGUMENT: Final = "Error: There is missing argument after {} option."
 ERROR_UNKNOWN_METHOD: Final = "Error: Entered {} method \"{}\" doesn`t exist!"
 ERROR_UNKNOWN_COMMAND: Final = "Error: Unknown command \"{}\"."
 ERROR_MISSING_DATA: Final = "Error: In the input file you must provide {}."
+ERROR_INVALID_OPTION: Final = "Error: Invalid value \"{}\" of {} option."
 
 
 def cli():
@@ -104,7 +121,9 @@ def cli():
 def cli_decision(options: list[str]):
     "Console decision proces that makes decision bases on options and path."
     verbose, n_method, d_method = get_parameters(options)
-    data, cr = cli_load_data()
+    memory_limit, dominance_output = electre_parameters(options)
+    cache = cli_cache(options)
+    data, cr = cli_load_data(cache)
 
     if data["alternatives"] is None:
         sys.exit(ERROR_MISSING_DATA.format("alternative matrix"))
@@ -117,7 +136,14 @@ def cli_decision(options: list[str]):
         data["types"] = np.full(row_size, True)
 
     result = main.decision(
-        data["alternatives"], data["weights"], data["types"], n_method, d_method
+        data["alternatives"],
+        data["weights"],
+        data["types"],
+        n_method,
+        d_method,
+        cache=cache,
+        memory_limit=memory_limit,
+        dominance_output=dominance_output,
     )
 
     if verbose:
@@ -206,7 +232,54 @@ def parse_options(options: list[str]):
     return verbose, n_method, d_method
 
 
-def cli_load_data():
+def electre_parameters(options: list[str]) -> tuple[int, str]:
+    "Method for parsing memory limit and dominance output of ELECTRE methods."
+    memory_limit = MEMORY_LIMIT
+    dominance_output = "edges"
+
+    is_present = OPTIONS["memory"] in options
+    if is_present:
+        index = options.index(OPTIONS["memory"])
+
+        if index + 1 == len(options):
+            sys.exit(ERROR_MISSING_ARGUMENT.format(OPTIONS["memory"]))
+
+        value = options[index + 1]
+
+        if not value.isdigit() or int(value) <= 0:
+            sys.exit(ERROR_INVALID_OPTION.format(value, OPTIONS["memory"]))
+
+        memory_limit = int(value)
+
+    is_present = OPTIONS["output"] in options
+    if is_present:
+        index = options.index(OPTIONS["output"])
+
+        if index + 1 == len(options):
+            sys.exit(ERROR_MISSING_ARGUMENT.format(OPTIONS["output"]))
+
+        dominance_output = options[index + 1].lower()
+
+        if dominance_output not in DOMINANCE_OUTPUTS:
+            sys.exit(ERROR_INVALID_OPTION.format(dominance_output, OPTIONS["output"]))
+
+    return memory_limit, dominance_output
+
+
+def cli_cache(options: list[str]) -> DecisionCache | None:
+    "Creates cache with disk tier in the folder of the cache option."
+    if OPTIONS["cache"] not in options:
+        return None
+
+    index = options.index(OPTIONS["cache"])
+
+    if index + 1 == len(options):
+        sys.exit(ERROR_MISSING_ARGUMENT.format(OPTIONS["cache"]))
+
+    return DecisionCache(folder=options[index + 1])
+
+
+def cli_load_data(cache: DecisionCache = None):
     "Load data from file."
     print("Enter the path to the data file: ")
 
@@ -214,7 +287,7 @@ def cli_load_data():
         file_path = input()
         print()
         
-        return load_data(file_path)
+        return load_data(file_path, cache=cache)
     except Exception as e:
         sys.exit(str(e))
 
@@ -0,0 +1,28 @@
+"Submodule for saving and loading data."
+from .files import (
+    load_data,
+    save_result,
+    read_JSON,
+    read_CSV,
+    read_CSV_chunks,
+    read_CSV_header,
+    read_NPY,
+    read_NPZ,
+)
+from .log import ResultLog, read_result_log, result_hash
+from .store import ResultStore
+
+__all__ = [
+    "load_data",
+    "save_result",
+    "read_JSON",
+    "read_CSV",
+    "read_CSV_chunks",
+    "read_CSV_header",
+    "read_NPY",
+    "read_NPZ",
+    "ResultLog",
+    "read_result_log",
+    "result_hash",
+    "ResultStore",
+]
@@ -0,0 +1,988 @@
+"Methods for saving and loading data files."
+import csv
+import json
+import base64
+import pathlib
+import struct
+import zipfile
+from datetime import datetime
+
+from typing import Final, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame, Index, Series, read_csv
+
+from ..weighting.pairwise import pairwise_comparisons, pairwise_alternatives
+from ..utils.cache import DecisionCache
+from ..utils.config import get_dtype
+from ..utils.misc import replace_fractions
+from ..utils.types import Result, DecisionMatrix, DominanceRelation
+
+ORIENT_TYPE: Final = "tight"
+
+ARRAY_KEYS: Final = ("alternatives", "weights", "types")
+
+RESULT_FORMATS: Final = ("json", "npz")
+
+# Size of the local file header of zip member without file name and extra field
+ZIP_HEADER_SIZE: Final = 30
+
+CSV_DELIMITERS: Final = {".csv": ",", ".tsv": "\t"}
+
+CSV_CHUNK_SIZE: Final = 2**16
+"Number of alternatives in one chunk of CSV file."
+
+# Labels of the rows with weights and types of the criteria under the header
+CSV_META_ROWS: Final = ("weights", "types")
+
+BENEFIT_TYPES: Final = ("+", "1", "true", "benefit")
+COST_TYPES: Final = ("-", "0", "false", "cost")
+
+
+def load_data(
+    path: pathlib.Path | str,
+    mmap_mode: str | None = "r",
+    cache: DecisionCache = None,
+) -> tuple[DecisionMatrix | Result, dict]:
+    """The method is designed to load the decision matrix data.
+    Supported formats are JSON, NPY and NPZ. Each key is optional.
+    Key "format" must be set on one of these values "matrix", "pairwise", "result".
+    If none of these values is provided then "format" is set on the value "matrix".
+    You can find examples in the README.md file or package documentation.
+
+    Fractions in comparsion matrices can be entered in
+    string format (e.g. "1/3", "1/5", "1/7") because
+    they are then converted to decimal format.
+
+    CSV and TSV files are read by read_CSV method, alternative labels
+    and criterion names are not returned.
+
+    NPY file contains only alternative matrix. NPZ file has matrix format
+    and can contain arrays "alternatives", "weights" and "types"
+    (for example saved by numpy.savez). Alternative matrix is memory-mapped
+    and is not converted to the working dtype, so it is not copied
+    until it is normalized. NPZ file saved by save_result has result format.
+
+    Args:
+        path (pathlib.Path | str): Path of the file.
+        mmap_mode (str | None, optional): Memory-map mode of the alternative
+            matrix in NPY and NPZ files, see numpy.memmap. Alternative matrix
+            compressed in NPZ file is always read into the memory.
+            Defaults to "r", None reads the matrix into the memory.
+        cache (DecisionCache, optional): Cache of the priority vectors
+            of the comparsion matrices. Defaults to None.
+
+    Raises:
+        ValueError: If Alternative matrix do not have number of columns equal to
+            size of weight vector.
+        ValueError: If Criteria type and weight vector do not have same size.
+        ValueError: If file type is not JSON, CSV, TSV, NPY or NPZ.
+
+    Returns:
+        For "matrix" format returns DecisionMatrix type dictionary and None.
+        For "pairwise" format returns DecisionMatrix type dictionary and dictionary
+            that contains "alternative_cr" and "criteria_cr" keys.
+        For "result" format returns Result type dictionary and None.
+    
+    Because all of the objects are optional, there could be None values.
+    """
+    suffix = pathlib.Path(path).suffix.lower()
+
+    match suffix:
+        case ".json":
+            data = read_JSON(path)
+        case ".npy":
+            data = {"alternatives": read_NPY(path, mmap_mode)}
+            return parse_array_format(data), None
+        case ".npz":
+            arrays = read_NPZ(path, mmap_mode, None)
+            metadata = parse_metadata(arrays.pop("metadata", None))
+
+            if metadata.get("format") == "result":
+                return parse_result_arrays(arrays, metadata, path), None
+
+            return parse_array_format(arrays), None
+        case ".csv" | ".tsv":
+            decision_matrix, _ = read_CSV(path)
+            return decision_matrix, None
+        case _:
+            raise ValueError(f'Error: Entered unknown file type!')
+
+    format = None
+    if "format" not in data or data["format"] is None:
+        format = "matrix"
+    else:
+        format = data["format"]
+
+    match format.upper():
+        case "MATRIX":
+            return parse_matrix_format(data), None
+        case "PAIRWISE":
+            return parse_pairwise_format(data, cache)
+        case "RESULT":
+            return parse_result_format(data, path), None
+        case _:
+            raise ValueError(f'Error: Entered unknown format "{format}"!')
+
+
+def read_JSON(path: pathlib.Path) -> dict:
+    """Reads file in the path and returns parsed JSON to dictionary.
+
+    Args:
+        path (pathlib.Path): Path of the file.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+        OSError: When there is an error while reading a file.
+        ValueError: When there is an error while parsing a file.
+    """
+    path = valid_file_path(path)
+
+    try:
+        with open(path, "r") as data_file:
+            raw_data = data_file.read()
+            return json.loads(raw_data)
+    except OSError as e:
+        raise OSError(f"There was an error while reading a file. {type(e)}: {e}")
+    except ValueError:
+        raise ValueError("There was an error while parsing the file to JSON.")
+
+
+def read_CSV(
+    path: pathlib.Path | str, delimiter: str = None, labels: bool = True
+) -> tuple[DecisionMatrix, dict]:
+    """Reads decision matrix from CSV or TSV file. Numeric values
+    are parsed in bulk by the C parser of pandas, which can differ
+    from the decimal value in the last bit. The C parser creates one
+    Python string for each label of the alternatives, labels are then
+    converted to fixed-width unicode array. Files without the labels
+    column (labels=False) create no Python object per row.
+
+    The header row contains names of the criteria, a name can end with
+    "+" (beneficial) or "-" (cost). When the first column contains labels
+    of the alternatives, rows labeled "weights" and "types" can follow
+    the header. Types are "+", "-", 1, 0, true, false, benefit or cost.
+    Weights and types can be also stored in JSON sidecar file with the
+    same name (e.g. "matrix.json" for "matrix.csv"), which takes
+    precedence over the header.
+
+    Example:
+    ```
+    alternative,price-,quality+,speed+
+    weights,0.5,0.3,0.2
+    A1,250,7,3
+    A2,300,9,2
+    ```
+
+    Args:
+        path (pathlib.Path | str): Path of the file.
+        delimiter (str, optional): Delimiter of the values.
+            Defaults to None, which is tab for TSV file and comma otherwise.
+        labels (bool, optional): The first column contains labels
+            of the alternatives. Defaults to True.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+        ValueError: When there is an error while parsing the file.
+        ValueError: If Alternative matrix do not have number of columns equal to
+            number of criteria or size of weight vector.
+        ValueError: If Criteria type and weight vector do not have same size.
+
+    Returns DecisionMatrix type dictionary and dictionary that contains
+    "labels" (None without labels column) and "criteria" keys.
+    """
+    decision_matrix, header = read_CSV_header(path, delimiter, labels)
+
+    data = read_csv(
+        header["path"],
+        sep=header["delimiter"],
+        header=None,
+        skiprows=header["skiprows"],
+        dtype=CSV_dtypes(len(header["criteria"]), labels),
+        engine="c",
+    )
+
+    row_labels, a_matrix = split_CSV_block(data, header["criteria"], labels)
+    decision_matrix["alternatives"] = a_matrix
+
+    valid_decision_matrix(decision_matrix)
+
+    return decision_matrix, {"labels": row_labels, "criteria": header["criteria"]}
+
+
+def read_CSV_chunks(
+    path: pathlib.Path | str,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    delimiter: str = None,
+    labels: bool = True,
+) -> Iterator[tuple[NDArray | None, NDArray]]:
+    """Reads CSV or TSV file in chunks of rows, so the file can be
+    larger than the memory. Format of the file is described
+    in read_CSV method, weights and types are read by read_CSV_header.
+
+    Args:
+        path (pathlib.Path | str): Path of the file.
+        chunk_size (int, optional): Number of alternatives in one chunk.
+            Defaults to 65536.
+        delimiter (str, optional): Delimiter of the values.
+            Defaults to None, which is tab for TSV file and comma otherwise.
+        labels (bool, optional): The first column contains labels
+            of the alternatives. Defaults to True.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+        ValueError: When there is an error while parsing the file.
+
+    Yields labels of the alternatives (None without labels column)
+    and alternative matrix of each chunk.
+    """
+    _, header = read_CSV_header(path, delimiter, labels)
+
+    reader = read_csv(
+        header["path"],
+        sep=header["delimiter"],
+        header=None,
+        skiprows=header["skiprows"],
+        dtype=CSV_dtypes(len(header["criteria"]), labels),
+        engine="c",
+        chunksize=chunk_size,
+    )
+
+    with reader:
+        for data in reader:
+            yield split_CSV_block(data, header["criteria"], labels)
+
+
+def read_CSV_header(
+    path: pathlib.Path | str, delimiter: str = None, labels: bool = True
+) -> tuple[DecisionMatrix, dict]:
+    """Reads header rows of CSV or TSV file and its JSON sidecar file.
+    Format of the file is described in read_CSV method.
+
+    Args:
+        path (pathlib.Path | str): Path of the file.
+        delimiter (str, optional): Delimiter of the values.
+            Defaults to None, which is tab for TSV file and comma otherwise.
+        labels (bool, optional): The first column contains labels
+            of the alternatives. Defaults to True.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+        ValueError: If the file is empty or criteria types are unknown.
+
+    Returns DecisionMatrix type dictionary without alternatives and
+    dictionary that contains "path", "delimiter", "criteria" and
+    "skiprows" (number of the header rows) keys.
+    """
+    path = valid_file_path(path)
+
+    if delimiter is None:
+        delimiter = CSV_DELIMITERS.get(path.suffix.lower(), ",")
+
+    w_vector = None
+    skiprows = 1
+
+    with open(path, "r", newline="") as data_file:
+        reader = csv.reader(data_file, delimiter=delimiter)
+        header = next(reader, None)
+
+        if header is None:
+            raise ValueError(f'File "{ path }" is empty.')
+
+        criteria, types = parse_criteria(header[1:] if labels else header)
+
+        for row in reader if labels else ():
+            key = row[0].strip().lower() if row else ""
+
+            if key not in CSV_META_ROWS:
+                break
+
+            if key == "weights":
+                w_vector = replace_fractions(row[1:]).astype(get_dtype())
+            else:
+                types = parse_types(row[1:])
+
+            skiprows += 1
+
+    decision_matrix: DecisionMatrix = {
+        "alternatives": None,
+        "weights": w_vector,
+        "types": types,
+    }
+
+    sidecar_path = path.with_suffix(".json")
+
+    if sidecar_path.is_file():
+        sidecar = read_JSON(sidecar_path)
+        sidecar = {key: sidecar[key] for key in CSV_META_ROWS if key in sidecar}
+
+        for key, value in parse_matrix_format(sidecar).items():
+            if value is not None:
+                decision_matrix[key] = value
+
+    valid_decision_matrix(decision_matrix)
+
+    return decision_matrix, {
+        "path": path,
+        "delimiter": delimiter,
+        "criteria": criteria,
+        "skiprows": skiprows,
+    }
+
+
+def parse_criteria(names: list[str]) -> tuple[NDArray, NDArray | None]:
+    """Splits header cells to criterion names and types given
+    by "+" or "-" at the end of the name. Criterion without
+    the sign is beneficial.
+
+    Returns criterion names and types, which are None if no name has the sign.
+    """
+    names = [name.strip() for name in names]
+    types = np.array([not name.endswith("-") for name in names], dtype=bool)
+
+    has_type = any(name.endswith(("+", "-")) for name in names)
+    names = [
+        name[:-1].rstrip() if name.endswith(("+", "-")) else name for name in names
+    ]
+
+    return np.array(names, dtype=str), types if has_type else None
+
+
+def parse_types(values: list[str]) -> NDArray:
+    """Parses criteria types, which are "+", "-", 1, 0, true, false,
+    benefit or cost.
+
+    Raises:
+        ValueError: If type is unknown.
+    """
+    types = []
+
+    for value in values:
+        value = value.strip().lower()
+
+        if value not in BENEFIT_TYPES + COST_TYPES:
+            raise ValueError(
+                f'Unknown criteria type "{value}". '
+                f"Expected one of {BENEFIT_TYPES + COST_TYPES}."
+            )
+
+        types.append(value in BENEFIT_TYPES)
+
+    return np.array(types, dtype=bool)
+
+
+def CSV_dtypes(size: int, labels: bool) -> dict:
+    "Returns dtypes of the columns of CSV file for pandas parser."
+    dtypes = {idx: get_dtype() for idx in range(int(labels), size + int(labels))}
+
+    if labels:
+        dtypes[0] = str
+
+    return dtypes
+
+
+def split_CSV_block(
+    data: DataFrame, criteria: NDArray, labels: bool
+) -> tuple[NDArray | None, NDArray]:
+    """Splits parsed rows of CSV file to labels and alternative matrix.
+    Labels parsed by pandas as Python strings are converted
+    to fixed-width unicode array.
+
+    Raises:
+        ValueError: If alternative matrix do not have number of columns
+            equal to number of criteria.
+    """
+    if data.shape[1] != len(criteria) + int(labels):
+        raise ValueError(
+            "Alternative matrix must have "
+            "number of columns equal to number of criteria."
+        )
+
+    row_labels = data.iloc[:, 0].to_numpy(dtype=str) if labels else None
+    a_matrix = data.iloc[:, int(labels):].to_numpy(dtype=get_dtype())
+
+    return row_labels, a_matrix
+
+
+def read_NPY(path: pathlib.Path | str, mmap_mode: str | None) -> NDArray:
+    """Reads array from NPY file in the path.
+
+    Args:
+        path (pathlib.Path | str): Path of the file.
+        mmap_mode (str | None): Memory-map mode of the array.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+        ValueError: When the file is not valid NPY file.
+    """
+    path = valid_file_path(path)
+
+    try:
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+    except ValueError as e:
+        raise ValueError(f"There was an error while reading NPY file. {e}")
+
+
+def read_NPZ(
+    path: pathlib.Path | str,
+    mmap_mode: str | None,
+    keys: tuple[str, ...] | None = ARRAY_KEYS,
+) -> dict:
+    """Reads arrays from NPZ file in the path. Arrays stored
+    without compression are memory-mapped when mmap_mode is set.
+
+    Args:
+        path (pathlib.Path | str): Path of the file.
+        mmap_mode (str | None): Memory-map mode of the arrays.
+        keys (tuple[str, ...] | None, optional): Names of the read arrays,
+            missing arrays are skipped. Defaults to ARRAY_KEYS,
+            None reads all arrays.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+        ValueError: When the file is not valid NPZ file.
+
+    Returns dictionary of the arrays.
+    """
+    path = valid_file_path(path)
+    arrays = {}
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            members = {
+                info.filename.removesuffix(".npy"): info
+                for info in archive.infolist()
+            }
+
+            with np.load(path, allow_pickle=False) as npz:
+                for key in members if keys is None else keys:
+                    if key not in members:
+                        continue
+
+                    info = members[key]
+                    is_stored = info.compress_type == zipfile.ZIP_STORED
+
+                    if mmap_mode is not None and is_stored:
+                        arrays[key] = map_zip_member(path, info, mmap_mode)
+                    else:
+                        arrays[key] = npz[key]
+    except (ValueError, zipfile.BadZipFile) as e:
+        raise ValueError(f"There was an error while reading NPZ file. {e}")
+
+    return arrays
+
+
+def map_zip_member(
+    path: pathlib.Path, info: zipfile.ZipInfo, mmap_mode: str
+) -> NDArray:
+    """Memory-maps NPY array stored without compression in zip file.
+
+    Raises:
+        ValueError: If the member is not valid NPY array
+            or it contains Python objects.
+    """
+    with open(path, "rb") as file:
+        file.seek(info.header_offset)
+        header = file.read(ZIP_HEADER_SIZE)
+
+        # Lengths of the file name and of the extra field of the local header
+        name_size, extra_size = struct.unpack("<HH", header[26:30])
+        file.seek(info.header_offset + ZIP_HEADER_SIZE + name_size + extra_size)
+
+        match np.lib.format.read_magic(file):
+            case (1, 0):
+                header = np.lib.format.read_array_header_1_0(file)
+            case (2, 0):
+                header = np.lib.format.read_array_header_2_0(file)
+            case version:
+                raise ValueError(f"Unsupported NPY format version {version}.")
+
+        shape, fortran_order, dtype = header
+        offset = file.tell()
+
+    if dtype.hasobject:
+        raise ValueError("Arrays with Python objects can not be memory-mapped.")
+
+    order = "F" if fortran_order else "C"
+
+    return np.memmap(path, dtype, mmap_mode, offset, shape, order)
+
+
+def valid_file_path(path: pathlib.Path | str) -> pathlib.Path:
+    """Checks if the path is a file and returns its absolute path.
+
+    Raises:
+        FileNotFoundError: If path does not exist or path is not file.
+    """
+    path = pathlib.Path(path).absolute()
+
+    if not path.exists():
+        raise FileNotFoundError(f'Path "{ path }" does not exist.')
+
+    if path.is_dir():
+        raise FileNotFoundError(f'File in the path "{ path }" is directory.')
+
+    return path
+
+
+def parse_array_format(data: dict) -> DecisionMatrix:
+    """Auxiulary method for parsing arrays of NPY and NPZ files.
+    Alternative matrix is kept as it is, so memory-mapped
+    matrix is not read.
+
+    Args:
+        data (dict): Arrays that have been obtained from the file.
+
+    Raises:
+        ValueError: If Alternative matrix is not numeric matrix.
+        ValueError: If Alternative matrix do not have number of columns equal to
+            size of weight vector.
+        ValueError: If Criteria type and weight vector do not have same size.
+
+    Returns DecisionMatrix type dictionary.
+    """
+    a_matrix = data.get("alternatives")
+    w_vector = data.get("weights")
+    types = data.get("types")
+
+    if a_matrix is not None:
+        is_numeric = np.issubdtype(a_matrix.dtype, np.number)
+
+        if a_matrix.ndim != 2 or not is_numeric:
+            raise ValueError("Alternative matrix must be 2 dimensional numeric array.")
+
+    if w_vector is not None:
+        w_vector = np.array(w_vector, dtype=get_dtype())
+
+    if types is not None:
+        types = np.array(types, dtype=bool)
+
+    decision_matrix: DecisionMatrix = {
+        "alternatives": a_matrix,
+        "weights": w_vector,
+        "types": types,
+    }
+
+    valid_decision_matrix(decision_matrix)
+
+    return decision_matrix
+
+
+def valid_decision_matrix(decision_matrix: DecisionMatrix):
+    """Checks that shapes of loaded arrays are correct.
+
+    Raises:
+        ValueError: If Alternative matrix do not have number of columns equal to
+            size of weight vector.
+        ValueError: If Criteria type and weight vector do not have same size.
+    """
+    a_matrix = decision_matrix["alternatives"]
+    w_vector = decision_matrix["weights"]
+    types = decision_matrix["types"]
+
+    is_present = a_matrix is not None and w_vector is not None
+    if is_present and a_matrix.shape[1] != len(w_vector):
+        raise ValueError(
+            "Alternative matrix must have "
+            "number of columns equal to size of weight vector."
+        )
+
+    is_present = types is not None and w_vector is not None
+    if is_present and len(types) != len(w_vector):
+        raise ValueError(f"Criteria type and weight vector must have same size.")
+
+
+def parse_matrix_format(
+    data: dict,
+) -> DecisionMatrix:
+    """Auxiulary method for parsing data from dictionary
+    that have matrix format.
+
+    Args:
+        data (dict): Data in dictionary format
+            that has been obtained from the file.
+
+    Raises:
+        ValueError: If Alternative matrix do not have number of columns equal to
+            size of weight vector.
+        ValueError: If Criteria type and weight vector do not have same size.
+
+    Returns DecisionMatrix type dictionary.
+    """
+    a_matrix = None
+    w_vector = None
+    types = None
+
+    if "alternatives" in data:
+        a_matrix = replace_fractions(data["alternatives"])
+        a_matrix = a_matrix.astype(get_dtype(), copy=False)
+
+    if "weights" in data:
+        w_vector = replace_fractions(data["weights"])
+        w_vector = w_vector.astype(get_dtype(), copy=False)
+
+    if "types" in data:
+        types = np.array(data["types"])
+
+    decision_matrix: DecisionMatrix = {
+        "alternatives": a_matrix,
+        "weights": w_vector,
+        "types": types,
+    }
+
+    valid_decision_matrix(decision_matrix)
+
+    return decision_matrix
+
+
+def parse_pairwise_format(
+    data: dict,
+    cache: DecisionCache = None,
+) -> tuple[DecisionMatrix, dict]:
+    """Auxiulary for parsing and handling data from dictionary
+    that have pairwise format.
+
+    Args:
+        data (dict): Data in dictionary format
+            that has been obtained from the file.
+        cache (DecisionCache, optional): Cache of the priority vectors.
+            Defaults to None.
+
+    Raises:
+        ValueError: If criteria comparison matrix does not have
+            same number of rows as alternative comparsion matrices.
+        ValueError: If Criteria type and weight vector do not have same size.
+
+    Returns DecisionMatrix type dictionary and dictionary
+    that contains "alternative_cr" and "criteria_cr" keys.
+    """
+    a_matrix = None
+    w_vector = None
+    types = None
+
+    # Consistency ratios for alternatives and criterion
+    a_cr = None
+    c_cr = None
+
+    comparsion_matrices = []
+    if "alternatives" in data:
+        for matrix in data["alternatives"]:
+            matrix = replace_fractions(matrix)
+            comparsion_matrices.append(matrix)
+        comparsion_matrices = np.array(comparsion_matrices)
+
+    if "criteria" in data:
+        criteria = replace_fractions(data["criteria"])
+    
+    if "types" in data:
+        types = np.array(data["types"])
+
+    if types.dtype == str:
+        types = np.char.capitalize(types)
+        types = (types == "True")
+
+    is_present = types is not None and w_vector is not None
+    if is_present and len(types) != len(w_vector):
+        raise ValueError(f"Criteria types and weight vector must have same size.")
+
+    alternatives_count = comparsion_matrices.shape[0]
+    is_present = criteria is not None and comparsion_matrices is not None
+    if is_present and criteria.shape[0] != alternatives_count:
+        raise ValueError(
+            "Criteria comparison matrix must have same number of rows as "
+            "alternative comparsion matrices."
+        )
+
+    a_matrix, a_cr = pairwise_alternatives(np.array(comparsion_matrices), cache)
+    w_vector, c_cr = pairwise_comparisons(criteria, cache)
+
+    index = list(range(1, alternatives_count + 1))
+    a_cr = Series(a_cr, index, name="CR")
+
+    decision_matrix: DecisionMatrix = {
+        "alternatives": a_matrix,
+        "weights": w_vector,
+        "types": types,
+    }
+
+    cr = {"alternative_cr": a_cr, "criteria_cr": c_cr}
+
+    return decision_matrix, cr
+
+
+def parse_result_format(
+    data: dict,
+    path: pathlib.Path,
+) -> Result:
+    """Auxiulary method that parse dictionary that have result format.
+    Dataframes saved as dictionary with orient type tight and
+    Series as dictionary.
+
+    Args:
+        data (dict): Data in dictionary format
+            that has been obtained from the file.
+
+    Returns Result type dictionary.
+    """
+    result: Result = {
+        "decision": parse_decision(data["decision"]),
+        "alternatives": DataFrame.from_dict(data["alternatives"], orient=ORIENT_TYPE),
+        "weights": Series(data["weights"]),
+        "criteria_type": Series(data["criteria_type"]),
+        "n_method": data["n_method"],
+        "d_method": data["d_method"],
+        "path": path,
+    }
+
+    return result
+
+
+def parse_result_arrays(
+    arrays: dict, metadata: dict, path: pathlib.Path
+) -> Result:
+    """Auxiulary method that parse arrays of NPZ file that have result format.
+    Labels and names of the dataframes are stored in the metadata.
+
+    Args:
+        arrays (dict): Arrays that have been obtained from the file.
+        metadata (dict): Metadata of the result.
+        path (pathlib.Path): Path of the file.
+
+    Returns Result type dictionary.
+    """
+    decision = metadata["decision"]
+
+    if decision["format"] == "dominance":
+        relation: DominanceRelation = {
+            "size": decision["size"],
+            "rows": arrays.get("decision/rows"),
+            "cols": arrays.get("decision/cols"),
+            "bits": arrays.get("decision/bits"),
+        }
+    else:
+        index = Index(arrays["decision/index"], name=decision["index_name"])
+        relation = DataFrame(
+            {column: arrays[f"decision/{column}"] for column in decision["columns"]},
+            index,
+        )
+
+    alternatives = metadata["alternatives"]
+    a_dataframe = DataFrame(
+        arrays["alternatives/values"],
+        Index(arrays["alternatives/index"], name=alternatives["index_name"]),
+        Index(alternatives["columns"], name=alternatives["columns_name"]),
+    )
+
+    weights = metadata["weights"]
+    w_series = Series(
+        arrays["weights"],
+        Index(weights["index"], name=weights["index_name"]),
+        name=weights["name"],
+    )
+
+    result: Result = {
+        "decision": relation,
+        "alternatives": a_dataframe,
+        "weights": w_series,
+        "criteria_type": arrays["criteria_type"],
+        "n_method": metadata["n_method"],
+        "d_method": metadata["d_method"],
+        "path": path,
+    }
+
+    return result
+
+
+def parse_metadata(metadata: NDArray | None) -> dict:
+    "Decodes metadata of NPZ file stored as bytes of JSON."
+    if metadata is None:
+        return {}
+
+    return json.loads(np.asarray(metadata, dtype=np.uint8).tobytes().decode("utf-8"))
+
+
+def parse_decision(data: dict) -> DataFrame | DominanceRelation:
+    """Auxiulary method that parse saved decision result.
+    Dominance relation is recognized by "format" key,
+    other results are dataframes saved with orient type tight.
+
+    Args:
+        data (dict): Saved decision result.
+    """
+    if data.get("format") != "dominance":
+        return DataFrame.from_dict(data, orient=ORIENT_TYPE)
+
+    relation: DominanceRelation = {
+        "size": data["size"],
+        "rows": None,
+        "cols": None,
+        "bits": None,
+    }
+
+    if data.get("bits") is not None:
+        size = data["size"]
+        bits = base64.b64decode(data["bits"])
+        bits = np.frombuffer(bits, dtype=np.uint8)
+        relation["bits"] = bits.reshape(size, (size + 7) // 8)
+    else:
+        relation["rows"] = np.array(data["rows"], dtype=np.int64)
+        relation["cols"] = np.array(data["cols"], dtype=np.int64)
+
+    return relation
+
+
+def decision_to_dict(decision: DataFrame | DominanceRelation) -> dict:
+    """Auxiulary method that converts decision result to dictionary.
+    Dominance relation is saved as edge list or base64 encoded bitset,
+    so it is never converted to the dense matrix.
+
+    Args:
+        decision (DataFrame | DominanceRelation): Decision result.
+    """
+    if isinstance(decision, DataFrame):
+        return decision.to_dict(orient=ORIENT_TYPE)
+
+    dictionary = {"format": "dominance", "size": decision["size"]}
+
+    if decision["bits"] is not None:
+        bits = np.ascontiguousarray(decision["bits"], dtype=np.uint8)
+        dictionary["bits"] = base64.b64encode(bits.tobytes()).decode("ascii")
+    else:
+        dictionary["rows"] = decision["rows"].tolist()
+        dictionary["cols"] = decision["cols"].tolist()
+
+    return dictionary
+
+
+def save_result(
+    data: Result,
+    folder: pathlib.Path | str = None,
+    desc: str = "",
+    file_format: str = "json",
+    compress: bool = False,
+) -> pathlib.Path:
+    """Saves decision data for later use.
+
+    Args:
+        a_dataframe (pd.DataFrame): Alternative dataframe.
+        w_vector (NDArray): Weight vector.
+        decision_result (pd.DataFrame): Decision result.
+        folder (pathlib.Path | str, optional): Path to the output folder.
+            If None then file will be saved in current folder.
+        desc (str, optional): String that will be in the name of the file.
+        file_format (str, optional): Format of the file, "json" or "npz".
+            Defaults to "json".
+        compress (bool, optional): Compresses arrays of NPZ file,
+            which can not be memory-mapped then. Defaults to False.
+
+    Raises:
+        ValueError: If file format is unknown.
+
+    NPZ file stores arrays of the result in binary form and labels
+    and names in JSON metadata, so score and rank vectors can be read
+    by read_NPZ method without reading the alternatives.
+
+    Returns path to the result file.
+    """
+    if file_format not in RESULT_FORMATS:
+        raise ValueError(
+            f'Unknown result format "{file_format}". Expected one of {RESULT_FORMATS}.'
+        )
+
+    now = datetime.now()
+    current_time = now.strftime("%f_%d-%w-%Y")
+
+    if folder is None:
+        folder = pathlib.Path.cwd()
+
+    folder = pathlib.Path(folder)
+
+    if desc:
+        desc = f"{desc}_"
+
+    path = folder.joinpath(f"{desc}{current_time}.{file_format}")
+
+    if file_format == "npz":
+        save_result_NPZ(data, path, compress)
+        return path
+
+    dictionary = {
+        "format": "result",
+        "decision": decision_to_dict(data["decision"]),
+        "alternatives": data["alternatives"].to_dict(orient=ORIENT_TYPE),
+        "weights": data["weights"].tolist(),
+        "criteria_type": data["criteria_type"].tolist(),
+        "n_method": data["n_method"],
+        "d_method": data["d_method"],
+    }
+
+    data = json.dumps(dictionary, ensure_ascii=False, indent=4)
+
+    with open(path, "w") as writer:
+        writer.write(data)
+
+    return path
+
+
+def save_result_NPZ(data: Result, path: pathlib.Path, compress: bool = False):
+    """Saves decision data to NPZ file. Each dataframe column
+    of the decision is stored as array "decision/<column>".
+
+    Args:
+        data (Result): Decision data.
+        path (pathlib.Path): Path to the result file.
+        compress (bool, optional): Compresses the arrays. Defaults to False.
+    """
+    decision = data["decision"]
+    a_dataframe = data["alternatives"]
+    w_series = data["weights"]
+
+    arrays = {
+        "alternatives/values": a_dataframe.to_numpy(),
+        "alternatives/index": a_dataframe.index.to_numpy(dtype=str),
+        "weights": w_series.to_numpy(),
+        "criteria_type": np.asarray(data["criteria_type"], dtype=bool),
+    }
+
+    if isinstance(decision, DataFrame):
+        columns = [str(column) for column in decision.columns]
+        decision_metadata = {
+            "format": "dataframe",
+            "columns": columns,
+            "index_name": decision.index.name,
+        }
+
+        arrays["decision/index"] = decision.index.to_numpy(dtype=str)
+
+        for name, column in zip(columns, decision.columns):
+            arrays[f"decision/{name}"] = decision[column].to_numpy()
+    else:
+        decision_metadata = {"format": "dominance", "size": decision["size"]}
+
+        for key in ("rows", "cols", "bits"):
+            if decision[key] is not None:
+                arrays[f"decision/{key}"] = np.asarray(decision[key])
+
+    metadata = {
+        "format": "result",
+        "decision": decision_metadata,
+        "alternatives": {
+            "columns": [str(column) for column in a_dataframe.columns],
+            "index_name": a_dataframe.index.name,
+            "columns_name": a_dataframe.columns.name,
+        },
+        "weights": {
+            "index": [str(label) for label in w_series.index],
+            "index_name": w_series.index.name,
+            "name": w_series.name,
+        },
+        "n_method": data["n_method"],
+        "d_method": data["d_method"],
+    }
+
+    metadata = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+    arrays["metadata"] = np.frombuffer(metadata, dtype=np.uint8)
+
+    save = np.savez_compressed if compress else np.savez
+    save(path, **arrays)
@@ -0,0 +1,329 @@
+"""Append-only log of decision results.
+
+Each result is one line of JSON (JSONL). Records are buffered and written
+by one append under an exclusive file lock, so more processes can log
+into the same file without interleaving. Full log file is renamed with
+a timestamp and a new file is started.
+"""
+import json
+import os
+import pathlib
+import re
+import weakref
+from datetime import datetime, timezone
+from typing import Final, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame
+
+from ..utils.misc import content_hash
+from ..utils.types import Result
+
+try:
+    import fcntl
+except ImportError:
+    # File locks are not available on Windows
+    fcntl = None
+
+MAX_BYTES: Final = 2**26
+"Size of the log file after which the file is rotated."
+
+BUFFER_SIZE: Final = 2**16
+"Size of the buffered records after which they are written."
+
+
+class ResultLog:
+    """Sink that appends compact records of decision results
+    to rotating JSONL file.
+
+    Record contains time, hash of the decision problem, method code names,
+    score and rank of each alternative in the order of the alternatives
+    (None if the decision method does not score the alternatives)
+    and optional reference to saved alternatives.
+
+    Buffered records are written also when the log is garbage collected
+    or the interpreter exits without close.
+
+    Attributes:
+        path (pathlib.Path): Path of the current log file.
+        max_bytes (int): Size of the file after which it is rotated.
+        buffer_size (int): Size of the buffered records
+            after which they are written.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | str,
+        max_bytes: int = MAX_BYTES,
+        buffer_size: int = BUFFER_SIZE,
+    ):
+        """
+        Args:
+            path (pathlib.Path | str): Path of the log file.
+            max_bytes (int, optional): Size of the file after which it is
+                rotated. Defaults to 64 MiB.
+            buffer_size (int, optional): Size of the buffered records after
+                which they are written. Defaults to 64 KiB, 0 writes each
+                record immediately.
+        """
+        self.buffer_size = buffer_size
+
+        self._file = LogFile(pathlib.Path(path), max_bytes)
+        self._buffered = 0
+
+        # Finalizer does not reference the log, so the log can be collected
+        weakref.finalize(self, self._file.close)
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._file.path
+
+    @property
+    def max_bytes(self) -> int:
+        return self._file.max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int):
+        self._file.max_bytes = max_bytes
+
+    def append(
+        self,
+        result: Result,
+        problem_hash: str = None,
+        reference: str = None,
+    ):
+        """Adds record of the result to the log.
+
+        Args:
+            result (Result): Decision result.
+            problem_hash (str, optional): Hash of the decision problem.
+                Defaults to None, which computes hash of the normalized
+                alternatives, weights, criteria types and methods.
+            reference (str, optional): Reference to the saved alternatives,
+                for example path to the result file. Defaults to None.
+        """
+        if problem_hash is None:
+            problem_hash = result_hash(result)
+
+        score, rank = result_vectors(result)
+
+        record = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "hash": problem_hash,
+            "n_method": result["n_method"],
+            "d_method": result["d_method"],
+            "score": None if score is None else score.tolist(),
+            "rank": None if rank is None else rank.tolist(),
+            "alternatives": reference,
+        }
+
+        self.write(record)
+
+    def write(self, record: dict):
+        "Adds record, which is JSON serializable dictionary, to the log."
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+        line = f"{line}\n".encode("utf-8")
+
+        self._file.buffer.append(line)
+        self._buffered += len(line)
+
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Writes buffered records by one append under exclusive lock
+        and rotates the file if it is full."""
+        self._buffered = 0
+        self._file.flush()
+
+    def close(self):
+        "Writes buffered records and closes the file."
+        self._buffered = 0
+        self._file.close()
+
+    def __enter__(self) -> "ResultLog":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class LogFile:
+    """Buffered records and descriptor of the current log file.
+    It is separated from the ResultLog, so the finalizer of the log
+    can write the records.
+
+    Attributes:
+        path (pathlib.Path): Path of the current log file.
+        max_bytes (int): Size of the file after which it is rotated.
+        buffer (list[bytes]): Buffered lines of the records.
+    """
+
+    def __init__(self, path: pathlib.Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.buffer: list[bytes] = []
+
+        self._fd = None
+
+    def flush(self):
+        """Writes buffered records by one append under exclusive lock
+        and rotates the file if it is full."""
+        if not self.buffer:
+            return
+
+        data = b"".join(self.buffer)
+        self.buffer.clear()
+
+        fd = self.locked_file()
+
+        try:
+            view = memoryview(data)
+
+            while view:
+                view = view[os.write(fd, view):]
+
+            if os.fstat(fd).st_size >= self.max_bytes:
+                self.rotate()
+        finally:
+            unlock(fd)
+
+    def locked_file(self) -> int:
+        """Returns locked descriptor of the current log file. File renamed
+        by other process is reopened."""
+        while True:
+            if self._fd is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                self._fd = os.open(self.path, flags, 0o644)
+
+            lock(self._fd)
+
+            try:
+                is_current = os.stat(self.path).st_ino == os.fstat(self._fd).st_ino
+            except FileNotFoundError:
+                is_current = False
+
+            if is_current:
+                return self._fd
+
+            unlock(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def rotate(self):
+        "Renames the locked full log file with a timestamp."
+        now = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        name = f"{self.path.stem}.{now}.{os.getpid()}{self.path.suffix}"
+
+        os.rename(self.path, self.path.with_name(name))
+
+    def close(self):
+        "Writes buffered records and closes the file."
+        self.flush()
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def read_result_log(
+    path: pathlib.Path | str, rotated: bool = True
+) -> Iterator[dict]:
+    """Lazily reads records of the result log. Score and rank are
+    converted to arrays.
+
+    Args:
+        path (pathlib.Path | str): Path of the log file.
+        rotated (bool, optional): Reads also rotated files from the oldest.
+            Defaults to True.
+
+    Raises:
+        ValueError: When there is an error while parsing a record.
+
+    Yields records as dictionaries.
+    """
+    path = pathlib.Path(path)
+    paths = [path] if path.exists() else []
+
+    if rotated:
+        paths = rotated_paths(path) + paths
+
+    for log_path in paths:
+        with open(log_path, "r", encoding="utf-8") as log_file:
+            for line_number, line in enumerate(log_file, 1):
+                if not line.strip():
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    raise ValueError(
+                        f'There was an error while parsing line {line_number} '
+                        f'of the file "{log_path}".'
+                    )
+
+                for key in ("score", "rank"):
+                    if record.get(key) is not None:
+                        record[key] = np.array(record[key])
+
+                yield record
+
+
+def rotated_paths(path: pathlib.Path) -> list[pathlib.Path]:
+    """Returns rotated files of the log from the oldest. Only names
+    in the form stem.timestamp.pid.suffix created by rotation match,
+    other files like stem.backup.suffix are skipped."""
+    pattern = re.compile(
+        rf"{re.escape(path.stem)}\.\d{{8}}T\d{{12}}\.\d+{re.escape(path.suffix)}"
+    )
+
+    return sorted(
+        rotated_path
+        for rotated_path in path.parent.glob(f"{path.stem}.*{path.suffix}")
+        if pattern.fullmatch(rotated_path.name)
+    )
+
+
+def result_hash(result: Result) -> str:
+    "Returns hash of the normalized decision problem of the result."
+    return content_hash(
+        result["alternatives"].to_numpy(),
+        result["weights"].to_numpy(),
+        np.asarray(result["criteria_type"], dtype=bool),
+        result["n_method"],
+        result["d_method"],
+    )
+
+
+def result_vectors(result: Result) -> tuple[NDArray | None, NDArray | None]:
+    """Returns score vector and rank vector of the result in the order
+    of the alternatives, which are None if the result does not have them."""
+    decision = result["decision"]
+
+    if not isinstance(decision, DataFrame):
+        return None, None
+
+    index = result["alternatives"].index
+
+    score, rank = (
+        decision[column].reindex(index).to_numpy()
+        if column in decision.columns
+        else None
+        for column in ("score", "rank")
+    )
+
+    return score, rank
+
+
+def lock(fd: int):
+    "Acquires exclusive lock of the file."
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def unlock(fd: int):
+    "Releases lock of the file."
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -0,0 +1,311 @@
+"""Indexed store of decision results in SQLite database.
+
+Results are stored with their weights, score and rank vectors and ranks
+of each alternative, so results can be queried by method code names,
+hash of the decision problem, time and rank of an alternative without
+loading the whole results.
+"""
+import pathlib
+import sqlite3
+from datetime import datetime, timezone
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .log import result_hash, result_vectors
+from ..utils.types import Result
+
+SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    hash TEXT NOT NULL,
+    n_method TEXT,
+    d_method TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    path TEXT,
+    weights BLOB NOT NULL,
+    score BLOB,
+    rank BLOB
+);
+CREATE TABLE IF NOT EXISTS ranks (
+    result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+    alternative TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    score REAL
+);
+CREATE INDEX IF NOT EXISTS results_methods ON results(d_method, n_method, time);
+CREATE INDEX IF NOT EXISTS results_hash ON results(hash);
+CREATE INDEX IF NOT EXISTS results_time ON results(time);
+CREATE INDEX IF NOT EXISTS ranks_alternative ON ranks(alternative, rank);
+CREATE INDEX IF NOT EXISTS ranks_result ON ranks(result_id);
+"""
+
+QUERY_COLUMNS: Final = ("id", "time", "hash", "n_method", "d_method", "size", "path")
+
+SCORE_DTYPE: Final = "<f8"
+RANK_DTYPE: Final = "<i8"
+
+
+class ResultStore:
+    """Store of decision results in SQLite database, which can be used
+    as store of the decision method.
+
+    Attributes:
+        path (pathlib.Path): Path of the database file.
+        connection (sqlite3.Connection): Connection to the database.
+    """
+
+    def __init__(self, path: pathlib.Path | str, timeout: float = 30.0):
+        """
+        Args:
+            path (pathlib.Path | str): Path of the database file,
+                which is created if it does not exist.
+            timeout (float, optional): Seconds to wait for the database
+                locked by other process. Defaults to 30.0.
+        """
+        self.path = pathlib.Path(path)
+        self.connection = sqlite3.connect(self.path, timeout=timeout)
+
+        # Readers do not block the writer in write-ahead log mode
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def append(
+        self,
+        result: Result,
+        problem_hash: str = None,
+        reference: str = None,
+    ) -> int:
+        """Stores the result in one transaction.
+
+        Args:
+            result (Result): Decision result.
+            problem_hash (str, optional): Hash of the decision problem.
+                Defaults to None, which computes hash of the normalized
+                alternatives, weights, criteria types and methods.
+            reference (str, optional): Reference to the saved alternatives,
+                for example path to the result file. Defaults to None.
+
+        Returns id of the stored result.
+        """
+        if problem_hash is None:
+            problem_hash = result_hash(result)
+
+        score, rank = result_vectors(result)
+        labels = result["alternatives"].index.astype(str)
+        weights = np.asarray(result["weights"], dtype=SCORE_DTYPE)
+
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO results (time, hash, n_method, d_method, size, "
+                "path, weights, score, rank) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).timestamp(),
+                    problem_hash,
+                    result["n_method"],
+                    result["d_method"],
+                    len(labels),
+                    reference,
+                    weights.tobytes(),
+                    to_blob(score, SCORE_DTYPE),
+                    to_blob(rank, RANK_DTYPE),
+                ),
+            )
+            result_id = cursor.lastrowid
+
+            if rank is not None:
+                scores = [None] * len(labels) if score is None else score.tolist()
+
+                self.connection.executemany(
+                    "INSERT INTO ranks (result_id, alternative, rank, score) "
+                    "VALUES (?, ?, ?, ?)",
+                    zip([result_id] * len(labels), labels, rank.tolist(), scores),
+                )
+
+        return result_id
+
+    def query(
+        self,
+        d_method: str = None,
+        n_method: str = None,
+        problem_hash: str = None,
+        since: datetime | float = None,
+        until: datetime | float = None,
+        alternative: str = None,
+        rank: int = None,
+        limit: int = None,
+    ) -> dict[str, NDArray]:
+        """Finds stored results. Only given conditions are applied.
+
+        Example:
+        ```
+        # TOPSIS/VECTOR decisions where A7 ranked first last week
+        store.query(
+            "TOPSIS", "VECTOR", since=datetime.now() - timedelta(weeks=1),
+            alternative="A7", rank=1,
+        )
+        ```
+
+        Args:
+            d_method (str, optional): Scoring method code name.
+            n_method (str, optional): Normalization method code name.
+            problem_hash (str, optional): Hash of the decision problem.
+            since (datetime | float, optional): The earliest time
+                of the result as datetime or POSIX timestamp.
+            until (datetime | float, optional): The latest time
+                of the result as datetime or POSIX timestamp.
+            alternative (str, optional): Label of the alternative, results
+                must contain it. With rank argument the alternative
+                must have the rank.
+            rank (int, optional): Rank of the alternative.
+            limit (int, optional): Maximal number of the results.
+
+        Raises:
+            ValueError: If rank is given without alternative.
+
+        Returns dictionary of arrays "id", "time", "hash", "n_method",
+        "d_method", "size" and "path" of the results ordered by time.
+        """
+        if rank is not None and alternative is None:
+            raise ValueError("Rank condition requires alternative.")
+
+        conditions = []
+        parameters = []
+
+        for column, value in (
+            ("d_method", d_method),
+            ("n_method", n_method),
+            ("hash", problem_hash),
+        ):
+            if value is not None:
+                conditions.append(f"results.{column} = ?")
+                parameters.append(value)
+
+        if since is not None:
+            conditions.append("results.time >= ?")
+            parameters.append(timestamp(since))
+
+        if until is not None:
+            conditions.append("results.time <= ?")
+            parameters.append(timestamp(until))
+
+        columns = ", ".join(f"results.{column}" for column in QUERY_COLUMNS)
+        sql = f"SELECT {columns} FROM results"
+
+        if alternative is not None:
+            sql += " JOIN ranks ON ranks.result_id = results.id"
+            conditions.append("ranks.alternative = ?")
+            parameters.append(alternative)
+
+            if rank is not None:
+                conditions.append("ranks.rank = ?")
+                parameters.append(int(rank))
+
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        sql += " ORDER BY results.time, results.id"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(int(limit))
+
+        rows = self.connection.execute(sql, parameters).fetchall()
+        values = list(zip(*rows)) if rows else [()] * len(QUERY_COLUMNS)
+
+        return {
+            "id": np.array(values[0], dtype=np.int64),
+            "time": np.array(values[1], dtype=np.float64),
+            "hash": np.array(values[2], dtype=str),
+            "n_method": np.array(values[3], dtype=object),
+            "d_method": np.array(values[4], dtype=str),
+            "size": np.array(values[5], dtype=np.int64),
+            "path": np.array(values[6], dtype=object),
+        }
+
+    def vectors(self, result_id: int) -> tuple[NDArray | None, NDArray | None]:
+        """Returns score vector and rank vector of the stored result
+        in the order of the alternatives.
+
+        Raises:
+            KeyError: If result does not exist.
+        """
+        row = self.connection.execute(
+            "SELECT score, rank FROM results WHERE id = ?", (int(result_id),)
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(f"Result {result_id} does not exist.")
+
+        return from_blob(row[0], SCORE_DTYPE), from_blob(row[1], RANK_DTYPE)
+
+    def weights(self, result_id: int) -> NDArray:
+        """Returns weight vector of the stored result.
+
+        Raises:
+            KeyError: If result does not exist.
+        """
+        row = self.connection.execute(
+            "SELECT weights FROM results WHERE id = ?", (int(result_id),)
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(f"Result {result_id} does not exist.")
+
+        return from_blob(row[0], SCORE_DTYPE)
+
+    def ranks(self, alternative: str, result_ids: NDArray = None) -> NDArray:
+        """Returns ranks of the alternative in the stored results.
+
+        Args:
+            alternative (str): Label of the alternative.
+            result_ids (NDArray, optional): Ids of the results.
+                Defaults to None, which uses all results.
+
+        Returns matrix with columns result id and rank.
+        """
+        sql = "SELECT result_id, rank FROM ranks WHERE alternative = ?"
+        parameters = [alternative]
+
+        if result_ids is not None:
+            result_ids = np.asarray(result_ids, dtype=np.int64).tolist()
+            sql += f" AND result_id IN ({', '.join('?' * len(result_ids))})"
+            parameters += result_ids
+
+        rows = self.connection.execute(sql + " ORDER BY result_id", parameters)
+
+        return np.array(rows.fetchall(), dtype=np.int64).reshape(-1, 2)
+
+    def close(self):
+        "Closes the connection."
+        self.connection.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def timestamp(time: datetime | float) -> float:
+    "Returns POSIX timestamp of datetime, naive datetime is local time."
+    return time.timestamp() if isinstance(time, datetime) else float(time)
+
+
+def to_blob(vector: NDArray | None, dtype: str) -> bytes | None:
+    "Returns bytes of the vector in the dtype."
+    if vector is None:
+        return None
+
+    return np.ascontiguousarray(vector, dtype=dtype).tobytes()
+
+
+def from_blob(blob: bytes | None, dtype: str) -> NDArray | None:
+    "Returns vector from bytes in the dtype."
+    if blob is None:
+        return None
+
+    return np.frombuffer(blob, dtype=dtype)
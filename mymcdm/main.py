@@ -1,16 +1,30 @@
 "The main module containing an auxiliary method for decision making."
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 from numpy.typing import NDArray
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
 from . import methods
 from . import normalization
-from .inout import save_result
-from .utils.validation import valid_normalized_matrix
-from .utils.misc import make_ranking
-from .utils.framing import frame_alternatives, frame_criterions
-from .utils.types import Result
+from .inout import save_result, ResultLog, ResultStore
+from .methods.electre import MEMORY_LIMIT
+from .methods.vikor import vikor_ranks
+from .utils.validation import (
+    valid_normalized_matrix,
+    valid_alternative_matrix,
+    valid_weight_vector,
+    valid_scoring_args_extended,
+    record_checks,
+    alternatives_check,
+)
+from .utils.misc import make_ranking, dense_ranking, content_hash
+from .utils.framing import frame_alternatives, frame_criterions, frame_decision
+from .utils.types import Result, DominanceRelation
+from .utils.config import get_dtype
+from .utils.statistics import ColumnStatistics
+from .utils.cache import DecisionCache
 
 
 def decision(
@@ -21,6 +35,10 @@ def decision(
     d_method: str = "WSM",
     save: bool = False,
     folder: Path | str = None,
+    store: ResultLog | ResultStore = None,
+    cache: DecisionCache = None,
+    memory_limit: int = MEMORY_LIMIT,
+    dominance_output: str = "edges",
 ) -> Result:
     """Method for making decision.
     That includes normalization, scoring and saving result.
@@ -39,20 +57,130 @@ def decision(
         save (bool, optional): Saves scoring result to the file. Defaults to False.
         folder (pathlib.Path | str, optional): Path to the output folder.
             If None then file will be saved in current folder.
+        store (ResultLog | ResultStore, optional): Log or database, where
+            the result is appended with hash of the normalized decision
+            problem (see result_hash) and path to the saved file. Defaults to None.
+        cache (DecisionCache, optional): Cache of the results, normalized
+            matrices and ELECTRE matrices. Defaults to None.
+        memory_limit (int, optional): Approximate number of bytes that may
+            be used by one block of ELECTRE_BLOCKED and ELECTRE_RANKING
+            methods. Defaults to 256 MiB.
+        dominance_output (str, optional): Form of the dominance relation
+            of ELECTRE_BLOCKED method, "edges" or "bitset".
+            Defaults to "edges".
 
     Code names for normalization and scoring could be found in README.md file.
     """
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+    # Cache key is hash of the input decision problem and working dtype
+    if cache is not None:
+        key = content_hash(
+            a_matrix,
+            w_vector,
+            criteria_type,
+            n_method,
+            d_method,
+            get_dtype(),
+            memory_limit,
+            dominance_output,
+        )
+
+    if cache is None:
+        result = decide(
+            a_matrix,
+            w_vector,
+            criteria_type,
+            n_method,
+            d_method,
+            memory_limit=memory_limit,
+            dominance_output=dominance_output,
+        )
+    else:
+        result = cache.cached(
+            "decision",
+            key,
+            lambda: decide(
+                a_matrix,
+                w_vector,
+                criteria_type,
+                n_method,
+                d_method,
+                cache,
+                memory_limit,
+                dominance_output,
+            ),
+        )
+
+        # Cached result is shared, caller gets copies of its frames
+        result = copy_result(result)
+
+    path = None
+
+    if save:
+        desc = f"{d_method}_{n_method}"
+        path = save_result(result, folder, desc)
+        result["path"] = path
+
+    if store is not None:
+        # Store computes the same hash as for results appended directly
+        store.append(result, reference=None if path is None else str(path))
+
+    return result
+
+
+def copy_result(value: Result | Any) -> Result | Any:
+    """Returns copy of the cached result with copied dataframes,
+    series and arrays, also in the dominance relation."""
+    if isinstance(value, dict):
+        return {key: copy_result(item) for key, item in value.items()}
+
+    if isinstance(value, (DataFrame, Series, np.ndarray)):
+        return value.copy()
+
+    return value
+
+
+def decide(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    n_method: str | None,
+    d_method: str,
+    cache: DecisionCache = None,
+    memory_limit: int = MEMORY_LIMIT,
+    dominance_output: str = "edges",
+) -> Result:
+    """An auxiliary method for normalizing, framing and scoring
+    alternatives of decision method.
+
+    Returns Result type dictionary without path.
+    """
     # Matrix normalization
-    normalized_matrix, criteria_type = normalize(n_method, a_matrix, criteria_type)
+    normalized_matrix, criteria_type = normalize(
+        n_method, a_matrix, criteria_type, cache=cache
+    )
 
     # Framing alternatives
     a_dataframe = frame_alternatives(normalized_matrix, a_types=criteria_type)
+
+    # Normalization validated the alternatives and kept their shape,
+    # normalized input is checked by the scoring method
+    if n_method is not None:
+        record_checks(a_dataframe, alternatives_check(), owned=True)
+
     w_series = frame_criterions(w_vector, c_types=criteria_type)
 
     # Score alternatives
-    decision_result = method_decision(d_method, a_dataframe, w_vector, criteria_type)
-
-    path = None
+    decision_result = method_decision(
+        d_method,
+        a_dataframe,
+        w_vector,
+        criteria_type,
+        cache,
+        memory_limit,
+        dominance_output,
+    )
 
     result: Result = {
         "decision": decision_result,
@@ -61,18 +189,158 @@ def decision(
         "criteria_type": criteria_type,
         "n_method": n_method,
         "d_method": d_method,
-        "path": path,
+        "path": None,
     }
 
-    if save:
-        desc = f"{d_method}_{n_method}"
-        path = save_result(result, folder, desc)
-        result["path"] = path
-
     return result
 
 
-def normalize(code: str | None, a_matrix: NDArray, criteria_type: NDArray):
+def decision_array(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray = None,
+    n_method: str | None = None,
+    d_method: str = "WSM",
+    frame: bool = False,
+) -> tuple[NDArray, NDArray] | DataFrame:
+    """Method for making decision without dataframes.
+    That includes normalization, scoring and ranking.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        n_method (NDArray | None): Normalization method code name that
+            represents normalization method which is used to normalize alternatives.
+        d_method (str | None): Scoring method code name that represents
+            decision method which is used get decision result.
+            Defaults to "WSM".
+        frame (bool, optional): Returns decision dataframe with score
+            and rank columns ordered from the best alternative.
+            Defaults to False.
+
+    Raises:
+        ValueError: If alternative matrix has not 2 dimensions.
+        ValueError: If shapes of the alternative matrix, weight vector
+            and criteria type vector are not correct.
+
+    For supported methods see method_scores method. VIKOR alternatives
+    are ranked by repeated VIKOR method as in decision method.
+
+    Returns score vector and rank vector.
+    """
+    a_matrix = np.asarray(a_matrix)
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+    if a_matrix.ndim != 2 or w_vector.ndim != 1:
+        raise ValueError(
+            "Alternative matrix must have 2 dimensions and weight vector 1 dimension."
+        )
+
+    valid_scoring_args_extended(a_matrix, w_vector, criteria_type)
+
+    normalized_matrix, criteria_type = normalize(n_method, a_matrix, criteria_type)
+
+    score = method_scores(d_method, normalized_matrix, w_vector, criteria_type)
+
+    if d_method.upper() == "VIKOR":
+        rank = vikor_ranks(normalized_matrix, w_vector, criteria_type)
+    else:
+        rank = dense_ranking(score)
+
+    if frame:
+        return frame_decision(score, rank)
+
+    return score, rank
+
+
+def decision_batch(
+    a_stack: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray = None,
+    n_method: str | None = None,
+    d_method: str = "WSM",
+) -> tuple[NDArray, NDArray]:
+    """Method for making decision of many problems with the same shape.
+    That includes normalization and scoring of the whole stack at once.
+
+    Args:
+        a_stack (NDArray): Stack of alternative matrices with shape
+            (problems, alternatives, criteria).
+        w_vector (NDArray): Weight vector used for all problems or weight
+            matrix with shape (problems, criteria).
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        n_method (NDArray | None): Normalization method code name that
+            represents normalization method which is used to normalize alternatives.
+        d_method (str | None): Scoring method code name that represents
+            decision method which is used get decision result.
+            Defaults to "WSM".
+
+    Raises:
+        ValueError: If shapes of the stack, weights and criteria type
+            vector are not correct.
+        ValueError: If sum of the weights is not 1.
+
+    Input is validated once for the whole stack and no dataframes
+    are created. For supported methods see method_scores method.
+    VIKOR alternatives of each problem are ranked by repeated VIKOR
+    method as in decision method, so the ranks are not ordered by
+    the Q values and the ranking is not vectorized over the stack.
+    WPM score is NaN if some normalized value is NaN or negative
+    (for example LOG normalization of a column with values below
+    and above 1), while wpm method of the decision method skips NaN
+    values of the product.
+
+    Returns score matrix and rank matrix with shape (problems, alternatives).
+    """
+    a_stack = np.asarray(a_stack)
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+    if a_stack.ndim != 3:
+        raise ValueError(
+            f"Stack of alternative matrices must have 3 dimensions, got {a_stack.ndim}."
+        )
+
+    if w_vector.ndim == 2 and w_vector.shape[0] != a_stack.shape[0]:
+        raise ValueError(
+            "Weight matrix must have one row for each alternative matrix."
+        )
+
+    valid_alternative_matrix(a_stack)
+    valid_weight_vector(w_vector, a_stack.shape[-1])
+
+    if criteria_type is not None and len(criteria_type) != a_stack.shape[-1]:
+        raise ValueError(
+            "Criteria type and weight vector must have same size."
+        )
+
+    normalized_stack, criteria_type = normalize(n_method, a_stack, criteria_type)
+
+    score = method_scores(d_method, normalized_stack, w_vector, criteria_type)
+
+    if d_method.upper() == "VIKOR":
+        w_matrix = np.broadcast_to(w_vector, score.shape[:1] + w_vector.shape[-1:])
+        rank = np.empty(score.shape, dtype=int)
+
+        for i, (a_matrix, weights) in enumerate(zip(normalized_stack, w_matrix)):
+            rank[i] = vikor_ranks(a_matrix, weights, criteria_type)
+    else:
+        rank = dense_ranking(score)
+
+    return score, rank
+
+
+def normalize(
+    code: str | None,
+    a_matrix: NDArray,
+    criteria_type: NDArray,
+    statistics: ColumnStatistics = None,
+    cache: DecisionCache = None,
+):
     """An auxiliary method for selecting the method and
     then normalizing alternative matrix.
 
@@ -82,6 +350,10 @@ def normalize(code: str | None, a_matrix: NDArray, criteria_type: NDArray):
         criteria_type (NDArray): Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Defaults to None.
+        cache (DecisionCache, optional): Cache of the normalized matrices.
+            Defaults to None.
 
     | Code name  | Method name  |
     |-------------|--------------|
@@ -95,23 +367,46 @@ def normalize(code: str | None, a_matrix: NDArray, criteria_type: NDArray):
     Raises:
         ValueError: If method name does not exist.
 
+    Alternative matrix can be also stack of alternative matrices.
+
     Returns normalized alternative matrix.
     """
+    if cache is not None:
+        key = content_hash(a_matrix, criteria_type, code, get_dtype())
+        return cache.cached(
+            "normalized",
+            key,
+            lambda: normalize(code, a_matrix, criteria_type, statistics),
+        )
+
     match code:
         case None:
+            a_matrix = np.asarray(a_matrix, dtype=get_dtype())
             return valid_normalized_matrix(a_matrix), criteria_type
         case "MAXMIN":
-            return normalization.max_min(a_matrix, criteria_type)
+            return normalization.max_min(
+                a_matrix, criteria_type, statistics=statistics
+            )
         case "MAX":
-            return normalization.max(a_matrix, criteria_type)
+            return normalization.max(
+                a_matrix, criteria_type, statistics=statistics
+            )
         case "LINEAR":
-            return normalization.linear(a_matrix, criteria_type)
+            return normalization.linear(
+                a_matrix, criteria_type, statistics=statistics
+            )
         case "VECTOR":
-            return normalization.vector(a_matrix, criteria_type)
+            return normalization.vector(
+                a_matrix, criteria_type, statistics=statistics
+            )
         case "LOG":
-            return normalization.logarithmic(a_matrix, criteria_type)
+            return normalization.logarithmic(
+                a_matrix, criteria_type, statistics=statistics
+            )
         case "SUM":
-            return normalization.sum(a_matrix, criteria_type)
+            return normalization.sum(
+                a_matrix, criteria_type, statistics=statistics
+            )
         case _:
             raise ValueError(
                 f'Error: Entered normalization method "{code}" doesn`t exist!'
@@ -123,7 +418,10 @@ def method_decision(
     a_dataframe: DataFrame,
     w_vector: NDArray,
     criteria_type: NDArray,
-) -> DataFrame:
+    cache: DecisionCache = None,
+    memory_limit: int = MEMORY_LIMIT,
+    dominance_output: str = "edges",
+) -> DataFrame | DominanceRelation:
     """An auxiliary method for selecting the method and
     then deciding the result.
 
@@ -134,6 +432,14 @@ def method_decision(
         criteria_type (NDArray): Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        cache (DecisionCache, optional): Cache of the ELECTRE matrices.
+            Defaults to None.
+        memory_limit (int, optional): Approximate number of bytes that may
+            be used by one block of ELECTRE_BLOCKED and ELECTRE_RANKING
+            methods. Defaults to 256 MiB.
+        dominance_output (str, optional): Form of the dominance relation
+            of ELECTRE_BLOCKED method, "edges" or "bitset".
+            Defaults to "edges".
 
     Raises:
         ValueError: If method name does not exist.
@@ -142,18 +448,29 @@ def method_decision(
     |-------------|--------------|
     | WSM | Weighted Sum Model |
     | WPM | Weighted Product Model |
+    | WPM_LOG | Weighted Product Model in logarithmic domain |
     | TOPSIS | Technique for Order of Preference by Similarity to Ideal Solution |
     | VIKOR | VIKOR |
     | ELECTRE | Elimination and Choice Translating Reality |
+    | ELECTRE_BLOCKED | ELECTRE with bounded memory |
+    | ELECTRE_RANKING | ELECTRE ranked by the outranking graph |
     | AHP | Analytic hierarchy process |
+    | PROMETHEE | PROMETHEE II |
 
     Returns decision result as dataframe.
     VIKOR is used repeatedly to obtain a ranking of variants.
     When you enter the ELECTRE method, you get the dominance matrix.
+    When you enter the ELECTRE_BLOCKED method, you get the dominance
+    relation as edge list, which is not converted to the dataframe.
+    ELECTRE_RANKING ranks alternatives by levels of the outranking graph.
+    WPM_LOG scores are logarithms of the WPM scores.
+    PROMETHEE scores are net flows with usual preference function.
     """
     match code.upper():
         case "WPM":
             result = methods.wpm(a_dataframe, w_vector)
+        case "WPM_LOG":
+            result = methods.wpm_log(a_dataframe, w_vector)
         case "WSM":
             result = methods.wsm(a_dataframe, w_vector)
         case "TOPSIS":
@@ -163,7 +480,23 @@ def method_decision(
         case "VIKOR":
             result = methods.vikor_ranking(a_dataframe, w_vector, criteria_type)
         case "ELECTRE":
-            result = methods.electre(a_dataframe, w_vector, criteria_type)
+            result = methods.electre(
+                a_dataframe, w_vector, criteria_type, cache=cache
+            )
+        case "PROMETHEE":
+            result = methods.promethee(a_dataframe, w_vector, criteria_type)
+        case "ELECTRE_BLOCKED":
+            return methods.electre_blocked(
+                a_dataframe,
+                w_vector,
+                criteria_type,
+                memory_limit=memory_limit,
+                output=dominance_output,
+            )
+        case "ELECTRE_RANKING":
+            result = methods.electre_ranking(
+                a_dataframe, w_vector, criteria_type, memory_limit=memory_limit
+            )
         case _:
             raise ValueError(f'Error: Entered decision method "{code}" doesn`t exist!')
 
@@ -183,3 +516,63 @@ def method_decision(
         return decision_dataframe
     elif result.name == "rank":
         return DataFrame(result, dtype=int)
+
+
+def method_scores(
+    code: str,
+    a_stack: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+) -> NDArray:
+    """An auxiliary method for selecting the method and
+    then scoring alternative matrix or stack of alternative matrices.
+
+    Args:
+        code (str): Method code name.
+        a_stack (NDArray): Alternative matrix or stack of alternative matrices.
+        w_vector (NDArray): Weight vector or weight matrix.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+
+    Raises:
+        ValueError: If method name does not exist.
+
+    | Code name | Method name  |
+    |-------------|--------------|
+    | WSM | Weighted Sum Model |
+    | WPM | Weighted Product Model |
+    | WPM_LOG | Weighted Product Model in logarithmic domain |
+    | TOPSIS | Technique for Order of Preference by Similarity to Ideal Solution |
+    | VIKOR | VIKOR |
+    | ELECTRE | Elimination and Choice Translating Reality |
+    | AHP | Analytic hierarchy process |
+    | PROMETHEE | PROMETHEE II |
+
+    Returns score matrix.
+    VIKOR scores are Q values, the best alternative has the smallest value.
+    ELECTRE scores are net dominances of the dominance matrix.
+    WPM_LOG scores are logarithms of the WPM scores.
+    PROMETHEE scores are net flows with usual preference function.
+    """
+    match code.upper():
+        case "WPM":
+            return methods.wpm_scores(a_stack, w_vector)
+        case "WPM_LOG":
+            return methods.wpm_log_scores(a_stack, w_vector)
+        case "WSM":
+            return methods.wsm_scores(a_stack, w_vector)
+        case "TOPSIS":
+            return methods.topsis_scores(a_stack, w_vector, criteria_type)
+        case "AHP":
+            return methods.ahp_scores(a_stack, w_vector)
+        case "VIKOR":
+            return methods.vikor_scores(a_stack, w_vector, criteria_type)
+        case "ELECTRE":
+            return methods.electre_scores(a_stack, w_vector, criteria_type)
+        case "PROMETHEE":
+            return methods.promethee_scores(a_stack, w_vector, criteria_type)
+        case _:
+            raise ValueError(
+                f'Error: Entered decision method "{code}" doesn`t support arrays!'
+            )
@@ -1,9 +1,33 @@
 "Submodule for MCDM scoring methods."
-from .vikor import vikor, vikor_ranking
-from .ahp import ahp, ahp_cm
-from .electre import electre
-from .topsis import topsis
-from .wpm import wpm
-from .wsm import wsm
+from .vikor import vikor, vikor_ranking, vikor_scores, vikor_sweep
+from .ahp import ahp, ahp_cm, ahp_scores
+from .electre import electre, electre_blocked, electre_scores
+from .outranking import electre_ranking
+from .promethee import promethee, promethee_scores
+from .topsis import topsis, topsis_scores
+from .wpm import wpm, wpm_log, wpm_scores, wpm_log_scores
+from .wsm import wsm, wsm_scores
 
-__all__ = ["vikor", "vikor_ranking", "ahp", "ahp_cm", "electre", "topsis", "wpm", "wsm"]
+__all__ = [
+    "vikor",
+    "vikor_ranking",
+    "vikor_scores",
+    "vikor_sweep",
+    "ahp",
+    "ahp_cm",
+    "ahp_scores",
+    "electre",
+    "electre_blocked",
+    "electre_ranking",
+    "electre_scores",
+    "promethee",
+    "promethee_scores",
+    "topsis",
+    "topsis_scores",
+    "wpm",
+    "wpm_log",
+    "wpm_scores",
+    "wpm_log_scores",
+    "wsm",
+    "wsm_scores",
+]
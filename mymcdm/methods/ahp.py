@@ -6,13 +6,14 @@ import numpy as np
 from numpy.typing import NDArray
 from pandas import DataFrame, Series
 
-from ..methods.wsm import wsm
+from ..methods.wsm import wsm, wsm_scores
 from ..weighting.pairwise import (
     pairwise_comparisons,
     pairwise_alternatives,
     is_consistent,
 )
-from ..utils.validation import valid_scoring_args
+from ..utils.cache import DecisionCache
+from ..utils.validation import valid_scoring_args, is_checked, record_checks
 from ..utils.framing import frame_alternatives
 
 
@@ -31,19 +32,37 @@ def ahp(a_dataframe: DataFrame, w_vector: NDArray) -> Series:
     (in the maximalization case) have the biggest
     value in the vector.
     """
-    if not alternatives_validation(a_dataframe):
-        raise ValueError(
-            "Alternative matrix row sum must be approximately equal to 1"
-        )
-
+    valid_ahp_alternatives(a_dataframe)
     valid_scoring_args(a_dataframe, w_vector)
 
     return wsm(a_dataframe, w_vector)
 
 
+def ahp_scores(a_matrix: NDArray, w_vector: NDArray) -> NDArray:
+    """The final step of Analytic hierarchy process (AHP)
+    for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+
+    Raises:
+        ValueError: If alternative matrix row sum isn't approximately
+            equal to 1.
+
+    Returns AHP score of each alternative.
+    """
+    valid_ahp_alternatives(a_matrix)
+
+    return wsm_scores(a_matrix, w_vector)
+
+
 def ahp_cm(
     alternatives_cm: list[NDArray] | NDArray,
-    criteria_cm: NDArray
+    criteria_cm: NDArray,
+    cache: DecisionCache = None,
 ) -> tuple[Series, bool]:
     """Compute AHP-score from given alternatives comparsion matrices and
       criteria comparsion matrix.
@@ -51,6 +70,8 @@ def ahp_cm(
     Args:
         alternatives_cm (list[NDArray] | NDArray): List of comparsion matrices.
         criteria_cm (NDArray): Comparsion matrix.
+        cache (DecisionCache, optional): Cache of the priority vectors.
+            Defaults to None.
 
     Raises:
         ValueError: If number of columns of alternatives isn't
@@ -70,15 +91,13 @@ def ahp_cm(
         isn't equal to number of criteria {criteria_count}."""
         )
 
-    a_matrix, a_cr = pairwise_alternatives(alternatives_cm)
-    w_vector, c_cr = pairwise_comparisons(criteria_cm)
+    a_matrix, a_cr = pairwise_alternatives(alternatives_cm, cache)
+    w_vector, c_cr = pairwise_comparisons(criteria_cm, cache)
 
-    if not alternatives_validation(a_matrix):
-        raise ValueError(
-            "Alternative matrix row sum must be approximately equal to 1"
-        )
+    valid_ahp_alternatives(a_matrix)
 
     a_dataframe = frame_alternatives(a_matrix)
+    record_checks(a_dataframe, "column_sums", owned=True)
 
     cr = np.append(a_cr, c_cr)
     consistent = [is_consistent(val) for val in cr]
@@ -86,8 +105,27 @@ def ahp_cm(
     return ahp(a_dataframe, w_vector), all(consistent)
 
 
+def valid_ahp_alternatives(a_matrix: DataFrame | NDArray):
+    """Checks AHP alternative matrix, the check is recorded
+    in the "once" validation level.
+
+    Raises:
+        ValueError: If alternative matrix row sum isn't approximately
+            equal to 1.
+    """
+    if is_checked(a_matrix, "column_sums"):
+        return
+
+    if not alternatives_validation(a_matrix):
+        raise ValueError(
+            "Alternative matrix row sum must be approximately equal to 1"
+        )
+
+    record_checks(a_matrix, "column_sums")
+
+
 def alternatives_validation(a_matrix: NDArray) -> bool:
     "Returns True if row sum is approximately equal to 1."
 
-    sum = np.sum(a_matrix, axis=0)
+    sum = np.sum(np.asarray(a_matrix), axis=-2)
     return np.allclose(sum, 1)
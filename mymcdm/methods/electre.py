@@ -2,12 +2,28 @@
 
 References: [4] [5] [6]
 """
+from math import fsum
+from typing import Final
+
 import numpy as np
 from numpy.typing import NDArray
 from pandas import DataFrame, Series
 
+from ..utils.cache import DecisionCache
+from ..utils.config import get_dtype
+from ..utils.misc import content_hash
+from ..utils.types import DominanceRelation
 from ..utils.validation import valid_scoring_args_extended
 
+MEMORY_LIMIT: Final = 2**28
+"Default memory limit of one block in bytes."
+
+BYTES_PER_PAIR: Final = 64
+"Estimated number of bytes of temporary arrays per one pair of alternatives."
+
+DOMINANCE_OUTPUTS: Final = ("edges", "bitset")
+"Forms of the dominance relation returned by electre_blocked method."
+
 
 def electre(
     a_dataframe: DataFrame,
@@ -15,6 +31,7 @@ def electre(
     criteria_type: NDArray,
     c_threshold: int = None,
     d_threshold: int = None,
+    cache: DecisionCache = None,
 ) -> Series:
     """The ELECTRE method.
 
@@ -28,6 +45,8 @@ def electre(
             Defaults to None.
         d_threshold (int, optional): Discordance threshold.
             Defaults to None.
+        cache (DecisionCache, optional): Cache of the concordance
+            and discordance matrices. Defaults to None.
 
     If c_threshold or d_threshold is set to None
     then concordance or discordance threshold is calculated
@@ -44,9 +63,20 @@ def electre(
 
     # Determine the concordance and discordance matrices
     column_size = a_dataframe.shape[0]
-    c_matrix, d_matrix = concordance_discordance_matrices(
-        wn_matrix, criteria_type, w_vector
-    )
+
+    if cache is None:
+        c_matrix, d_matrix = concordance_discordance_matrices(
+            wn_matrix, criteria_type, w_vector
+        )
+    else:
+        key = content_hash(a_dataframe.to_numpy(), w_vector, criteria_type)
+        c_matrix, d_matrix = cache.cached(
+            "electre",
+            key,
+            lambda: concordance_discordance_matrices(
+                wn_matrix, criteria_type, w_vector
+            ),
+        )
 
     # Determine the concordance and discordance dominance matrices
     fraction = 1 / (column_size * (column_size - 1))
@@ -57,93 +87,408 @@ def electre(
     if d_threshold is None:
         d_threshold = fraction * np.sum(d_matrix)
 
-    f_condlist = [c_matrix >= c_threshold, c_matrix < c_threshold]
-    f_dominance = np.piecewise(c_matrix, f_condlist, [1, 0])
-
-    g_condlist = [d_matrix >= d_threshold, d_matrix < d_threshold]
-    g_dominance = np.piecewise(d_matrix, g_condlist, [1, 0])
+    f_dominance = c_matrix >= c_threshold
+    g_dominance = d_matrix >= d_threshold
 
     # Determine the total dominance matrix
-    dominance_matrix = f_dominance * g_dominance
+    dominance_matrix = f_dominance & g_dominance
 
     return dominance_matrix.astype(int)
 
 
+def electre_scores(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+) -> NDArray:
+    """The ELECTRE method for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+
+    Thresholds are arithmetic means of concordance and discordance
+    matrix of each problem as in electre method.
+
+    Returns net dominance (number of dominated alternatives minus number
+    of dominating alternatives) of each alternative. The best alternative
+    have the biggest value.
+    """
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+    wn_matrix = a_matrix * w_vector[..., np.newaxis, :]
+
+    c_matrix, d_matrix = concordance_discordance_indices(
+        wn_matrix[..., :, np.newaxis, :],
+        wn_matrix[..., np.newaxis, :, :],
+        criteria_type,
+        w_vector[..., np.newaxis, np.newaxis, :],
+    )
+
+    # Alternative is not compared with itself
+    column_size = a_matrix.shape[-2]
+    diagonal = np.arange(column_size)
+
+    c_matrix[..., diagonal, diagonal] = 0.0
+    d_matrix[..., diagonal, diagonal] = 0.0
+
+    fraction = 1 / (column_size * (column_size - 1))
+
+    c_threshold = fraction * np.sum(c_matrix, axis=(-2, -1), keepdims=True)
+    d_threshold = fraction * np.sum(d_matrix, axis=(-2, -1), keepdims=True)
+
+    dominance = (c_matrix >= c_threshold) & (d_matrix >= d_threshold)
+
+    return np.sum(dominance, axis=-1) - np.sum(dominance, axis=-2)
+
+
+def electre_blocked(
+    a_dataframe: DataFrame,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    c_threshold: float = None,
+    d_threshold: float = None,
+    memory_limit: int = MEMORY_LIMIT,
+    output: str = "edges",
+    sample_size: int = None,
+    seed: int = None,
+) -> DominanceRelation:
+    """The ELECTRE method computed in blocks of rows with bounded memory.
+
+    Args:
+        a_dataframe (pd.DataFrame): Alternative matrix.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        c_threshold (float, optional): Concordance threshold.
+            Defaults to None.
+        d_threshold (float, optional): Discordance threshold.
+            Defaults to None.
+        memory_limit (int, optional): Approximate number of bytes
+            that may be used by one block. Defaults to 256 MiB.
+        output (str, optional): Form of the dominance relation,
+            "edges" for list of (row, col) pairs or "bitset"
+            for row-packed bits. Defaults to "edges".
+        sample_size (int, optional): Number of randomly chosen pairs
+            of alternatives used to estimate missing thresholds.
+            Defaults to None, which computes the exact mean.
+        seed (int, optional): Seed of the pair sampling. Defaults to None.
+
+    Raises:
+        ValueError: If output form is unknown.
+        ValueError: If memory limit is not positive.
+
+    If c_threshold or d_threshold is set to None the threshold is calculated
+    as arithmetic mean of concordance or discordance matrix. The matrices
+    are never stored whole, so when both thresholds are known (given or
+    estimated from the sample) the alternatives are processed in one pass,
+    otherwise in two. The exact mean is summed block by block and can differ
+    from electre() in the last digits.
+
+    Returns dominance relation. Alternative k dominates alternative l
+    when there is an edge (k, l) or the bit l is set in row k.
+    """
+    valid_scoring_args_extended(a_dataframe, w_vector, criteria_type)
+
+    if output not in DOMINANCE_OUTPUTS:
+        raise ValueError(
+            f"Unknown dominance output \"{output}\". "
+            f"Expected one of {DOMINANCE_OUTPUTS}."
+        )
+
+    if memory_limit <= 0:
+        raise ValueError("Memory limit must be positive.")
+
+    # Construct the weighted normalized matrix
+    wn_matrix = np.asarray(a_dataframe, dtype=get_dtype()) * w_vector
+
+    column_size = wn_matrix.shape[0]
+    block_size = max(1, memory_limit // (BYTES_PER_PAIR * column_size))
+    blocks = [
+        (start, min(start + block_size, column_size))
+        for start in range(0, column_size, block_size)
+    ]
+
+    # Determine the thresholds
+    thresholds_missing = c_threshold is None or d_threshold is None
+
+    if thresholds_missing and sample_size is not None:
+        c_mean, d_mean = estimate_thresholds(
+            wn_matrix, criteria_type, w_vector, sample_size, seed
+        )
+    elif thresholds_missing:
+        c_sums = []
+        d_sums = []
+
+        for start, stop in blocks:
+            c_block, d_block = concordance_discordance_block(
+                wn_matrix, criteria_type, w_vector, start, stop
+            )
+            c_sums.append(np.sum(c_block))
+            d_sums.append(np.sum(d_block))
+
+        fraction = 1 / (column_size * (column_size - 1))
+        c_mean = fraction * fsum(c_sums)
+        d_mean = fraction * fsum(d_sums)
+
+    if c_threshold is None:
+        c_threshold = c_mean
+
+    if d_threshold is None:
+        d_threshold = d_mean
+
+    # Determine the dominance relation
+    rows = []
+    cols = []
+    bits = None
+
+    if output == "bitset":
+        bits = np.zeros((column_size, (column_size + 7) // 8), dtype=np.uint8)
+
+    for start, stop in blocks:
+        c_block, d_block = concordance_discordance_block(
+            wn_matrix, criteria_type, w_vector, start, stop
+        )
+        dominance_block = (c_block >= c_threshold) & (d_block >= d_threshold)
+
+        if bits is not None:
+            bits[start:stop] = np.packbits(dominance_block, axis=1)
+        else:
+            block_rows, block_cols = np.nonzero(dominance_block)
+            rows.append(block_rows + start)
+            cols.append(block_cols)
+
+    relation: DominanceRelation = {
+        "size": column_size,
+        "rows": None,
+        "cols": None,
+        "bits": bits,
+    }
+
+    if bits is None:
+        relation["rows"] = np.concatenate(rows).astype(np.int64)
+        relation["cols"] = np.concatenate(cols).astype(np.int64)
+
+    return relation
+
+
+def estimate_thresholds(
+    wn_matrix: NDArray,
+    criteria_type: NDArray,
+    w_vector: NDArray,
+    sample_size: int,
+    seed: int = None,
+) -> tuple[float, float]:
+    """Estimates concordance and discordance thresholds as mean
+    of the indices over randomly chosen pairs of alternatives.
+
+    Args:
+        wn_matrix (NDArray): Weighted normalized matrix.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+        w_vector (NDArray): Weight vector.
+        sample_size (int): Number of sampled pairs.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Raises:
+        ValueError: If sample size is not positive.
+
+    Returns concordance and discordance threshold.
+    """
+    if sample_size <= 0:
+        raise ValueError("Sample size must be positive.")
+
+    column_size = wn_matrix.shape[0]
+    generator = np.random.default_rng(seed)
+
+    # Pairs of distinct alternatives
+    k_index = generator.integers(0, column_size, sample_size)
+    l_index = generator.integers(0, column_size - 1, sample_size)
+    l_index += l_index >= k_index
+
+    c_vector, d_vector = concordance_discordance_indices(
+        wn_matrix[k_index], wn_matrix[l_index], criteria_type, w_vector
+    )
+
+    return np.mean(c_vector), np.mean(d_vector)
+
+
 def concordance_discordance_matrices(
-    wn_matrix: DataFrame,
+    wn_matrix: DataFrame | NDArray,
     criteria_type: NDArray,
     w_vector: NDArray,
-):
+) -> tuple[NDArray, NDArray]:
     """Determine the concordance and discordance matrices.
 
     Args:
-        wn_matrix (pd.DataFrame): Weighted normalized matrix.
+        wn_matrix (pd.DataFrame | NDArray): Weighted normalized matrix.
         criteria_type (NDArray): Binary vector that indicates whether
         the attribute is beneficial (True) or cost (False).
         Defaults sets all attributes as benefitial.
         w_vector (NDArray): Weight vector.
+
+    Returns concordance matrix and discordance matrix.
     """
-    column_size, row_size = wn_matrix.shape
+    wn_matrix = np.asarray(wn_matrix, dtype=get_dtype())
+    column_size = wn_matrix.shape[0]
+
+    return concordance_discordance_block(
+        wn_matrix, criteria_type, w_vector, 0, column_size
+    )
+
+
+def concordance_discordance_block(
+    wn_matrix: NDArray,
+    criteria_type: NDArray,
+    w_vector: NDArray,
+    start: int,
+    stop: int,
+) -> tuple[NDArray, NDArray]:
+    """Determine rows from start to stop of the concordance
+    and discordance matrices.
+
+    Args:
+        wn_matrix (NDArray): Weighted normalized matrix.
+        criteria_type (NDArray): Binary vector that indicates whether
+        the attribute is beneficial (True) or cost (False).
+        Defaults sets all attributes as benefitial.
+        w_vector (NDArray): Weight vector.
+        start (int): First row of the block.
+        stop (int): Row after the last row of the block.
+
+    Returns blocks of concordance matrix and discordance matrix.
+    """
+    k_values = wn_matrix[start:stop, np.newaxis, :]
+    l_values = wn_matrix[np.newaxis, :, :]
+
+    c_block, d_block = concordance_discordance_indices(
+        k_values, l_values, criteria_type, w_vector
+    )
+
+    # Alternative is not compared with itself
+    rows = np.arange(stop - start)
+    c_block[rows, rows + start] = 0.0
+    d_block[rows, rows + start] = 0.0
+
+    return c_block, d_block
+
+
+def concordance_discordance_indices(
+    k_values: NDArray,
+    l_values: NDArray,
+    criteria_type: NDArray,
+    w_vector: NDArray,
+) -> tuple[NDArray, NDArray]:
+    """Calculates concordance and discordance indices of alternatives k
+    against alternatives l. For more information see [5] (2.15), (2.16)
+
+    Args:
+        k_values (NDArray): Weighted normalized values of alternatives k,
+            criteria are on the last axis.
+        l_values (NDArray): Weighted normalized values of alternatives l,
+            broadcastable with k_values.
+        criteria_type (NDArray): Binary vector that indicates whether
+        the attribute is beneficial (True) or cost (False).
+        Defaults sets all attributes as benefitial.
+        w_vector (NDArray): Weight vector or weights broadcastable
+            with k_values, criteria are on the last axis.
+
+    The weights of the concordance set are summed in the order
+    of the criteria, so the index is equal to summing them pair by pair.
+
+    Returns concordance indices and discordance indices.
+    """
+    row_size = k_values.shape[-1]
 
     if criteria_type is None:
         criteria_type = np.full(row_size, True)
 
-    c_matrix = np.full((column_size, column_size), 0.0)
-    d_matrix = np.full((column_size, column_size), 0.0)
+    shape = np.broadcast_shapes(k_values.shape, l_values.shape)[:-1]
+    dtype = np.result_type(k_values, l_values)
 
-    for k in range(column_size):
-        for l in range(k + 1, column_size):
-            k_row = wn_matrix.iloc[k]
-            l_row = wn_matrix.iloc[l]
+    c_index = np.zeros(shape, dtype=dtype)
+    numerator = np.zeros(shape, dtype=dtype)
+    denominator = np.zeros(shape, dtype=dtype)
+    has_discordance = np.zeros(shape, dtype=bool)
 
-            c_kl, d_kl = concordance_set(k_row, l_row, criteria_type)
-            c_matrix[k][l] = concordance_index(c_kl, w_vector)
-            d_matrix[k][l] = discordance_index(d_kl, k_row, l_row)
+    for j, is_beneficial in enumerate(criteria_type):
+        difference = k_values[..., j] - l_values[..., j]
 
-            c_lk, d_lk = concordance_set(l_row, k_row, criteria_type)
-            c_matrix[l][k] = concordance_index(c_lk, w_vector)
-            d_matrix[l][k] = discordance_index(d_lk, l_row, k_row)
+        # For benefitial criteria k-th value must be greater or equal
+        # to the l-th value, for cost criteria it must be lower.
+        if is_beneficial:
+            concordance = difference >= 0
+        else:
+            concordance = difference < 0
 
-    return c_matrix, d_matrix
+        c_index += np.where(concordance, w_vector[..., j], 0.0)
 
+        np.absolute(difference, out=difference)
+        np.maximum(denominator, difference, out=denominator)
 
-def concordance_set(
-    k_row: NDArray, l_row: NDArray, criteria_type: NDArray
-) -> tuple[set, set]:
-    "Calculates discordance index. For more information see [5] (2.15)"
-    c_kl = set()
-    d_kl = set()
+        has_discordance |= ~concordance
+        difference[concordance] = 0.0
+        np.maximum(numerator, difference, out=numerator)
 
-    for j, val in enumerate(criteria_type):
-        # For benefitial criteria first part of condition must be true
-        # For cost criteria the other part
-        if (val and k_row[j] >= l_row[j]) or (not val and k_row[j] < l_row[j]):
-            c_kl.add(j)
-        else:
-            d_kl.add(j)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d_index = np.where(has_discordance, numerator / denominator, 0.0)
+
+    return c_index, d_index
+
+
+def dominance_edges(dominance: DominanceRelation | NDArray) -> tuple[NDArray, NDArray]:
+    """Returns dominance relation as (row, col) edge list.
 
-    return c_kl, d_kl
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+
+    Bitset is unpacked in blocks of rows, so the dense matrix
+    is never created.
+    """
+    if not isinstance(dominance, dict):
+        rows, cols = np.nonzero(dominance)
+        return rows.astype(np.int64), cols.astype(np.int64)
+
+    if dominance["bits"] is None:
+        return dominance["rows"], dominance["cols"]
 
+    size = dominance["size"]
+    block_size = max(1, MEMORY_LIMIT // max(1, size))
 
-def concordance_index(concordance_set: set, w_vector: NDArray) -> float:
-    "Calculates corcordnace index."
-    sum = 0
+    rows = []
+    cols = []
 
-    for j in concordance_set:
-        sum += w_vector[j]
+    for start in range(0, size, block_size):
+        block = dominance["bits"][start:start + block_size]
+        block = np.unpackbits(block, axis=1, count=size)
 
-    return sum
+        block_rows, block_cols = np.nonzero(block)
+        rows.append(block_rows + start)
+        cols.append(block_cols)
+
+    if not rows:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+
+    return (
+        np.concatenate(rows).astype(np.int64),
+        np.concatenate(cols).astype(np.int64),
+    )
 
 
-def discordance_index(discordance__set: set, k_row: NDArray, l_row: NDArray) -> float:
-    "Calculates discordance index. For more information see [5] (2.16)"
-    rows_difference = np.absolute(k_row - l_row)
-    restriction = list(discordance__set)
+def dominance_matrix(dominance: DominanceRelation) -> NDArray:
+    "Returns dominance relation as dense dominance matrix."
+    size = dominance["size"]
 
-    if not len(restriction):
-        return 0
+    if dominance["bits"] is not None:
+        return np.unpackbits(dominance["bits"], axis=1, count=size).astype(int)
 
-    denominator = np.max(rows_difference)
-    numerator = np.max(rows_difference[restriction])
+    matrix = np.zeros((size, size), dtype=int)
+    matrix[dominance["rows"], dominance["cols"]] = 1
 
-    return numerator / denominator
+    return matrix
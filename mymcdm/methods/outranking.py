@@ -0,0 +1,363 @@
+"""Graph analysis of the outranking relation
+
+The dominance relation from ELECTRE method is handled as directed graph,
+where the edge (k, l) means that the alternative k dominates
+the alternative l. All functions work with the edge list, so the dense
+dominance matrix is never created and the time is near-linear
+in the number of edges.
+
+References: [6]
+"""
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame, Series
+
+from .electre import electre_blocked, dominance_edges, MEMORY_LIMIT
+from ..utils.types import DominanceRelation
+
+
+def electre_ranking(
+    a_dataframe: DataFrame,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    c_threshold: float = None,
+    d_threshold: float = None,
+    memory_limit: int = MEMORY_LIMIT,
+    sample_size: int = None,
+    seed: int = None,
+) -> Series:
+    """The ELECTRE method followed by ranking of the outranking graph.
+
+    Args:
+        a_dataframe (pd.DataFrame): Alternative matrix.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        c_threshold (float, optional): Concordance threshold.
+            Defaults to None.
+        d_threshold (float, optional): Discordance threshold.
+            Defaults to None.
+        memory_limit (int, optional): Approximate number of bytes
+            that may be used by one block. Defaults to 256 MiB.
+        sample_size (int, optional): Number of randomly chosen pairs
+            of alternatives used to estimate missing thresholds.
+            Defaults to None, which computes the exact mean.
+        seed (int, optional): Seed of the pair sampling. Defaults to None.
+
+    For more information about arguments see electre_blocked method.
+
+    Returns rank of the alternatives in Series.
+    See ranking_levels method for more information.
+    """
+    relation = electre_blocked(
+        a_dataframe,
+        w_vector,
+        criteria_type,
+        c_threshold,
+        d_threshold,
+        memory_limit,
+        "edges",
+        sample_size,
+        seed,
+    )
+
+    return Series(ranking_levels(relation), a_dataframe.index, name="rank")
+
+
+def net_dominance(dominance: DominanceRelation | NDArray) -> NDArray:
+    """Returns number of dominated alternatives minus number
+    of dominating alternatives for each alternative.
+
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+    """
+    size = relation_size(dominance)
+    rows, cols = dominance_edges(dominance)
+
+    return np.bincount(rows, minlength=size) - np.bincount(cols, minlength=size)
+
+
+def strongly_connected_components(
+    dominance: DominanceRelation | NDArray,
+) -> tuple[NDArray, int]:
+    """Finds strongly connected components of the outranking graph.
+    Alternatives in one component dominate each other through a cycle.
+
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+
+    Alternatives that can not be on a cycle are removed first
+    with array operations, Tarjan's algorithm is run only
+    on the rest of the graph.
+
+    Returns component label of each alternative and number of components.
+    """
+    size = relation_size(dominance)
+    rows, cols = dominance_edges(dominance)
+
+    # Alternatives without dominating or dominated alternatives
+    # in the rest of the graph are not on a cycle
+    remaining = topological_levels(size, rows, cols) == 0
+
+    kept = remaining[rows] & remaining[cols]
+    rows, cols = rows[kept], cols[kept]
+
+    remaining &= topological_levels(size, cols, rows) == 0
+
+    kept = remaining[rows] & remaining[cols]
+    rows, cols = rows[kept], cols[kept]
+
+    # Every acyclic alternative is component by itself
+    labels = np.empty(size, dtype=np.int64)
+    acyclic = np.flatnonzero(~remaining)
+    labels[acyclic] = np.arange(acyclic.size)
+
+    core = np.flatnonzero(remaining)
+    position = np.empty(size, dtype=np.int64)
+    position[core] = np.arange(core.size)
+
+    core_labels, count = tarjan(core.size, position[rows], position[cols])
+    labels[core] = core_labels + acyclic.size
+
+    return labels, acyclic.size + count
+
+
+def find_cycles(dominance: DominanceRelation | NDArray) -> list[NDArray]:
+    """Returns groups of alternatives that dominate each other
+    through a cycle.
+
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+    """
+    labels, count = strongly_connected_components(dominance)
+    sizes = np.bincount(labels, minlength=count)
+
+    order = np.argsort(labels, kind="stable")
+    groups = np.split(order, np.cumsum(sizes)[:-1])
+
+    return [group for group in groups if group.size > 1]
+
+
+def condensation(
+    dominance: DominanceRelation | NDArray,
+) -> tuple[NDArray, DominanceRelation]:
+    """Condensates each cycle of the outranking graph to one vertex.
+
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+
+    Returns component label of each alternative and acyclic dominance
+    relation between the components.
+    """
+    labels, count = strongly_connected_components(dominance)
+    rows, cols = dominance_edges(dominance)
+
+    rows, cols = labels[rows], labels[cols]
+    between = rows != cols
+
+    edges = np.unique(rows[between] * count + cols[between])
+
+    relation: DominanceRelation = {
+        "size": count,
+        "rows": edges // count,
+        "cols": edges % count,
+        "bits": None,
+    }
+
+    return labels, relation
+
+
+def ranking_levels(dominance: DominanceRelation | NDArray) -> NDArray:
+    """Ranks alternatives by levels of the condensed outranking graph.
+
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+
+    Alternatives that are not dominated have rank 1, other alternatives
+    have rank one bigger than the worst ranked alternative that
+    dominates them. Alternatives in a cycle have the same rank.
+
+    Returns rank vector.
+    """
+    labels, relation = condensation(dominance)
+    levels = topological_levels(
+        relation["size"], relation["rows"], relation["cols"]
+    )
+
+    return levels[labels]
+
+
+def kernel(dominance: DominanceRelation | NDArray) -> NDArray:
+    """Finds kernel of the condensed outranking graph. Alternatives
+    in the kernel are not dominated by each other and every other
+    alternative is dominated by an alternative in the kernel.
+
+    Args:
+        dominance (DominanceRelation | NDArray): Dominance relation
+            or dense dominance matrix.
+
+    Alternatives in a cycle are considered indifferent
+    and they enter the kernel together.
+
+    Returns binary vector that indicates whether the alternative
+    is in the kernel.
+    """
+    # Empty relation has empty kernel
+    if relation_size(dominance) == 0:
+        return np.zeros(0, dtype=bool)
+
+    labels, relation = condensation(dominance)
+
+    size = relation["size"]
+    rows, cols = relation["rows"], relation["cols"]
+
+    levels = topological_levels(size, rows, cols)
+    indptr, targets = adjacency(size, rows, cols)
+
+    in_kernel = np.zeros(size, dtype=bool)
+    dominated = np.zeros(size, dtype=bool)
+
+    # All dominating alternatives are in the previous levels
+    order = np.argsort(levels, kind="stable")
+    boundaries = np.searchsorted(levels[order], np.arange(1, levels.max() + 2))
+
+    for start, stop in zip(boundaries[:-1], boundaries[1:]):
+        level = order[start:stop]
+        chosen = level[~dominated[level]]
+
+        in_kernel[chosen] = True
+        dominated[successors(indptr, targets, chosen)] = True
+
+    return in_kernel[labels]
+
+
+def relation_size(dominance: DominanceRelation | NDArray) -> int:
+    "Returns number of alternatives in the dominance relation."
+    if isinstance(dominance, dict):
+        return dominance["size"]
+
+    return dominance.shape[0]
+
+
+def adjacency(size: int, rows: NDArray, cols: NDArray) -> tuple[NDArray, NDArray]:
+    """Returns graph in compressed sparse row form, the successors
+    of the vertex i are targets[indptr[i]:indptr[i + 1]].
+    """
+    order = np.argsort(rows, kind="stable")
+
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+
+    return indptr, cols[order]
+
+
+def successors(indptr: NDArray, targets: NDArray, vertices: NDArray) -> NDArray:
+    "Returns successors of all given vertices, repeated for each edge."
+    starts = indptr[vertices]
+    counts = indptr[vertices + 1] - starts
+    total = np.sum(counts)
+
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+
+    return targets[offsets + np.arange(total)]
+
+
+def topological_levels(size: int, rows: NDArray, cols: NDArray) -> NDArray:
+    """Kahn's algorithm that removes vertices without predecessors
+    level by level.
+
+    Returns level of each vertex starting from 1. Vertices on a cycle
+    or reachable from a cycle are never removed and have level 0.
+    """
+    indptr, targets = adjacency(size, rows, cols)
+    indegree = np.bincount(cols, minlength=size)
+
+    levels = np.zeros(size, dtype=np.int64)
+    frontier = np.flatnonzero(indegree == 0)
+    level = 1
+
+    while frontier.size:
+        levels[frontier] = level
+
+        reached = successors(indptr, targets, frontier)
+        vertices, counts = np.unique(reached, return_counts=True)
+
+        indegree[vertices] -= counts
+        frontier = vertices[indegree[vertices] == 0]
+        level += 1
+
+    return levels
+
+
+def tarjan(size: int, rows: NDArray, cols: NDArray) -> tuple[NDArray, int]:
+    """Iterative Tarjan's algorithm for strongly connected components.
+
+    Returns component label of each vertex and number of components.
+    """
+    indptr, targets = adjacency(size, rows, cols)
+    indptr = indptr.tolist()
+    targets = targets.tolist()
+
+    index = [-1] * size
+    low = [0] * size
+    on_stack = [False] * size
+    labels = [-1] * size
+
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in range(size):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+
+        work = [(root, indptr[root])]
+
+        while work:
+            vertex, position = work[-1]
+
+            if position < indptr[vertex + 1]:
+                work[-1] = (vertex, position + 1)
+                target = targets[position]
+
+                if index[target] == -1:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+
+                    work.append((target, indptr[target]))
+                elif on_stack[target]:
+                    low[vertex] = min(low[vertex], index[target])
+
+                continue
+
+            work.pop()
+
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[vertex])
+
+            if low[vertex] == index[vertex]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    labels[member] = count
+
+                    if member == vertex:
+                        break
+
+                count += 1
+
+    return np.array(labels, dtype=np.int64), count
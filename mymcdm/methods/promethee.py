@@ -0,0 +1,322 @@
+"""PROMETHEE II
+
+References: [9]
+"""
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame, Series
+
+from ..utils.config import get_dtype
+from ..utils.validation import valid_scoring_args_extended
+
+PREFERENCE_FUNCTIONS: Final = ("usual", "u-shape", "v-shape", "linear", "gaussian")
+
+BLOCK_SIZE: Final = 2**24
+"Maximal number of pairs of alternatives in one block of gaussian criterion."
+
+
+def promethee(
+    a_dataframe: DataFrame,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    preference: str | list[str] = "usual",
+    q_threshold: float | NDArray = None,
+    p_threshold: float | NDArray = None,
+    s_threshold: float | NDArray = None,
+) -> Series:
+    """The PROMETHEE II method.
+
+    Args:
+        a_dataframe (pd.DataFrame): Alternative matrix.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        preference (str | list[str], optional): Preference function
+            for all criteria or for each criterion. One of "usual",
+            "u-shape", "v-shape", "linear" and "gaussian".
+            Defaults to "usual".
+        q_threshold (float | NDArray, optional): Indifference threshold
+            for all criteria or for each criterion. Defaults to None.
+        p_threshold (float | NDArray, optional): Preference threshold
+            for all criteria or for each criterion. Defaults to None.
+        s_threshold (float | NDArray, optional): Gaussian threshold
+            for all criteria or for each criterion. Defaults to None.
+
+    Raises:
+        ValueError: If preference function is unknown.
+        ValueError: If threshold required by preference function is missing.
+
+    Usual, U-shape, V-shape and linear preference functions are
+    piecewise linear, so flows of each criterion are computed from
+    the sorted column with prefix sums. Gaussian preference function
+    compares all pairs of alternatives in blocks.
+
+    Returns net flow vector. The best alternative
+    (in the maximalization case) have the biggest
+    value in the vector.
+    """
+    valid_scoring_args_extended(a_dataframe, w_vector, criteria_type)
+
+    a_matrix = a_dataframe.to_numpy(dtype=get_dtype())
+    column_size = a_matrix.shape[0]
+
+    flows = criterion_flows(
+        a_matrix, criteria_type, preference, q_threshold, p_threshold, s_threshold
+    )
+
+    net_flow = np.zeros(column_size, dtype=a_matrix.dtype)
+
+    for j in range(flows.shape[1]):
+        net_flow += w_vector[j] * flows[:, j]
+
+    net_flow /= column_size - 1
+
+    return Series(net_flow, a_dataframe.index, name="score")
+
+
+def criterion_flows(
+    a_matrix: NDArray,
+    criteria_type: NDArray,
+    preference: str | list[str] = "usual",
+    q_threshold: float | NDArray = None,
+    p_threshold: float | NDArray = None,
+    s_threshold: float | NDArray = None,
+) -> NDArray:
+    """Calculates net flows of each criterion, which do not depend
+    on the weights. Arguments are the same as in promethee method.
+
+    Raises:
+        ValueError: If preference function is unknown.
+        ValueError: If threshold required by preference function is missing.
+
+    Returns matrix where column j contains flows of criterion j.
+    """
+    row_size = a_matrix.shape[1]
+
+    if criteria_type is None:
+        criteria_type = np.full(row_size, True)
+
+    if isinstance(preference, str):
+        preference = [preference] * row_size
+
+    if len(preference) != row_size:
+        raise ValueError(
+            "Preference functions and weight vector must have same size."
+        )
+
+    q_vector = thresholds_vector(q_threshold, row_size)
+    p_vector = thresholds_vector(p_threshold, row_size)
+    s_vector = thresholds_vector(s_threshold, row_size)
+
+    flows = []
+
+    for j, is_beneficial in enumerate(criteria_type):
+        column = a_matrix[:, j] if is_beneficial else -a_matrix[:, j]
+
+        flows.append(criterion_flow(
+            column, preference[j].lower(), q_vector[j], p_vector[j], s_vector[j]
+        ))
+
+    return np.column_stack(flows)
+
+
+def promethee_scores(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+) -> NDArray:
+    """The PROMETHEE II method with usual preference function
+    for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+
+    Flows of one matrix are computed from the sorted columns. In the stack
+    each alternative is compared with all alternatives of its problem
+    one by one, so the memory is linear in the size of the stack.
+
+    Returns net flow of each alternative.
+    """
+    column_size, row_size = a_matrix.shape[-2:]
+
+    if criteria_type is None:
+        criteria_type = np.full(row_size, True)
+
+    # Cost criteria are turned to benefitial
+    a_matrix = np.where(criteria_type, a_matrix, -a_matrix)
+
+    if a_matrix.ndim == 2:
+        flows = np.column_stack([
+            criterion_flow(column, "usual", np.nan, np.nan, np.nan)
+            for column in a_matrix.T
+        ])
+    else:
+        flows = np.zeros(a_matrix.shape, dtype=a_matrix.dtype)
+
+        for i in range(column_size):
+            flows += np.sign(a_matrix - a_matrix[..., i:i + 1, :])
+
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+    net_flow = np.matmul(flows, w_vector[..., np.newaxis])[..., 0]
+
+    return net_flow / (column_size - 1)
+
+
+def criterion_flow(
+    column: NDArray,
+    preference: str,
+    q_threshold: float,
+    p_threshold: float,
+    s_threshold: float,
+) -> NDArray:
+    """Calculates sum of preferences of each alternative over all other
+    alternatives minus sum of preferences of other alternatives over it.
+
+    Args:
+        column (NDArray): Values of the benefitial criterion.
+        preference (str): Preference function.
+        q_threshold (float): Indifference threshold.
+        p_threshold (float): Preference threshold.
+        s_threshold (float): Gaussian threshold.
+
+    Raises:
+        ValueError: If preference function is unknown.
+        ValueError: If threshold required by preference function is missing.
+    """
+    match preference:
+        case "usual":
+            q_threshold, p_threshold = 0.0, 0.0
+        case "u-shape":
+            valid_thresholds(preference, q_threshold=q_threshold)
+            p_threshold = q_threshold
+        case "v-shape":
+            valid_thresholds(preference, p_threshold=p_threshold)
+            q_threshold = 0.0
+        case "linear":
+            valid_thresholds(preference, q_threshold, p_threshold)
+        case "gaussian":
+            valid_thresholds(preference, s_threshold=s_threshold)
+            return gaussian_flow(column, s_threshold)
+        case _:
+            raise ValueError(
+                f"Unknown preference function \"{preference}\". "
+                f"Expected one of {PREFERENCE_FUNCTIONS}."
+            )
+
+    positive = linear_preferences(column, q_threshold, p_threshold)
+    negative = linear_preferences(-column, q_threshold, p_threshold)
+
+    return positive - negative
+
+
+def linear_preferences(
+    column: NDArray, q_threshold: float, p_threshold: float
+) -> NDArray:
+    """Calculates sum of preferences of each alternative over all
+    alternatives for piecewise linear preference function. Preference
+    is 0 up to the indifference threshold, 1 above the preference threshold
+    and grows linearly between them.
+
+    Args:
+        column (NDArray): Values of the benefitial criterion.
+        q_threshold (float): Indifference threshold.
+        p_threshold (float): Preference threshold.
+    """
+    sorted_column = np.sort(column)
+    prefix = np.concatenate(([0.0], np.cumsum(sorted_column)))
+
+    # Alternatives with difference bigger than preference threshold
+    full = np.searchsorted(sorted_column, column - p_threshold, side="left")
+
+    if p_threshold == q_threshold:
+        return full.astype(column.dtype)
+
+    # Alternatives with difference between the thresholds
+    partial = np.searchsorted(sorted_column, column - q_threshold, side="left")
+
+    count = partial - full
+    total = prefix[partial] - prefix[full]
+
+    linear = (count * (column - q_threshold) - total) / (p_threshold - q_threshold)
+
+    return full + linear
+
+
+def gaussian_flow(column: NDArray, s_threshold: float) -> NDArray:
+    """Calculates flow of the gaussian criterion by comparing
+    all pairs of alternatives in blocks of rows.
+
+    Args:
+        column (NDArray): Values of the benefitial criterion.
+        s_threshold (float): Gaussian threshold.
+    """
+    column_size = column.shape[0]
+    block_size = max(1, BLOCK_SIZE // column_size)
+
+    flow = np.empty(column_size, dtype=column.dtype)
+
+    for start in range(0, column_size, block_size):
+        difference = column[start:start + block_size, np.newaxis] - column
+
+        preference = 1 - np.exp(-(difference**2) / (2 * s_threshold**2))
+        preference = np.where(difference > 0, preference, -preference)
+
+        flow[start:start + block_size] = np.sum(preference, axis=1)
+
+    return flow
+
+
+def thresholds_vector(threshold: float | NDArray | None, size: int) -> NDArray:
+    """Returns vector of thresholds for each criterion.
+
+    Raises:
+        ValueError: If size of the threshold vector is not correct.
+    """
+    if threshold is None:
+        return np.full(size, np.nan)
+
+    vector = np.atleast_1d(np.asarray(threshold, dtype=get_dtype()))
+
+    if vector.shape[0] not in (1, size):
+        raise ValueError(
+            f"Wrong size of threshold vector. Expected {size} got {vector.shape[0]}."
+        )
+
+    return np.broadcast_to(vector, (size,))
+
+
+def valid_thresholds(
+    preference: str,
+    q_threshold: float = 0.0,
+    p_threshold: float = None,
+    s_threshold: float = 1.0,
+):
+    """Checks thresholds of the preference function.
+
+    Raises:
+        ValueError: If threshold required by preference function is missing.
+        ValueError: If thresholds are negative or preference threshold is not
+            bigger than indifference threshold.
+    """
+    if p_threshold is None:
+        p_threshold = q_threshold + 1
+
+    if np.isnan(q_threshold) or np.isnan(p_threshold) or np.isnan(s_threshold):
+        raise ValueError(
+            f"Missing threshold for the \"{preference}\" preference function."
+        )
+
+    if q_threshold < 0 or p_threshold <= q_threshold or s_threshold <= 0:
+        raise ValueError(
+            "Thresholds must be positive and preference threshold "
+            "must be bigger than indifference threshold."
+        )
@@ -2,10 +2,12 @@
 
 References: [4] [5]
 """
+import numpy as np
 from pandas import DataFrame, Series
 from numpy.linalg import norm as euclidean_distance
 from numpy.typing import NDArray
 
+from ..utils.config import get_dtype
 from ..utils.misc import determine_ideals
 from ..utils.validation import valid_scoring_args_extended
 
@@ -55,3 +57,65 @@ def topsis(
     result = negative_distances / denominator
 
     return Series(result, name="score", index=a_dataframe.index)
+
+
+def topsis_scores(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray
+) -> NDArray:
+    """The TOPSIS method for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+
+    Raises:
+        ValueError: Diference of positive distance and negative distance is zero.
+
+    Returns relative closeness of each alternative to the positive-ideal
+    solution.
+    """
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+    wn_matrix = a_matrix * w_vector[..., np.newaxis, :]
+
+    positive_ideal, negative_ideal = determine_ideals(wn_matrix, criteria_type)
+
+    return relative_closeness(wn_matrix, positive_ideal, negative_ideal)
+
+
+def relative_closeness(
+    wn_matrix: NDArray, positive_ideal: NDArray, negative_ideal: NDArray
+) -> NDArray:
+    """Calculates relative closeness of the alternatives to the positive-ideal
+    solution. Ideals can be also ideals of a bigger matrix than wn_matrix.
+
+    Args:
+        wn_matrix (NDArray): Weighted normalized matrix or stack of matrices.
+        positive_ideal (NDArray): Positive-ideal solution of each matrix.
+        negative_ideal (NDArray): Negative-ideal solution of each matrix.
+
+    Raises:
+        ValueError: Diference of positive distance and negative distance is zero.
+    """
+    positive_distances = euclidean_distance(
+        wn_matrix - positive_ideal[..., np.newaxis, :], axis=-1
+    )
+    negative_distances = euclidean_distance(
+        wn_matrix - negative_ideal[..., np.newaxis, :], axis=-1
+    )
+
+    denominator = positive_distances + negative_distances
+
+    if not denominator.all():
+        raise ValueError(
+            """Diference of positive distance and negative distance
+            must not be zero."""
+        )
+
+    return negative_distances / denominator
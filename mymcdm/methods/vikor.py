@@ -6,6 +6,7 @@ import numpy as np
 from numpy.typing import NDArray
 from pandas import DataFrame, Series
 
+from ..utils.config import get_dtype
 from ..utils.misc import determine_ideals
 from ..utils.validation import valid_scoring_args_extended
 
@@ -91,6 +92,143 @@ def vikor(
     return solutions, u_order, r_order, q_order
 
 
+def vikor_sweep(
+    a_dataframe: DataFrame,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    v_values: NDArray,
+) -> tuple[NDArray, NDArray, NDArray, NDArray, NDArray, NDArray]:
+    """The VIKOR method for many maximum group utility values at once.
+
+    Args:
+        a_dataframe (pd.DataFrame): Alternative matrix.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        v_values (NDArray): Vector of maximum group utility values.
+
+    Utility and regret do not depend on the maximum group utility value,
+    so they are computed only once. The conditions are the same
+    as in vikor method.
+
+    Returns:
+        - utility (NDArray): Utility vector.
+        - regret (NDArray): Regret vector.
+        - q_matrix (NDArray): Q matrix, column j belongs to v_values[j].
+        - acceptable_advantage (NDArray): Binary vector that indicates
+            whether the best solution has acceptable advantage.
+        - acceptable_stability (NDArray): Binary vector that indicates
+            whether the best solution has acceptable stability.
+        - solutions (NDArray): Binary matrix that indicates
+            the best solutions, column j belongs to v_values[j].
+    """
+    valid_scoring_args_extended(a_dataframe, w_vector, criteria_type)
+
+    v_values = np.atleast_1d(np.asarray(v_values, dtype=float))
+    a_matrix = a_dataframe.to_numpy(dtype=get_dtype())
+
+    utility, regret = utility_regret(a_matrix, w_vector, criteria_type)
+
+    # Calculating the Q matrix
+    q_matrix = q_values(utility, regret, v_values[:, np.newaxis]).T
+
+    # Q order of the alternatives for each value, NaN values stays in place
+    row_size = a_matrix.shape[0]
+    dq = 1 / (row_size - 1)
+
+    order = np.argsort(q_matrix.T, axis=1, kind="quicksort")
+    is_number = ~np.isnan(q_matrix).any(axis=0)
+    order[~is_number] = np.arange(row_size)
+
+    columns = np.arange(v_values.shape[0])
+    first = q_matrix[order[:, 0], columns]
+    second = q_matrix[order[:, 1], columns]
+
+    # Determine the best solution that satisfies conditions
+    acceptable_advantage = (second - first) >= dq
+
+    is_stable = np.max(utility) == np.min(utility)
+    is_stable = is_stable and np.max(regret) == np.min(regret)
+    acceptable_stability = np.full(v_values.shape[0], is_stable)
+
+    solutions = np.full(q_matrix.shape, False)
+    solutions[order[:, 0], columns] = True
+
+    is_pair = ~acceptable_advantage | ~acceptable_stability
+    solutions[order[is_pair, 1], columns[is_pair]] = True
+
+    solutions[:, ~acceptable_advantage] |= (
+        q_matrix[:, ~acceptable_advantage] - first[~acceptable_advantage]
+    ) < dq
+
+    return (
+        utility,
+        regret,
+        q_matrix,
+        acceptable_advantage,
+        acceptable_stability,
+        solutions,
+    )
+
+
+def utility_regret(
+    a_matrix: NDArray, w_vector: NDArray, criteria_type: NDArray
+) -> tuple[NDArray, NDArray]:
+    """Calculates the utility and regret measures of the VIKOR method.
+    Criteria with equal positive and negative ideal are skipped.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+
+    Returns utility vector and regret vector.
+    """
+    positive_ideal, negative_ideal = determine_ideals(a_matrix, criteria_type)
+    positive_ideal = positive_ideal[..., np.newaxis, :]
+    negative_ideal = negative_ideal[..., np.newaxis, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        formula = (positive_ideal - a_matrix) / (positive_ideal - negative_ideal)
+
+    w_vector = np.asarray(w_vector, dtype=get_dtype())[..., np.newaxis, :]
+    weighted = np.ascontiguousarray(np.moveaxis(w_vector * formula, -1, 0))
+
+    return np.nansum(weighted, axis=0), np.fmax.reduce(weighted, axis=0)
+
+
+def vikor_scores(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    v_value: float = 0.5,
+) -> NDArray:
+    """The Q measure of the VIKOR method for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        v_value (float, optional): Maximum group utility value.
+            Defaults to 0.5.
+
+    Returns Q value of each alternative. The best alternative
+    have the smallest value.
+    """
+    utility, regret = utility_regret(a_matrix, w_vector, criteria_type)
+
+    return q_values(utility, regret, v_value)
+
+
 def vikor_ranking(
     a_dataframe: DataFrame,
     w_vector: NDArray,
@@ -107,24 +245,194 @@ def vikor_ranking(
             Defaults sets all attributes as benefitial.
         v_value (int, optional): Maximum group utility value. Defaults sets to 0.5.
 
+    Best solutions of the VIKOR method get the rank and are removed,
+    then the method is applied to the remaining alternatives.
+    See vikor_ranks method for more information.
+
     Returns rank of the alternatives in Series.
     """
-    a_dataframe = a_dataframe.copy()
-    rank = 1
-    result = {}
+    valid_scoring_args_extended(a_dataframe, w_vector, criteria_type)
+
+    a_matrix = a_dataframe.to_numpy(dtype=get_dtype())
+    rank = vikor_ranks(a_matrix, w_vector, criteria_type, v_value)
+
+    # Index without name as in the ranking built by repeated vikor method
+    result = Series(rank, a_dataframe.index.rename(None), name="rank")
+    return result.sort_index()
+
+
+def vikor_ranks(
+    a_matrix: NDArray,
+    w_vector: NDArray,
+    criteria_type: NDArray,
+    v_value: int = 0.5,
+) -> NDArray:
+    """Incremental ranking of alternatives by repeated VIKOR method.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        v_value (int, optional): Maximum group utility value. Defaults sets to 0.5.
+
+    Each criterion keeps its values in sorted order, so the ideals
+    of the remaining alternatives are found at the ends of the order.
+    Utility and regret are recomputed only when some ideal changes
+    after removing the best solutions, otherwise only Q is updated.
+    Only weighted values of the criteria with changed ideals are
+    recomputed, but utility and regret of the remaining alternatives
+    are reduced again over all criteria, so that they are rounded
+    as in vikor method and ties are broken the same way. The worst
+    case is therefore O(m^2 * n) as for repeated vikor method.
+
+    Returns rank vector.
+    """
+    a_matrix = np.asarray(a_matrix, dtype=get_dtype())
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+    row_count, column_count = a_matrix.shape
 
-    while a_dataframe.shape[0] >= 2:
-        solutions, _, _, _ = vikor(a_dataframe, w_vector, criteria_type, v_value)
-        a_dataframe.drop(solutions, inplace=True)
+    if criteria_type is None:
+        criteria_type = np.full(column_count, True)
 
-        for alt in solutions:
-            result.update({alt: rank})
+    criteria_type = np.asarray(criteria_type, dtype=bool)
 
-        rank += 1
+    # Sorted order of each criterion and ends of its remaining part
+    order = np.argsort(a_matrix, axis=0, kind="stable").T
+    low = np.zeros(column_count, dtype=int)
+    high = np.full(column_count, row_count - 1)
+    columns = np.arange(column_count)
 
-    if a_dataframe.shape[0] == 1:
-        alt = a_dataframe.iloc[0].name
-        result.update({alt: rank})
+    alive = np.full(row_count, True)
+    remaining = np.arange(row_count)
 
-    result = Series(result, name="rank")
-    return result.sort_index()
+    weighted = np.empty((column_count, row_count), dtype=a_matrix.dtype)
+    utility = np.empty(row_count, dtype=a_matrix.dtype)
+    regret = np.empty(row_count, dtype=a_matrix.dtype)
+
+    positive_ideal = np.full(column_count, np.nan)
+    negative_ideal = np.full(column_count, np.nan)
+
+    rank = np.zeros(row_count, dtype=int)
+    current_rank = 1
+
+    while remaining.size >= 2:
+        # Determine the positive-ideal and the negative-ideal solutions
+        max_vector = a_matrix[order[columns, high], columns]
+        min_vector = a_matrix[order[columns, low], columns]
+
+        new_positive = np.where(criteria_type, max_vector, min_vector)
+        new_negative = np.where(criteria_type, min_vector, max_vector)
+
+        changed = (new_positive != positive_ideal) | (new_negative != negative_ideal)
+        positive_ideal, negative_ideal = new_positive, new_negative
+
+        # Recalculate the utility and regret measures of changed criteria
+        if changed.any():
+            changed = np.flatnonzero(changed)
+            values = a_matrix[np.ix_(remaining, changed)].T
+
+            positive = positive_ideal[changed, np.newaxis]
+            negative = negative_ideal[changed, np.newaxis]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                formula = (positive - values) / (positive - negative)
+
+            weighted[np.ix_(changed, remaining)] = (
+                w_vector[changed, np.newaxis] * formula
+            )
+
+            block = weighted[:, remaining]
+            utility[remaining] = np.nansum(block, axis=0)
+            regret[remaining] = np.fmax.reduce(block, axis=0)
+
+        # Calculating the Q vector
+        q_vector = q_values(utility[remaining], regret[remaining], v_value)
+
+        # Determine the best solutions that satisfies conditions
+        solutions = best_solutions(q_vector)
+
+        rank[remaining[solutions]] = current_rank
+        current_rank += 1
+
+        alive[remaining[solutions]] = False
+        remaining = remaining[~solutions]
+
+        # Move ends of the sorted orders to the remaining alternatives
+        for j in range(column_count):
+            while low[j] < high[j] and not alive[order[j, low[j]]]:
+                low[j] += 1
+
+            while high[j] > low[j] and not alive[order[j, high[j]]]:
+                high[j] -= 1
+
+    if remaining.size == 1:
+        rank[remaining] = current_rank
+
+    return rank
+
+
+def q_values(utility: NDArray, regret: NDArray, v_value: int) -> NDArray:
+    """Calculates the Q vector from utility and regret measures.
+    Alternatives are on the last axis. Returns NaN values
+    if all utilities or all regrets are equal.
+    """
+    min_utility = np.min(utility, axis=-1, keepdims=True)
+    min_regret = np.min(regret, axis=-1, keepdims=True)
+
+    nominator_u = v_value * (utility - min_utility)
+    nominator_r = (1 - v_value) * (regret - min_regret)
+
+    denominator_u = np.max(utility, axis=-1, keepdims=True) - min_utility
+    denominator_r = np.max(regret, axis=-1, keepdims=True) - min_regret
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u_group = nominator_u / denominator_u
+        r_group = nominator_r / denominator_r
+
+    return u_group + r_group
+
+
+def best_solutions(q_vector: NDArray) -> NDArray:
+    """Determine the best solutions of the VIKOR method from Q vector
+    ordered ascending with NaN values at the end.
+
+    If the best solution has acceptable advantage, then the best
+    two solutions are returned, otherwise all solutions which Q value
+    is closer than 1 / (m - 1) to the best Q value.
+
+    Returns binary vector that indicates the solutions.
+    """
+    row_size = q_vector.shape[0]
+    dq = 1 / (row_size - 1)
+
+    solutions = np.full(row_size, False)
+    is_number = ~np.isnan(q_vector)
+
+    # The first two alternatives of the Q order
+    ordered = np.where(is_number, q_vector, np.inf)
+    first = np.argmin(ordered) if is_number.any() else 0
+
+    ordered[first] = np.inf
+    is_number[first] = False
+
+    if is_number.any():
+        second = np.argmin(ordered)
+    else:
+        second = 1 if first == 0 else 0
+
+    acceptable_advantage = (q_vector[second] - q_vector[first]) >= dq
+
+    # Ties of the second alternative are broken by the same sort
+    # that orders the alternatives in vikor method
+    if acceptable_advantage and np.sum(q_vector == q_vector[second]) > 1:
+        numbers = np.flatnonzero(~np.isnan(q_vector))
+        second = numbers[np.argsort(q_vector[numbers], kind="quicksort")[1]]
+
+    solutions[[first, second]] = True
+
+    if not acceptable_advantage:
+        solutions |= (q_vector - q_vector[first]) < dq
+
+    return solutions
@@ -6,6 +6,7 @@ import numpy as np
 from numpy.typing import NDArray
 from pandas import DataFrame, Series
 
+from ..utils.config import get_dtype
 from ..utils.validation import valid_scoring_args
 
 
@@ -26,3 +27,109 @@ def wpm(a_dataframe: DataFrame, w_vector: NDArray) -> Series:
     score = np.prod(amplified, axis=1)
 
     return Series(score, name="score")
+
+
+def wpm_scores(a_matrix: NDArray, w_vector: NDArray) -> NDArray:
+    """The weighted product model method for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+
+    Returns WPM score of each alternative.
+    """
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+    amplified = np.power(a_matrix, w_vector[..., np.newaxis, :])
+
+    return np.prod(amplified, axis=-1)
+
+
+def wpm_log_scores(a_matrix: NDArray, w_vector: NDArray) -> NDArray:
+    """The weighted product model method in the logarithmic domain
+    for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+
+    Returns logarithm of the WPM score of each alternative.
+    """
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+    return weighted_logarithms(a_matrix, w_vector[..., np.newaxis])[..., 0]
+
+
+def wpm_log(
+    a_dataframe: DataFrame,
+    w_vector: NDArray,
+    log_score: bool = True,
+) -> Series | DataFrame:
+    """The weighted product model method computed in the logarithmic domain
+    as sum of weighted logarithms, so the score does not underflow
+    for many criteria.
+
+    Args:
+        a_dataframe (pd.DataFrame): Alternative matrix.
+        w_vector (NDArray): Weight vector or matrix where each row
+            is one weight vector.
+        log_score (bool, optional): Returns logarithm of the score.
+            Defaults to True.
+
+    Zero value of the criterion with nonzero weight gives zero score
+    (logarithm of the score is minus infinity).
+
+    Returns WPM score vector or logarithm of the score vector.
+    For weight matrix returns dataframe where column j belongs to row j
+    of the weight matrix. The best alternative (in the maximalization case)
+    have the biggest value in the vector.
+    """
+    valid_scoring_args(a_dataframe, w_vector)
+
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+    w_matrix = np.atleast_2d(w_vector).T
+
+    a_matrix = a_dataframe.to_numpy(dtype=get_dtype())
+    score = weighted_logarithms(a_matrix, w_matrix)
+
+    if not log_score:
+        score = np.exp(score)
+
+    if w_vector.ndim == 1:
+        return Series(score[:, 0], a_dataframe.index, name="score")
+
+    columns = [f"W{i + 1}" for i in range(score.shape[1])]
+    return DataFrame(score, a_dataframe.index, columns)
+
+
+def weighted_logarithms(a_matrix: NDArray, w_matrix: NDArray) -> NDArray:
+    """Calculates sums of weighted logarithms of the alternative values.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices.
+        w_matrix (NDArray): Matrix or stack of matrices where each column
+            is one weight vector.
+
+    Returns matrix where column j belongs to column j of the weight matrix.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_matrix = np.log(a_matrix)
+
+    # Zero values are added afterwards, because zero weight
+    # times minus infinity is not defined
+    is_zero = np.isneginf(log_matrix)
+
+    if not is_zero.any():
+        return log_matrix @ w_matrix
+
+    log_matrix[is_zero] = 0.0
+
+    score = log_matrix @ w_matrix
+    zero_count = is_zero.astype(log_matrix.dtype) @ (w_matrix != 0)
+    score[zero_count > 0] = -np.inf
+
+    return score
@@ -6,6 +6,7 @@ import numpy as np
 from numpy.typing import NDArray
 from pandas import DataFrame, Series
 
+from ..utils.config import get_dtype
 from ..utils.validation import valid_scoring_args
 
 
@@ -26,3 +27,19 @@ def wsm(a_dataframe: DataFrame, w_vector: NDArray) -> Series:
     score = np.sum(w_matrix, axis=1)
 
     return Series(score, name="score")
+
+
+def wsm_scores(a_matrix: NDArray, w_vector: NDArray) -> NDArray:
+    """The weighted sum model method for stack of alternative matrices.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix or stack of alternative
+            matrices, alternatives are on the axis -2.
+        w_vector (NDArray): Weight vector or one weight vector
+            for each matrix of the stack.
+
+    Returns WSM score of each alternative.
+    """
+    w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+    return np.matmul(a_matrix, w_vector[..., np.newaxis])[..., 0]
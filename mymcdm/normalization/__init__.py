@@ -5,5 +5,14 @@ from .max_min import max_min
 from .vector import vector
 from .sum import sum
 from .logarithmic import logarithmic
+from ..utils.workspace import NormalizationWorkspace
 
-__all__ = ["max", "linear", "max_min", "vector", "sum", "logarithmic"]
+__all__ = [
+    "max",
+    "linear",
+    "max_min",
+    "vector",
+    "sum",
+    "logarithmic",
+    "NormalizationWorkspace",
+]
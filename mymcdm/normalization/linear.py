@@ -5,13 +5,18 @@ References: [2]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.statistics import ColumnStatistics, column_statistics
 from ..utils.validation import validate_normalization_input
+from ..utils.workspace import NormalizationWorkspace
 
 
 @validate_normalization_input
 def linear(
     matrix: NDArray,
-    attributes_type: NDArray = None
+    attributes_type: NDArray = None,
+    copy: bool = True,
+    out: NDArray | NormalizationWorkspace = None,
+    statistics: ColumnStatistics = None,
 ) -> tuple[NDArray, NDArray]:
     """Applies linear normalization on input matrix.
 
@@ -21,6 +26,13 @@ def linear(
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        copy (bool, optional): If False and the matrix has the working
+            dtype, the matrix is normalized in place. Defaults to True.
+        out (NDArray | NormalizationWorkspace, optional): Buffer
+            for the normalized matrix. Defaults to None.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Statistics of the whole matrix
+            normalize its chunk. Defaults to None.
 
     Raises:
         ValueError: If maximum value in the colum that is benefitial is zero.
@@ -29,29 +41,31 @@ def linear(
     Return normalized matrix and boolean matrix
     that indicates new type of attributes.
     """
-    for idx, is_beneficial in enumerate(attributes_type):
-        column = matrix[:, idx]
+    statistics = column_statistics(matrix, statistics, ("max", "min"))
+    max_values = statistics.max[..., np.newaxis, :].astype(matrix.dtype)
+    min_values = statistics.min[..., np.newaxis, :].astype(matrix.dtype)
 
-        if is_beneficial:
-            max = column.max()
+    zero_max = np.any(max_values == 0, axis=tuple(range(matrix.ndim - 1)))
+    zero_min = np.any(min_values == 0, axis=tuple(range(matrix.ndim - 1)))
 
-            if not max:
-                raise ValueError(
-                    "The maximum value in the colum that is benefitial "
-                    "must not be zero."
-                )
+    # The first column in which a denominator is zero
+    for is_beneficial, is_max_zero, is_min_zero in zip(
+        attributes_type, zero_max, zero_min
+    ):
+        if is_beneficial and is_max_zero:
+            raise ValueError(
+                "The maximum value in the colum that is benefitial "
+                "must not be zero."
+            )
 
-            matrix[:, idx] = column / max
-        else:
-            min = column.min()
+        if not is_beneficial and is_min_zero:
+            raise ValueError(
+                "The minimum value in the colum that is cost "
+                "must not be zero."
+            )
 
-            if not min:
-                raise ValueError(
-                    "The minimum value in the colum that is cost "
-                    "must not be zero."
-                )
+    np.divide(matrix, max_values, out=out, where=attributes_type)
+    np.divide(min_values, matrix, out=out, where=~attributes_type)
 
-            matrix[:, idx] = min / column
-
-    row_size = matrix.shape[1]
-    return matrix, np.full(row_size, True)
+    row_size = matrix.shape[-1]
+    return out, np.full(row_size, True)
@@ -5,13 +5,18 @@ References: [1]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.statistics import ColumnStatistics, column_statistics
 from ..utils.validation import validate_normalization_input
+from ..utils.workspace import NormalizationWorkspace
 
 
 @validate_normalization_input
 def logarithmic(
     matrix: NDArray,
-    attributes_type: NDArray = None
+    attributes_type: NDArray = None,
+    copy: bool = True,
+    out: NDArray | NormalizationWorkspace = None,
+    statistics: ColumnStatistics = None,
 ) -> tuple[NDArray, NDArray]:
     """Applies vector logarithmic on input matrix.
 
@@ -21,25 +26,31 @@ def logarithmic(
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        copy (bool, optional): If False and the matrix has the working
+            dtype, the matrix is normalized in place. Defaults to True.
+        out (NDArray | NormalizationWorkspace, optional): Buffer
+            for the normalized matrix. Defaults to None.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Statistics of the whole matrix
+            normalize its chunk. Defaults to None.
 
     Return normalized matrix and boolean matrix
     that indicates new type of attributes.
     """
-    row_size = matrix.shape[1]
+    row_size = matrix.shape[-1]
 
-    # Denominator variable for code clarity
-    prod = np.prod(matrix, axis=0)
-    column_log = np.log(prod)
-    log = np.log(matrix)
+    # Logarithm of the column product as sum of logarithms,
+    # so the product does not overflow
+    statistics = column_statistics(matrix, statistics, ("sum_logs",))
+    column_log = statistics.sum_logs[..., np.newaxis, :].astype(matrix.dtype)
 
     # Calculate for benefitial criteria
-    new_matrix = log / column_log
+    np.log(matrix, out=out)
+    np.divide(out, column_log, out=out)
 
     # Modify for cost criteria
-    for idx, is_beneficial in enumerate(attributes_type):
-        if not is_beneficial:
-            column = new_matrix[:, idx]
+    cost = ~attributes_type
+    np.subtract(1, out, out=out, where=cost)
+    np.divide(out, row_size, out=out, where=cost)
 
-            new_matrix[:, idx] = (1 - column) / row_size
-
-    return new_matrix, np.full(row_size, True)
+    return out, np.full(row_size, True)
@@ -5,13 +5,18 @@ References: [1]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.statistics import ColumnStatistics, column_statistics
 from ..utils.validation import validate_normalization_input
+from ..utils.workspace import NormalizationWorkspace
 
 
 @validate_normalization_input
 def max(
     matrix: NDArray,
-    attributes_type: NDArray = None
+    attributes_type: NDArray = None,
+    copy: bool = True,
+    out: NDArray | NormalizationWorkspace = None,
+    statistics: ColumnStatistics = None,
 ) -> tuple[NDArray, NDArray]:
     """Applies max normalization on input matrix.
 
@@ -21,6 +26,13 @@ def max(
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        copy (bool, optional): If False and the matrix has the working
+            dtype, the matrix is normalized in place. Defaults to True.
+        out (NDArray | NormalizationWorkspace, optional): Buffer
+            for the normalized matrix. Defaults to None.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Statistics of the whole matrix
+            normalize its chunk. Defaults to None.
 
     Raises:
         ValueError: If maximum value in the colum is zero.
@@ -28,15 +40,14 @@ def max(
     Return normalized matrix and boolean matrix
     that indicates new type of attributes.
     """
-    max_values = matrix.max(axis=0)
+    statistics = column_statistics(matrix, statistics, ("max",))
+    max_values = statistics.max[..., np.newaxis, :].astype(matrix.dtype)
 
     # Calculate for benefitial criteria
-    new_matrix = matrix / max_values
+    np.divide(matrix, max_values, out=out)
 
     # Modify for cost criteria
-    for idx, is_beneficial in enumerate(attributes_type):
-        if not is_beneficial:
-            new_matrix[:, idx] = 1 - new_matrix[:, idx]
+    np.subtract(1, out, out=out, where=~attributes_type)
 
-    row_size = matrix.shape[1]
-    return new_matrix, np.full(row_size, True)
+    row_size = matrix.shape[-1]
+    return out, np.full(row_size, True)
@@ -5,13 +5,18 @@ References: [1]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.statistics import ColumnStatistics, column_statistics
 from ..utils.validation import validate_normalization_input
+from ..utils.workspace import NormalizationWorkspace
 
 
 @validate_normalization_input
 def max_min(
     matrix: NDArray,
-    attributes_type: NDArray = None
+    attributes_type: NDArray = None,
+    copy: bool = True,
+    out: NDArray | NormalizationWorkspace = None,
+    statistics: ColumnStatistics = None,
 ) -> tuple[NDArray, NDArray]:
     """Applies min-max normalization on input matrix.
 
@@ -21,29 +26,33 @@ def max_min(
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        copy (bool, optional): If False and the matrix has the working
+            dtype, the matrix is normalized in place. Defaults to True.
+        out (NDArray | NormalizationWorkspace, optional): Buffer
+            for the normalized matrix. Defaults to None.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Statistics of the whole matrix
+            normalize its chunk. Defaults to None.
 
     Return normalized matrix and boolean matrix
     that indicates new type of attributes.
     """
-    row_size = matrix.shape[1]
+    row_size = matrix.shape[-1]
 
-    max_values = matrix.max(axis=0)
-    min_values = matrix.min(axis=0)
+    statistics = column_statistics(matrix, statistics, ("max", "min"))
+    max_values = statistics.max[..., np.newaxis, :].astype(matrix.dtype)
+    min_values = statistics.min[..., np.newaxis, :].astype(matrix.dtype)
 
-    for idx, is_beneficial in enumerate(attributes_type):
-        column = matrix[:, idx]
-        max = max_values[idx]
-        min = min_values[idx]
+    difference = max_values - min_values
 
-        if not (max - min):
-            matrix[:, idx] = np.full(row_size, 1)
-            continue
+    # Calculate for benefitial and cost criteria
+    np.subtract(matrix, min_values, out=out, where=attributes_type)
+    np.subtract(max_values, matrix, out=out, where=~attributes_type)
 
-        if is_beneficial:
-            column -= min
-        else:
-            column = max - column
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(out, difference, out=out)
 
-        matrix[:, idx] = column / (max - min)
+    # Columns with the same values
+    np.copyto(out, 1.0, where=difference == 0)
 
-    return matrix, np.full(row_size, True)
+    return out, np.full(row_size, True)
@@ -5,13 +5,18 @@ References: [1]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.statistics import ColumnStatistics, column_statistics
 from ..utils.validation import validate_normalization_input
+from ..utils.workspace import NormalizationWorkspace
 
 
 @validate_normalization_input
 def sum(
     matrix: NDArray,
-    attributes_type: NDArray = None
+    attributes_type: NDArray = None,
+    copy: bool = True,
+    out: NDArray | NormalizationWorkspace = None,
+    statistics: ColumnStatistics = None,
 ) -> tuple[NDArray, NDArray]:
     """Applies sum normalization on input matrix.
 
@@ -21,6 +26,13 @@ def sum(
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        copy (bool, optional): If False and the matrix has the working
+            dtype, the matrix is normalized in place. Defaults to True.
+        out (NDArray | NormalizationWorkspace, optional): Buffer
+            for the normalized matrix. Defaults to None.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Statistics of the whole matrix
+            normalize its chunk. Defaults to None.
 
     Raises:
         ValueError: If sum of column is zero.
@@ -30,26 +42,34 @@ def sum(
     that indicates new type of attributes.
     """
     # Benefitial and cost denominator
-    b_denominator = np.sum(matrix, axis=0)
-    c_denominator = np.sum(1 / matrix, axis=0)
+    statistics = column_statistics(matrix, statistics, ("sum", "sum_reciprocals"))
 
+    b_denominator = statistics.sum[..., np.newaxis, :].astype(matrix.dtype)
+    c_denominator = statistics.sum_reciprocals[..., np.newaxis, :].astype(
+        matrix.dtype
+    )
+
+    zero_b = np.any(b_denominator == 0, axis=tuple(range(matrix.ndim - 1)))
+    zero_c = np.any(c_denominator == 0, axis=tuple(range(matrix.ndim - 1)))
+
+    # The first column in which a denominator is zero
     for idx, is_beneficial in enumerate(attributes_type):
-        column = matrix[:, idx]
+        if is_beneficial and zero_b[idx]:
+            raise ValueError(f"The sum of column {idx} must not be zero.")
+
+        if not is_beneficial and zero_c[idx]:
+            raise ValueError(
+                f"The sum of inverted values on row {idx} "
+                "must not be zero."
+            )
 
-        if is_beneficial:
-            if not b_denominator[idx]:
-                raise ValueError(f"The sum of column {idx} must not be zero.")
+    np.divide(matrix, b_denominator, out=out, where=attributes_type)
 
-            matrix[:, idx] = column / b_denominator[idx]
-        else:
-            if not c_denominator[idx]:
-                raise ValueError(
-                    f"The sum of inverted values on row {idx} "
-                    "must not be zero."
-                )
+    cost = ~attributes_type
+    with np.errstate(divide="ignore"):
+        np.reciprocal(matrix, out=out, where=cost)
 
-            inverted = 1 / column
-            matrix[:, idx] = inverted / c_denominator[idx]
+    np.divide(out, c_denominator, out=out, where=cost)
 
-    row_size = matrix.shape[1]
-    return matrix, np.full(row_size, True)
+    row_size = matrix.shape[-1]
+    return out, np.full(row_size, True)
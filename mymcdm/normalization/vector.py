@@ -5,13 +5,18 @@ References: [1]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.statistics import ColumnStatistics, column_statistics
 from ..utils.validation import validate_normalization_input
+from ..utils.workspace import NormalizationWorkspace
 
 
 @validate_normalization_input
 def vector(
     matrix: NDArray,
-    attributes_type: NDArray = None
+    attributes_type: NDArray = None,
+    copy: bool = True,
+    out: NDArray | NormalizationWorkspace = None,
+    statistics: ColumnStatistics = None,
 ) -> tuple[NDArray, NDArray]:
     """Applies vector normalization on input matrix.
 
@@ -21,24 +26,28 @@ def vector(
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        copy (bool, optional): If False and the matrix has the working
+            dtype, the matrix is normalized in place. Defaults to True.
+        out (NDArray | NormalizationWorkspace, optional): Buffer
+            for the normalized matrix. Defaults to None.
+        statistics (ColumnStatistics, optional): Precomputed column
+            statistics of the matrix. Statistics of the whole matrix
+            normalize its chunk. Defaults to None.
 
     Return normalized matrix and boolean matrix
     that indicates new type of attributes.
     """
-    # Denominator variable for code clarity
-    amplified = np.power(matrix, 2)
-    sum = np.sum(amplified, axis=0)
+    statistics = column_statistics(matrix, statistics, ("sum_squares",))
+    sum = statistics.sum_squares[..., np.newaxis, :]
 
-    denominator = np.sqrt(sum)
+    denominator = np.sqrt(sum).astype(matrix.dtype)
 
     # Calculate for benefitial criteria
-    new_matrix = matrix / denominator
+    np.divide(matrix, denominator, out=out)
 
     # Modify for cost criteria
-    for idx, is_beneficial in enumerate(attributes_type):
-        if not is_beneficial:
-            new_matrix[:, idx] = 1 - new_matrix[:, idx]
+    np.subtract(1, out, out=out, where=~attributes_type)
 
-    row_size = matrix.shape[1]
+    row_size = matrix.shape[-1]
 
-    return new_matrix, np.full(row_size, True)
+    return out, np.full(row_size, True)
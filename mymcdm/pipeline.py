@@ -0,0 +1,352 @@
+"""Decision of alternative matrices larger than the memory.
+
+Alternatives are read in chunks of rows from an array (for example
+a memory-mapped array) or from a function returning an iterable of chunks.
+The first pass computes column statistics needed by the normalization
+and ideals of TOPSIS, the second pass normalizes and scores each chunk
+with the statistics of the whole matrix. Only one chunk is normalized
+at a time, so memory usage does not depend on the number of alternatives
+except for the score and rank vectors, which can be written to the disk.
+"""
+from pathlib import Path
+from typing import Callable, Final, Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import methods
+from .main import normalize
+from .methods.topsis import relative_closeness
+from .utils.config import get_dtype
+from .utils.misc import determine_ideals, dense_ranking
+from .utils.statistics import ColumnStatistics
+from .utils.validation import (
+    valid_alternative_matrix,
+    valid_normalized_matrix,
+    valid_weight_vector,
+)
+
+CHUNK_SIZE: Final = 2**20
+"Number of alternatives in one chunk."
+
+CHUNKED_METHODS: Final = ("WSM", "WPM", "WPM_LOG", "TOPSIS")
+
+NORMALIZATION_STATISTICS: Final = {
+    None: (),
+    "MAX": ("max",),
+    "LINEAR": ("max", "min"),
+    "MAXMIN": ("max", "min"),
+    "VECTOR": ("sum_squares",),
+    "SUM": ("sum", "sum_reciprocals"),
+    "LOG": ("sum_logs",),
+}
+
+ChunkSource = NDArray | Callable[[], Iterable[NDArray]]
+
+
+def decision_chunked(
+    source: ChunkSource,
+    w_vector: NDArray,
+    criteria_type: NDArray = None,
+    n_method: str | None = None,
+    d_method: str = "WSM",
+    folder: str | Path | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[NDArray, NDArray]:
+    """Method for making decision of alternative matrix read in chunks.
+    Result is the same as the result of decision_array method.
+
+    Args:
+        source (NDArray | Callable[[], Iterable[NDArray]]): Alternative
+            matrix, which can be memory-mapped, or function returning
+            new iterable of chunks of the alternative matrix on each call.
+        w_vector (NDArray): Weight vector.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        n_method (NDArray | None): Normalization method code name that
+            represents normalization method which is used to normalize alternatives.
+        d_method (str | None): Scoring method code name, one of
+            "WSM", "WPM", "WPM_LOG" and "TOPSIS". Defaults to "WSM".
+        folder (str | Path | None, optional): Folder where score vector
+            and rank vector are saved as memory-mapped files "score.npy"
+            and "rank.npy". Defaults to None, which keeps them in memory.
+        chunk_size (int, optional): Number of alternatives in one chunk
+            of an array source. Defaults to 1048576.
+
+    Raises:
+        ValueError: If shapes of the chunks, weight vector
+            and criteria type vector are not correct.
+        ValueError: If normalization or scoring method is not supported.
+
+    Returns score vector and rank vector.
+    """
+    scorer = ChunkedScorer(
+        source, w_vector, criteria_type, n_method, d_method, chunk_size
+    )
+    size = scorer.count()
+    dtype = get_dtype()
+
+    if folder is None:
+        score = np.empty(size, dtype)
+        rank = np.empty(size, int)
+    else:
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        score = np.lib.format.open_memmap(
+            folder / "score.npy", mode="w+", dtype=dtype, shape=(size,)
+        )
+        rank = np.lib.format.open_memmap(
+            folder / "rank.npy", mode="w+", dtype=int, shape=(size,)
+        )
+
+    for start, chunk_score in scorer.scores():
+        score[start:start + chunk_score.shape[0]] = chunk_score
+
+    rank[:] = dense_ranking(score)
+
+    if folder is not None:
+        score.flush()
+        rank.flush()
+
+    return score, rank
+
+
+def decision_top_k(
+    source: ChunkSource,
+    w_vector: NDArray,
+    k: int,
+    criteria_type: NDArray = None,
+    n_method: str | None = None,
+    d_method: str = "WSM",
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """Method for finding k best alternatives of alternative matrix
+    read in chunks. Only k best alternatives are kept between chunks.
+
+    Args:
+        source (NDArray | Callable[[], Iterable[NDArray]]): Alternative
+            matrix, which can be memory-mapped, or function returning
+            new iterable of chunks of the alternative matrix on each call.
+        w_vector (NDArray): Weight vector.
+        k (int): Number of the best alternatives.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        n_method (NDArray | None): Normalization method code name that
+            represents normalization method which is used to normalize alternatives.
+        d_method (str | None): Scoring method code name, one of
+            "WSM", "WPM", "WPM_LOG" and "TOPSIS". Defaults to "WSM".
+        chunk_size (int, optional): Number of alternatives in one chunk
+            of an array source. Defaults to 1048576.
+
+    Raises:
+        ValueError: If k is not positive.
+        ValueError: If shapes of the chunks, weight vector
+            and criteria type vector are not correct.
+        ValueError: If normalization or scoring method is not supported.
+
+    Alternatives with equal scores are ordered by their index
+    and alternatives with NaN score are the worst.
+
+    Returns indices, scores and ranks of the best alternatives ordered
+    from the best alternative. Ranks are the same as ranks
+    of decision_chunked method.
+    """
+    if k < 1:
+        raise ValueError(f"Number of the best alternatives must be positive, got {k}.")
+
+    scorer = ChunkedScorer(
+        source, w_vector, criteria_type, n_method, d_method, chunk_size
+    )
+
+    best_indices = np.empty(0, int)
+    best_score = np.empty(0, get_dtype())
+
+    for start, chunk_score in scorer.scores():
+        indices = np.arange(start, start + chunk_score.shape[0])
+
+        # Preselects k best alternatives of the chunk
+        if chunk_score.shape[0] > k:
+            selected = np.argpartition(order_key(chunk_score), k - 1)[:k]
+            indices, chunk_score = indices[selected], chunk_score[selected]
+
+        indices = np.concatenate((best_indices, indices))
+        chunk_score = np.concatenate((best_score, chunk_score))
+
+        order = np.lexsort((indices, order_key(chunk_score)))[:k]
+        best_indices, best_score = indices[order], chunk_score[order]
+
+    return best_indices, best_score, dense_ranking(best_score)
+
+
+def order_key(score: NDArray) -> NDArray:
+    "Returns key ordering scores from the best, NaN is the worst."
+    return np.where(np.isnan(score), np.inf, -score)
+
+
+class ChunkedScorer:
+    """Scores chunks of alternative matrix with column statistics
+    of the whole matrix, which are computed on creation.
+
+    Attributes:
+        statistics (ColumnStatistics): Column statistics of the alternative
+            matrix needed by the normalization and scoring method.
+        ideals (tuple[NDArray, NDArray] | None): Positive and negative ideal
+            of the weighted normalized matrix for TOPSIS method.
+    """
+
+    def __init__(
+        self,
+        source: ChunkSource,
+        w_vector: NDArray,
+        criteria_type: NDArray = None,
+        n_method: str | None = None,
+        d_method: str = "WSM",
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """
+        Args:
+            source (NDArray | Callable[[], Iterable[NDArray]]): Alternative
+                matrix, which can be memory-mapped, or function returning
+                new iterable of chunks of the alternative matrix on each call.
+            w_vector (NDArray): Weight vector.
+            criteria_type (NDArray): Binary vector that indicates whether
+                the attribute is beneficial (True) or cost (False).
+                Defaults sets all attributes as benefitial.
+            n_method (NDArray | None): Normalization method code name.
+            d_method (str | None): Scoring method code name, one of
+                "WSM", "WPM", "WPM_LOG" and "TOPSIS". Defaults to "WSM".
+            chunk_size (int, optional): Number of alternatives in one chunk
+                of an array source. Defaults to 1048576.
+
+        Raises:
+            ValueError: If shapes of the chunks, weight vector
+                and criteria type vector are not correct.
+            ValueError: If normalization or scoring method is not supported.
+        """
+        d_method = d_method.upper()
+
+        if d_method not in CHUNKED_METHODS:
+            raise ValueError(
+                f'Error: Entered decision method "{d_method}" '
+                f"doesn`t support chunks! Expected one of {CHUNKED_METHODS}."
+            )
+
+        if n_method not in NORMALIZATION_STATISTICS:
+            raise ValueError(
+                f'Error: Entered normalization method "{n_method}" doesn`t exist!'
+            )
+
+        w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+        if w_vector.ndim != 1:
+            raise ValueError("Weight vector must have 1 dimension.")
+
+        row_size = w_vector.shape[0]
+        valid_weight_vector(w_vector, row_size)
+
+        if criteria_type is not None and len(criteria_type) != row_size:
+            raise ValueError(
+                "Criteria type and weight vector must have same size."
+            )
+
+        fields = NORMALIZATION_STATISTICS[n_method]
+
+        if d_method == "TOPSIS":
+            fields = tuple(dict.fromkeys(fields + ("max", "min")))
+
+        self.source = source
+        self.w_vector = w_vector
+        self.criteria_type = criteria_type
+        self.n_method = n_method
+        self.d_method = d_method
+        self.chunk_size = chunk_size
+
+        self.statistics = ColumnStatistics((row_size,), fields)
+
+        # The first pass, an array source needs it only for the statistics
+        if fields or not isinstance(source, np.ndarray):
+            for _, chunk in self.chunks():
+                self.statistics.update(chunk)
+
+        self.ideals = self.topsis_ideals() if d_method == "TOPSIS" else None
+
+    def count(self) -> int:
+        "Returns number of alternatives."
+        if isinstance(self.source, np.ndarray) and not self.statistics.fields:
+            return self.source.shape[0]
+
+        return self.statistics.count
+
+    def chunks(self) -> Iterator[tuple[int, NDArray]]:
+        """Yields index of the first alternative and the chunk.
+
+        Raises:
+            ValueError: If chunk is not valid alternative matrix.
+            ValueError: If chunk has wrong number of columns.
+        """
+        if isinstance(self.source, np.ndarray):
+            chunks = (
+                self.source[start:start + self.chunk_size]
+                for start in range(0, self.source.shape[0], self.chunk_size)
+            )
+        else:
+            chunks = self.source()
+
+        start = 0
+
+        for chunk in chunks:
+            chunk = np.asarray(chunk)
+            valid_alternative_matrix(chunk, 1)
+
+            if chunk.ndim != 2 or chunk.shape[1] != self.w_vector.shape[0]:
+                raise ValueError(
+                    "Alternative matrix must have "
+                    "number of columns equal to size of weight vector."
+                )
+
+            yield start, chunk
+            start += chunk.shape[0]
+
+    def normalize(self, chunk: NDArray) -> tuple[NDArray, NDArray]:
+        """Normalizes chunk with the statistics of the whole matrix.
+
+        Returns normalized chunk and boolean vector
+        that indicates new type of attributes.
+        """
+        if self.n_method is None:
+            chunk = np.asarray(chunk, dtype=get_dtype())
+            return valid_normalized_matrix(chunk), self.criteria_type
+
+        return normalize(self.n_method, chunk, self.criteria_type, self.statistics)
+
+    def topsis_ideals(self) -> tuple[NDArray, NDArray]:
+        """Determines ideals of the weighted normalized matrix.
+        Normalization is monotonic in each column, so extremes of the
+        normalized column are normalized extremes of the column.
+        """
+        extremes = np.stack((self.statistics.max, self.statistics.min))
+        normalized, criteria_type = self.normalize(extremes)
+
+        return determine_ideals(normalized * self.w_vector, criteria_type)
+
+    def score(self, chunk: NDArray) -> NDArray:
+        "Returns scores of the alternatives of the chunk."
+        normalized, _ = self.normalize(chunk)
+
+        match self.d_method:
+            case "WSM":
+                return methods.wsm_scores(normalized, self.w_vector)
+            case "WPM":
+                return methods.wpm_scores(normalized, self.w_vector)
+            case "WPM_LOG":
+                return methods.wpm_log_scores(normalized, self.w_vector)
+            case "TOPSIS":
+                return relative_closeness(normalized * self.w_vector, *self.ideals)
+
+    def scores(self) -> Iterator[tuple[int, NDArray]]:
+        "Yields index of the first alternative and scores of each chunk."
+        for start, chunk in self.chunks():
+            yield start, self.score(chunk)
@@ -0,0 +1,466 @@
+"""Decision prepared for repeated scoring with different weights.
+
+Alternatives are validated and normalized once and weight-independent
+intermediates of the scoring method (ideals, distances to the ideals,
+logarithms, preference flows) are computed on creation. Scores are sums
+of columns of these matrices multiplied by functions of the weights,
+so when only one weight changes and the other weights are rescaled
+by the same factor (for example to keep sum of the weights 1), the sums
+are updated by one column in O(m) instead of O(m * n).
+"""
+from typing import Callable, Final
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame
+
+from .main import normalize
+from .methods.ahp import valid_ahp_alternatives
+from .methods.promethee import criterion_flows
+from .methods.vikor import q_values, vikor_ranks
+from .utils.config import get_dtype
+from .utils.framing import frame_decision
+from .utils.misc import determine_ideals, dense_ranking
+from .utils.validation import valid_alternative_matrix, valid_weight_vector
+
+PREPARED_METHODS: Final = (
+    "WSM", "WPM", "WPM_LOG", "TOPSIS", "VIKOR", "AHP", "PROMETHEE"
+)
+
+MAX_UPDATES: Final = 64
+"Number of single weight updates after which the scores are recomputed."
+
+Coefficients = Callable[[NDArray], NDArray]
+
+
+class PreparedDecision:
+    """Alternative matrix prepared for scoring with different weight
+    vectors. The score method does only the weight-dependent work.
+
+    Example:
+    ```
+    prepared = PreparedDecision(a_matrix, criteria_type, "VECTOR", "TOPSIS")
+
+    for w_vector in weight_vectors:
+        score = prepared.score(w_vector)
+    ```
+
+    Attributes:
+        normalized (NDArray): Normalized alternative matrix.
+        criteria_type (NDArray): Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False)
+            after the normalization.
+        n_method (str | None): Normalization method code name.
+        d_method (str): Scoring method code name.
+        v_value (float): Maximum group utility value of VIKOR method.
+        w_vector (NDArray | None): Weight vector of the last scores.
+    """
+
+    def __init__(
+        self,
+        a_matrix: NDArray,
+        criteria_type: NDArray = None,
+        n_method: str | None = None,
+        d_method: str = "WSM",
+        v_value: float = 0.5,
+        preference: str | list[str] = "usual",
+        q_threshold: float | NDArray = None,
+        p_threshold: float | NDArray = None,
+        s_threshold: float | NDArray = None,
+    ):
+        """
+        Args:
+            a_matrix (NDArray): Alternative matrix.
+            criteria_type (NDArray): Binary vector that indicates whether
+                the attribute is beneficial (True) or cost (False).
+                Defaults sets all attributes as benefitial.
+            n_method (str | None): Normalization method code name.
+            d_method (str): Scoring method code name, one of "WSM", "WPM",
+                "WPM_LOG", "TOPSIS", "VIKOR", "AHP" and "PROMETHEE".
+                Defaults to "WSM".
+            v_value (float, optional): Maximum group utility value
+                of VIKOR method. Defaults to 0.5.
+            preference (str | list[str], optional): Preference function
+                of PROMETHEE method for all criteria or for each criterion,
+                see promethee method. Defaults to "usual".
+            q_threshold (float | NDArray, optional): Indifference threshold
+                of PROMETHEE method. Defaults to None.
+            p_threshold (float | NDArray, optional): Preference threshold
+                of PROMETHEE method. Defaults to None.
+            s_threshold (float | NDArray, optional): Gaussian threshold
+                of PROMETHEE method. Defaults to None.
+
+        Raises:
+            ValueError: If alternative matrix has not 2 dimensions.
+            ValueError: If shapes of the alternative matrix
+                and criteria type vector are not correct.
+            ValueError: If normalization or scoring method is not supported.
+            ValueError: If AHP alternative matrix row sum isn't
+                approximately equal to 1.
+            ValueError: If PROMETHEE preference function is unknown
+                or its threshold is missing.
+        """
+        d_method = d_method.upper()
+
+        if d_method not in PREPARED_METHODS:
+            raise ValueError(
+                f'Error: Entered decision method "{d_method}" '
+                f"can`t be prepared! Expected one of {PREPARED_METHODS}."
+            )
+
+        a_matrix = np.asarray(a_matrix)
+
+        if a_matrix.ndim != 2:
+            raise ValueError(
+                f"Alternative matrix must have 2 dimensions, got {a_matrix.ndim}."
+            )
+
+        valid_alternative_matrix(a_matrix)
+        row_size = a_matrix.shape[1]
+
+        if criteria_type is not None and len(criteria_type) != row_size:
+            raise ValueError(
+                "Criteria type and alternative matrix must have same number of criteria."
+            )
+
+        normalized, criteria_type = normalize(n_method, a_matrix, criteria_type)
+
+        if criteria_type is None:
+            criteria_type = np.full(row_size, True)
+
+        self.normalized = normalized
+        self.criteria_type = np.asarray(criteria_type, dtype=bool)
+        self.n_method = n_method
+        self.d_method = d_method
+        self.v_value = v_value
+        self.w_vector = None
+
+        # Weight-independent matrices, their columns are multiplied
+        # by coefficients of degree p, so coefficients of weights
+        # rescaled by factor s are multiplied by s ** p
+        self._bases: list[tuple[NDArray, Coefficients, int]] = []
+        self._sums: list[NDArray] = []
+        self._updates = 0
+
+        match d_method:
+            case "WSM":
+                self._add_basis(normalized, weights, 1)
+            case "AHP":
+                valid_ahp_alternatives(normalized)
+                self._add_basis(normalized, weights, 1)
+            case "WPM" | "WPM_LOG":
+                self._prepare_logarithms()
+            case "TOPSIS":
+                self._prepare_distances()
+            case "VIKOR":
+                self._prepare_formula()
+            case "PROMETHEE":
+                self._prepare_flows(preference, q_threshold, p_threshold, s_threshold)
+
+    def score(self, w_vector: NDArray) -> NDArray:
+        """Scores the alternatives with the weight vector.
+
+        If only one weight differs from the previous weight vector
+        and the other weights are rescaled by the same positive factor,
+        the scores are updated in O(m). VIKOR regrets of the alternatives
+        whose regret was attained at the changed criterion are recomputed.
+
+        Args:
+            w_vector (NDArray): Weight vector.
+
+        Raises:
+            ValueError: If size of the weight vector is not correct.
+            ValueError: If sum of the weights is not 1.
+
+        Scores are equal to scores of method_scores method up to rounding
+        errors, including NaN scores of normalized matrices with NaN values.
+        PROMETHEE scores with other than usual preference function are
+        equal to scores of promethee method.
+
+        Returns score vector. VIKOR scores are Q values,
+        the best alternative has the smallest value.
+        """
+        w_vector = np.asarray(w_vector, dtype=get_dtype())
+
+        if w_vector.ndim != 1:
+            raise ValueError("Weight vector must have 1 dimension.")
+
+        valid_weight_vector(w_vector, self.normalized.shape[1])
+
+        previous = self.w_vector
+        change = None
+
+        if previous is not None and self._updates < MAX_UPDATES:
+            if np.array_equal(w_vector, previous):
+                return self._scores()
+
+            change = rescaled_weight(previous, w_vector)
+
+        if change is None:
+            self._compute(w_vector)
+            self._updates = 0
+        else:
+            self._update(w_vector, *change)
+            self._updates += 1
+
+        self.w_vector = w_vector.copy()
+
+        return self._scores()
+
+    def decision(
+        self, w_vector: NDArray, frame: bool = False
+    ) -> tuple[NDArray, NDArray] | DataFrame:
+        """Scores and ranks the alternatives with the weight vector
+        as decision_array method.
+
+        Args:
+            w_vector (NDArray): Weight vector.
+            frame (bool, optional): Returns decision dataframe with score
+                and rank columns ordered from the best alternative.
+                Defaults to False.
+
+        Raises:
+            ValueError: If size of the weight vector is not correct.
+            ValueError: If sum of the weights is not 1.
+
+        Returns score vector and rank vector.
+        """
+        score = self.score(w_vector)
+
+        if self.d_method == "VIKOR":
+            rank = vikor_ranks(
+                self.normalized, self.w_vector, self.criteria_type, self.v_value
+            )
+        else:
+            rank = dense_ranking(score)
+
+        if frame:
+            return frame_decision(score, rank)
+
+        return score, rank
+
+    def _add_basis(self, matrix: NDArray, coefficients: Coefficients, degree: int):
+        "Adds weight-independent matrix stored by columns."
+        self._bases.append((np.asfortranarray(matrix), coefficients, degree))
+
+    def _prepare_logarithms(self):
+        """Logarithms of the values and counts of zeros for WPM. WPM_LOG
+        keeps NaN logarithms as weighted_logarithms, WPM counts them
+        as power ignores NaN value with zero weight."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_matrix = np.log(self.normalized)
+
+        # Zero values are counted separately as in weighted_logarithms
+        is_zero = np.isneginf(log_matrix)
+        log_matrix[is_zero] = 0.0
+
+        if self.d_method == "WPM":
+            is_nan = np.isnan(log_matrix)
+            log_matrix[is_nan] = 0.0
+
+        self._add_basis(log_matrix, weights, 1)
+        self._add_basis(is_zero.astype(log_matrix.dtype), nonzero_weights, 0)
+
+        if self.d_method == "WPM":
+            self._add_basis(is_nan.astype(log_matrix.dtype), nonzero_weights, 0)
+
+    def _prepare_distances(self):
+        """Squared distances to the column maxima and minima for TOPSIS.
+        Ideals of the weighted matrix are weighted extremes of the columns,
+        which extreme is positive depends on the criterion type
+        and sign of the weight."""
+        normalized = self.normalized
+        criteria_type = self.criteria_type
+
+        to_max = np.square(normalized - normalized.max(axis=0))
+        to_min = np.square(normalized - normalized.min(axis=0))
+
+        def maximal(w_vector: NDArray) -> NDArray:
+            return np.where(criteria_type ^ (w_vector < 0), np.square(w_vector), 0)
+
+        def minimal(w_vector: NDArray) -> NDArray:
+            return np.where(criteria_type ^ (w_vector < 0), 0, np.square(w_vector))
+
+        # Positive distances, then negative distances
+        self._add_basis(to_max, maximal, 2)
+        self._add_basis(to_min, minimal, 2)
+        self._add_basis(to_min, maximal, 2)
+        self._add_basis(to_max, minimal, 2)
+
+    def _prepare_formula(self):
+        """Weight-independent part of utility and regret measures for VIKOR.
+        NaN values of the formula (for example of criteria with equal
+        positive and negative ideal) are skipped as in utility_regret."""
+        positive_ideal, negative_ideal = determine_ideals(
+            self.normalized, self.criteria_type
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            formula = (positive_ideal - self.normalized) / (
+                positive_ideal - negative_ideal
+            )
+
+        self._formula = np.asfortranarray(formula)
+        self._add_basis(np.where(np.isnan(formula), 0, formula), weights, 1)
+
+    def _prepare_flows(
+        self,
+        preference: str | list[str],
+        q_threshold: float | NDArray,
+        p_threshold: float | NDArray,
+        s_threshold: float | NDArray,
+    ):
+        "Net flows of each criterion for PROMETHEE."
+        flows = criterion_flows(
+            self.normalized,
+            self.criteria_type,
+            preference,
+            q_threshold,
+            p_threshold,
+            s_threshold,
+        )
+
+        self._add_basis(flows, weights, 1)
+
+    def _compute(self, w_vector: NDArray):
+        "Computes all weight-dependent sums."
+        self._sums = [
+            matrix @ coefficients(w_vector)
+            for matrix, coefficients, _ in self._bases
+        ]
+
+        if self.d_method == "VIKOR":
+            self._compute_regret(w_vector)
+
+    def _update(self, w_vector: NDArray, index: int, factor: float):
+        "Updates the sums by column of the changed weight."
+        previous = self.w_vector
+
+        for sums, (matrix, coefficients, degree) in zip(self._sums, self._bases):
+            scale = factor**degree
+            old = coefficients(previous)[index]
+            new = coefficients(w_vector)[index]
+
+            if scale != 1:
+                sums *= scale
+
+            delta = new - scale * old
+
+            if delta:
+                sums += delta * matrix[:, index]
+
+        if self.d_method == "VIKOR":
+            self._update_regret(w_vector, index, factor)
+
+    def _compute_regret(self, w_vector: NDArray, rows: NDArray = slice(None)):
+        """Computes regret and criterion where it is attained. Skipped
+        values are minus infinity, so regret of alternative without
+        values is minus infinity."""
+        weighted = regret_values(self._formula[rows], w_vector)
+        attained = np.argmax(weighted, axis=1)
+        regret = weighted[np.arange(weighted.shape[0]), attained]
+
+        if isinstance(rows, slice):
+            self._regret, self._attained = regret, attained
+        else:
+            self._regret[rows], self._attained[rows] = regret, attained
+
+    def _update_regret(self, w_vector: NDArray, index: int, factor: float):
+        """Updates regret, only regrets attained at the changed criterion
+        can decrease and they are recomputed."""
+        self._regret *= factor
+
+        candidate = regret_values(self._formula[:, index], w_vector[index])
+        is_attained = self._attained == index
+
+        is_greater = ~is_attained & (candidate > self._regret)
+        self._regret[is_greater] = candidate[is_greater]
+        self._attained[is_greater] = index
+
+        if is_attained.any():
+            self._compute_regret(w_vector, np.flatnonzero(is_attained))
+
+    def _scores(self) -> NDArray:
+        "Returns scores from the current sums."
+        match self.d_method:
+            case "WSM" | "AHP":
+                return self._sums[0].copy()
+            case "WPM_LOG":
+                return np.where(self._sums[1] > 0, -np.inf, self._sums[0])
+            case "WPM":
+                # Product with NaN factor is NaN even if other factor is zero
+                score = np.where(self._sums[1] > 0, 0, np.exp(self._sums[0]))
+                return np.where(self._sums[2] > 0, np.nan, score)
+            case "TOPSIS":
+                positive, negative = closeness_distances(self._sums)
+                denominator = positive + negative
+
+                if not denominator.all():
+                    raise ValueError(
+                        """Diference of positive distance and negative distance
+                        must not be zero."""
+                    )
+
+                return negative / denominator
+            case "VIKOR":
+                regret = np.where(np.isneginf(self._regret), np.nan, self._regret)
+                return q_values(self._sums[0], regret, self.v_value)
+            case "PROMETHEE":
+                return self._sums[0] / (self.normalized.shape[0] - 1)
+
+
+def weights(w_vector: NDArray) -> NDArray:
+    "Coefficients of the weighted sums."
+    return w_vector
+
+
+def nonzero_weights(w_vector: NDArray) -> NDArray:
+    "Coefficients of the counts of zeros with nonzero weight."
+    return (w_vector != 0).astype(w_vector.dtype)
+
+
+def regret_values(formula: NDArray, w_vector: NDArray | float) -> NDArray:
+    "Returns weighted formula of VIKOR with NaN values as minus infinity."
+    weighted = formula * w_vector
+
+    return np.where(np.isnan(weighted), -np.inf, weighted)
+
+
+def closeness_distances(sums: list[NDArray]) -> tuple[NDArray, NDArray]:
+    """Returns distances to the positive and negative ideal from sums
+    of squared weighted distances to the column extremes."""
+    # Rounding errors of the updates can make zero sums slightly negative
+    positive = np.sqrt(np.maximum(sums[0] + sums[1], 0))
+    negative = np.sqrt(np.maximum(sums[2] + sums[3], 0))
+
+    return positive, negative
+
+
+def rescaled_weight(
+    previous: NDArray, w_vector: NDArray
+) -> tuple[int, float] | None:
+    """Finds the only changed weight if the other weights are rescaled
+    by the same positive factor. Ratios of the rescaled weights may differ
+    by rounding errors of the rescaling.
+
+    Returns index of the changed weight and factor of the other weights
+    or None if more weights are changed.
+    """
+    is_nonzero = previous != 0
+    ratio = np.ones(previous.shape, dtype=w_vector.dtype)
+    ratio[is_nonzero] = w_vector[is_nonzero] / previous[is_nonzero]
+
+    factor = np.median(ratio[is_nonzero]) if is_nonzero.any() else 1.0
+    tolerance = 64 * np.finfo(w_vector.dtype).eps
+
+    is_changed = np.where(
+        is_nonzero,
+        ~np.isclose(ratio, factor, rtol=tolerance, atol=0),
+        w_vector != 0,
+    )
+    changed = np.flatnonzero(is_changed)
+
+    if changed.size != 1 or not factor > 0:
+        return None
+
+    return int(changed[0]), float(factor)
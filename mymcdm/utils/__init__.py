@@ -2,24 +2,55 @@
 from .framing import (
     frame_alternatives,
     frame_criterions,
+    frame_decision,
     make_decision_matrix,
     decompose_decision_matrix,
 )
 
-from .types import Result, DecisionMatrix
+from .types import Result, DecisionMatrix, DominanceRelation, DtypePolicy
+
+from .statistics import ColumnStatistics
+
+from .cache import DecisionCache
+
+from .config import (
+    set_dtype,
+    get_dtype,
+    get_accumulate_dtype,
+    dtype_policy,
+    set_validation,
+    get_validation,
+    validation_level,
+)
 
 from .misc import (
     make_ranking,
+    dense_ranking,
     replace_fractions,
+    content_hash,
 )
 
 __all__ = [
     "frame_alternatives",
     "frame_criterions",
+    "frame_decision",
     "make_decision_matrix",
     "decompose_decision_matrix",
     "make_ranking",
+    "dense_ranking",
     "replace_fractions",
+    "content_hash",
     "Result",
     "DecisionMatrix",
+    "DominanceRelation",
+    "DtypePolicy",
+    "ColumnStatistics",
+    "DecisionCache",
+    "set_dtype",
+    "get_dtype",
+    "get_accumulate_dtype",
+    "dtype_policy",
+    "set_validation",
+    "get_validation",
+    "validation_level",
 ]
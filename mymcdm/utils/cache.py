@@ -0,0 +1,281 @@
+"""Cache of decision results and intermediate artifacts.
+
+Values are keyed by kind of the artifact (for example "decision",
+"normalized", "pairwise" or "electre") and content hash of the arrays
+and parameters, see content_hash. Recently used values are kept
+in memory, optional disk tier keeps pickled values between processes.
+"""
+import os
+import pathlib
+import pickle
+import tempfile
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Callable, Final
+
+import numpy as np
+
+MAX_ITEMS: Final = 128
+"Default number of values in the memory tier."
+
+MAX_BYTES: Final = 2**30
+"Default size of the disk tier in bytes."
+
+COUNTERS: Final = ("hits", "misses", "evictions", "disk_hits", "disk_evictions")
+
+_MISSING: Final = object()
+
+
+class DecisionCache:
+    """Cache with bounded LRU memory tier and optional size-capped
+    disk tier. Disk tier contains pickled values, so it must be
+    a folder that only trusted processes write to.
+
+    Cached values are shared, so they must not be modified.
+    NumPy arrays, also in tuples, lists and dictionaries,
+    are returned read-only.
+
+    Attributes:
+        max_items (int): Number of values in the memory tier.
+        folder (pathlib.Path | None): Folder of the disk tier.
+        max_bytes (int): Size of the disk tier in bytes.
+    """
+
+    def __init__(
+        self,
+        max_items: int = MAX_ITEMS,
+        folder: pathlib.Path | str = None,
+        max_bytes: int = MAX_BYTES,
+    ):
+        """
+        Args:
+            max_items (int, optional): Number of values in the memory tier.
+                Defaults to 128.
+            folder (pathlib.Path | str, optional): Folder of the disk tier.
+                Defaults to None, which disables the disk tier.
+            max_bytes (int, optional): Size of the disk tier in bytes.
+                Defaults to 1 GiB.
+        """
+        self.max_items = max_items
+        self.folder = None if folder is None else pathlib.Path(folder)
+        self.max_bytes = max_bytes
+
+        self._memory: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._counters: defaultdict[str, Counter] = defaultdict(Counter)
+
+        # Size of the disk tier, the folder is scanned on the first write
+        self._disk_size: int | None = None
+
+        if self.folder is not None:
+            self.folder.mkdir(parents=True, exist_ok=True)
+
+    def get(self, kind: str, key: str, default: Any = None) -> Any:
+        """Returns cached value or default value if it is not cached.
+
+        Args:
+            kind (str): Kind of the value.
+            key (str): Content hash of the value inputs.
+            default (Any, optional): Value returned on miss. Defaults to None.
+        """
+        value = self._lookup(kind, key)
+
+        return default if value is _MISSING else value
+
+    def put(self, kind: str, key: str, value: Any):
+        """Stores value in the memory tier and the disk tier.
+
+        Args:
+            kind (str): Kind of the value.
+            key (str): Content hash of the value inputs.
+            value (Any): Cached value.
+        """
+        value = read_only(value)
+
+        self._memory[(kind, key)] = value
+        self._memory.move_to_end((kind, key))
+        self._evict()
+
+        if self.folder is not None:
+            self._write(kind, key, value)
+
+    def cached(self, kind: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Returns cached value or computes and stores it.
+
+        Args:
+            kind (str): Kind of the value.
+            key (str): Content hash of the value inputs.
+            compute (Callable[[], Any]): Computes the value on miss.
+        """
+        value = self._lookup(kind, key)
+
+        if value is _MISSING:
+            # Caller gets the same read-only value as on the next hit
+            value = read_only(compute())
+            self.put(kind, key, value)
+
+        return value
+
+    def counters(self, kind: str = None) -> dict[str, int]:
+        """Returns numbers of hits, misses, evictions, disk hits
+        and disk evictions.
+
+        Args:
+            kind (str, optional): Kind of the values.
+                Defaults to None, which sums all kinds.
+        """
+        if kind is not None:
+            counter = self._counters[kind]
+        else:
+            counter = sum(self._counters.values(), Counter())
+
+        return {name: counter[name] for name in COUNTERS}
+
+    def clear(self, disk: bool = False):
+        """Removes values from the memory tier.
+
+        Args:
+            disk (bool, optional): Removes also files of the disk tier.
+                Defaults to False.
+        """
+        self._memory.clear()
+
+        if disk and self.folder is not None:
+            for path in self.folder.glob("*/*.pkl"):
+                path.unlink(missing_ok=True)
+
+            self._disk_size = 0
+
+    def _lookup(self, kind: str, key: str) -> Any:
+        "Returns cached value or _MISSING and updates counters."
+        counter = self._counters[kind]
+
+        if (kind, key) in self._memory:
+            self._memory.move_to_end((kind, key))
+            counter["hits"] += 1
+
+            return self._memory[(kind, key)]
+
+        value = _MISSING if self.folder is None else self._read(kind, key)
+
+        if value is _MISSING:
+            counter["misses"] += 1
+            return value
+
+        counter["hits"] += 1
+        counter["disk_hits"] += 1
+
+        # Value read from the disk is moved to the memory tier
+        self._memory[(kind, key)] = value
+        self._evict()
+
+        return value
+
+    def _evict(self):
+        "Removes the least recently used values from the memory tier."
+        while len(self._memory) > self.max_items:
+            (kind, _), _ = self._memory.popitem(last=False)
+            self._counters[kind]["evictions"] += 1
+
+    def _path(self, kind: str, key: str) -> pathlib.Path:
+        return self.folder / kind / f"{key}.pkl"
+
+    def _read(self, kind: str, key: str) -> Any:
+        "Reads value from the disk tier or returns _MISSING."
+        path = self._path(kind, key)
+
+        try:
+            with open(path, "rb") as cache_file:
+                value = pickle.load(cache_file)
+
+            # Modification time orders files from the least recently used
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return _MISSING
+
+        return read_only(value)
+
+    def _write(self, kind: str, key: str, value: Any):
+        """Writes value atomically to the disk tier. Size of the tier
+        is updated with each write, files are scanned and evicted only
+        when the size exceeds the limit."""
+        path = self._path(kind, key)
+        path.parent.mkdir(exist_ok=True)
+
+        # Unique temporary file, threads may write the same key at once
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as cache_file:
+            temporary = pathlib.Path(cache_file.name)
+
+            try:
+                pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                cache_file.close()
+                temporary.unlink(missing_ok=True)
+                raise
+
+        if self._disk_size is None:
+            self._disk_size = sum(size for _, size, _ in self._disk_files())
+
+        self._disk_size += temporary.stat().st_size - file_size(path)
+
+        os.replace(temporary, path)
+
+        if self._disk_size > self.max_bytes:
+            self._evict_disk()
+
+    def _disk_files(self) -> list[tuple[float, int, pathlib.Path]]:
+        "Returns modification time, size and path of the disk tier files."
+        files = []
+
+        for cached_path in self.folder.glob("*/*.pkl"):
+            try:
+                stat = cached_path.stat()
+            except FileNotFoundError:
+                continue
+
+            files.append((stat.st_mtime, stat.st_size, cached_path))
+
+        return files
+
+    def _evict_disk(self):
+        """Removes the least recently used files from the disk tier.
+        The folder is scanned, so also files written by other processes
+        are counted."""
+        files = self._disk_files()
+        size = sum(file_size for _, file_size, _ in files)
+
+        for _, file_size, cached_path in sorted(files, key=lambda file: file[0]):
+            if size <= self.max_bytes:
+                break
+
+            cached_path.unlink(missing_ok=True)
+            size -= file_size
+
+            self._counters[cached_path.parent.name]["disk_evictions"] += 1
+
+        self._disk_size = size
+
+
+def file_size(path: pathlib.Path) -> int:
+    "Returns size of the file or 0 if it does not exist."
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def read_only(value: Any) -> Any:
+    """Replaces NumPy arrays of the value and of its tuple, list
+    and dictionary items by read-only views, so the original
+    arrays stay writeable."""
+    if isinstance(value, (tuple, list)):
+        return type(value)(read_only(item) for item in value)
+
+    if isinstance(value, dict):
+        return {key: read_only(item) for key, item in value.items()}
+
+    if isinstance(value, np.ndarray):
+        value = value.view()
+        value.flags.writeable = False
+
+    return value
@@ -0,0 +1,152 @@
+"""Configuration of the floating point precision and validation level.
+
+All normalizations, weighting methods, scoring methods and loaded data
+use the working dtype of the policy. Reductions over alternatives
+(column sums, sums of squares, products, means and deviations) use
+the accumulation dtype and the result is cast back to the working dtype.
+
+The unit roundoff of float32 is 2**-24 (about 6e-8) and of float64
+is 2**-53 (about 1.1e-16). Elementwise operations have relative error
+of one unit roundoff. NumPy sums with pairwise summation, so the relative
+error of a column sum of m values is about log2(m) unit roundoffs
+of the accumulation dtype, which keeps float32 column sums of millions
+of alternatives accurate to about 1e-6, or to about 1e-15 with float64
+accumulation. Weighted score of n criteria then has relative error about
+n unit roundoffs of the working dtype. Methods that subtract close values
+(TOPSIS distances, VIKOR and max-min normalization) lose more digits,
+their float32 scores typically differ from float64 scores by about 1e-5
+relatively. Alternatives with closer scores may be ranked in different
+order than with float64.
+
+Validation level sets how often inputs are checked. In the "strict"
+level every method checks its inputs and alternative matrices and weight
+vectors must also contain only finite numbers. In the "once" level checks
+passed by the data are recorded on the data and methods called on the same
+data skip them. In the "trusted" level inputs are not checked at all.
+"""
+from contextlib import contextmanager
+from typing import Final, Iterator
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from .types import DtypePolicy
+
+FLOAT_DTYPES: Final = ("float32", "float64")
+
+VALIDATION_LEVELS: Final = ("strict", "once", "trusted")
+
+_policy: DtypePolicy = {
+    "dtype": np.dtype(np.float64),
+    "accumulate": np.dtype(np.float64),
+}
+
+_validation: dict[str, str] = {"level": "once"}
+
+
+def set_dtype(dtype: DTypeLike = "float64", accumulate: DTypeLike = None):
+    """Sets the dtype policy.
+
+    Args:
+        dtype (DTypeLike, optional): Working dtype. Defaults to "float64".
+        accumulate (DTypeLike, optional): Dtype of the reductions
+            over alternatives. Defaults to None, which uses
+            the working dtype.
+
+    Raises:
+        ValueError: If dtype is not float32 or float64.
+    """
+    dtype = valid_float_dtype(dtype)
+    accumulate = dtype if accumulate is None else valid_float_dtype(accumulate)
+
+    _policy["dtype"] = dtype
+    _policy["accumulate"] = accumulate
+
+
+def get_dtype() -> np.dtype:
+    "Returns working dtype of the policy."
+    return _policy["dtype"]
+
+
+def get_accumulate_dtype() -> np.dtype:
+    "Returns dtype of the reductions over alternatives."
+    return _policy["accumulate"]
+
+
+@contextmanager
+def dtype_policy(
+    dtype: DTypeLike = "float64", accumulate: DTypeLike = None
+) -> Iterator[DtypePolicy]:
+    """Context manager that sets the dtype policy
+    and restores the previous one at the end.
+
+    Args:
+        dtype (DTypeLike, optional): Working dtype. Defaults to "float64".
+        accumulate (DTypeLike, optional): Dtype of the reductions
+            over alternatives. Defaults to None, which uses
+            the working dtype.
+    """
+    previous = dict(_policy)
+    set_dtype(dtype, accumulate)
+
+    try:
+        yield dict(_policy)
+    finally:
+        _policy.update(previous)
+
+
+def valid_float_dtype(dtype: DTypeLike) -> np.dtype:
+    """Checks dtype of the policy.
+
+    Raises:
+        ValueError: If dtype is not float32 or float64.
+    """
+    dtype = np.dtype(dtype)
+
+    if dtype.name not in FLOAT_DTYPES:
+        raise ValueError(
+            f"Unsupported dtype {dtype.name}. Expected one of {FLOAT_DTYPES}."
+        )
+
+    return dtype
+
+
+def set_validation(level: str = "once"):
+    """Sets the validation level.
+
+    Args:
+        level (str, optional): Validation level, one of "strict", "once"
+            and "trusted". Defaults to "once".
+
+    Raises:
+        ValueError: If validation level is unknown.
+    """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            f"Unknown validation level \"{level}\". Expected one of {VALIDATION_LEVELS}."
+        )
+
+    _validation["level"] = level
+
+
+def get_validation() -> str:
+    "Returns the validation level."
+    return _validation["level"]
+
+
+@contextmanager
+def validation_level(level: str = "once") -> Iterator[str]:
+    """Context manager that sets the validation level
+    and restores the previous one at the end.
+
+    Args:
+        level (str, optional): Validation level, one of "strict", "once"
+            and "trusted". Defaults to "once".
+    """
+    previous = get_validation()
+    set_validation(level)
+
+    try:
+        yield level
+    finally:
+        _validation["level"] = previous
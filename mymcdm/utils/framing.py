@@ -67,6 +67,26 @@ def frame_criterions(
     return Series(w_vector, index, name="weights")
 
 
+def frame_decision(
+    score: NDArray, rank: NDArray, row_names: NDArray = None
+) -> DataFrame:
+    """Takes score vector and rank vector and returns decision Dataframe
+    ordered from the best alternative.
+
+    Args:
+        score (NDArray): Score vector.
+        rank (NDArray): Rank vector.
+        row_names (NDArray, optional): Name for the row indices.
+            Defaults set indices as A1, A2,...
+    """
+    if row_names is None:
+        row_names = [f"A{i + 1}" for i in range(score.shape[0])]
+
+    decision_dataframe = DataFrame({"score": score, "rank": rank}, row_names)
+
+    return decision_dataframe.sort_values("rank", kind="stable")
+
+
 def make_decision_matrix(a_dataframe: DataFrame, w_series: Series) -> DataFrame:
     """Takes alternatives dataframe and weight series and returns decision matrix.
 
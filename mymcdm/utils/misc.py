@@ -1,4 +1,6 @@
 "Miscellaneous auxiliary functions."
+import hashlib
+
 import numpy as np
 from pandas import Series
 from numpy.typing import NDArray
@@ -11,50 +13,63 @@ def determine_ideals(
     Tuple of positive ideal and negative ideal.
 
     Args:
-        matrix (NDArray): Input matrix.
+        matrix (NDArray): Input matrix or stack of matrices.
         criteria_type (NDArray): Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
 
     """
-    row_size = matrix.shape[1]
+    matrix = np.asarray(matrix)
+    row_size = matrix.shape[-1]
 
     if criteria_type is None:
         criteria_type = np.full(row_size, True)
 
-    positive_ideal = []
-    negative_ideal = []
+    criteria_type = np.asarray(criteria_type, dtype=bool)
 
-    max_vector = matrix.max(axis=0)
-    min_vector = matrix.min(axis=0)
+    max_vector = matrix.max(axis=-2)
+    min_vector = matrix.min(axis=-2)
 
-    for max, min, val in zip(max_vector, min_vector, criteria_type):
-        if val:
-            positive_ideal.append(max)
-            negative_ideal.append(min)
-        else:
-            positive_ideal.append(min)
-            negative_ideal.append(max)
+    positive_ideal = np.where(criteria_type, max_vector, min_vector)
+    negative_ideal = np.where(criteria_type, min_vector, max_vector)
 
-    return np.array(positive_ideal), np.array(negative_ideal)
+    return positive_ideal, negative_ideal
 
 
 def make_ranking(score: Series) -> Series:
     "From given alternative score creates ranking."
-    ranking = []
-    previous = score[0]
-    rank = 1
-
-    for alt in score:
-        if alt != previous:
-            rank += 1
+    values = score.to_numpy()
 
-        ranking.append(rank)
-        previous = alt
+    ranking = np.ones(values.shape[0], dtype=int)
+    ranking[1:] += np.cumsum(values[1:] != values[:-1])
 
     return Series(ranking, score.index)
 
 
+def dense_ranking(score: NDArray, ascending: bool = False) -> NDArray:
+    """From given score vector or matrix creates ranking along the last axis.
+    Equal scores have the same rank and the next score has the next rank
+    as in make_ranking method.
+
+    Args:
+        score (NDArray): Score vector or matrix.
+        ascending (bool, optional): The best alternative has the smallest
+            score. Defaults to False.
+    """
+    score = np.asarray(score)
+    order = np.argsort(score if ascending else -score, axis=-1, kind="stable")
+    ordered = np.take_along_axis(score, order, axis=-1)
+
+    is_new = ordered[..., 1:] != ordered[..., :-1]
+    ordered_rank = np.ones(ordered.shape, dtype=int)
+    ordered_rank[..., 1:] += np.cumsum(is_new, axis=-1)
+
+    ranking = np.empty(ordered.shape, dtype=int)
+    np.put_along_axis(ranking, order, ordered_rank, axis=-1)
+
+    return ranking
+
+
 def replace_fractions(matrix: NDArray | list) -> NDArray:
     """Replace string fractions in numpy matrix and returns
     matrix with floats. Accuracy is to 16 decimal places.
@@ -70,25 +85,154 @@ def replace_fractions(matrix: NDArray | list) -> NDArray:
     # Output
     [12, 0.3333333333333333, 0.2, 0.14285714285714285, 0.125]
     ```
+
+    Numeric matrix is converted directly without strings, otherwise
+    only unique fractions are parsed.
+
+    Raises:
+        ValueError: If rows of the matrix have different lengths.
+        ValueError: If value is not number or fraction.
     """
-    matrix = np.array(matrix, dtype="<U32")
+    try:
+        matrix = np.asarray(matrix)
+    except ValueError:
+        raise ValueError("Data must be matrix with rows of the same length.")
+
+    # Matrix of numbers has no fractions
+    if matrix.dtype.kind in "iuf":
+        return matrix.astype("f8")
+
+    shape = matrix.shape
+    matrix = np.atleast_1d(matrix).ravel()
+
+    if matrix.dtype.kind == "O":
+        # Only strings and numbers are accepted, booleans and None are not
+        is_string = np.frompyfunc(is_string_value, 1, 1)(matrix).astype(bool)
+        is_number = np.frompyfunc(is_number_value, 1, 1)(matrix).astype(bool)
+    else:
+        is_string = np.full(matrix.shape, matrix.dtype.kind in "US")
+        is_number = np.zeros(matrix.shape, dtype=bool)
+
+    if not (is_string | is_number).all():
+        raise fraction_error(matrix)
+
+    result = np.empty(matrix.shape, dtype="f8")
+    result[is_number] = matrix[is_number].astype("f8")
+
+    strings = matrix[is_string].astype(str)
+
+    is_fraction = np.char.find(strings, "/") >= 0
+    fractions, inverse = np.unique(strings[is_fraction], return_inverse=True)
+
+    values = np.empty(strings.shape, dtype="f8")
+
+    try:
+        values[~is_fraction] = strings[~is_fraction].astype("f8")
+        values[is_fraction] = parse_fractions(fractions)[inverse]
+    except ValueError:
+        raise fraction_error(matrix)
+
+    result[is_string] = values
+
+    return result.reshape(shape)
+
+
+def is_string_value(value) -> bool:
+    "Returns True if value is string."
+    return isinstance(value, str)
+
 
-    uniq = np.unique(matrix)
-    mask = np.frompyfunc(lambda x: "/" in x, 1, 1)(uniq)
-    mask = np.array(mask, dtype=bool)
+def is_number_value(value) -> bool:
+    "Returns True if value is integer or float, but not boolean."
+    return (
+        isinstance(value, (int, float, np.integer, np.floating))
+        and not isinstance(value, bool)
+    )
 
-    fractions = uniq[mask]
 
-    for fraction in fractions:
-        mask = matrix == fraction
+def fraction_error(matrix: NDArray) -> ValueError:
+    "Returns error with the first value of matrix that is not a number or fraction."
+    return ValueError(
+        "Data must be number of fraction in form \"x/y\" "
+        "where x, y is numbers and y must not be zero. "
+        f"Value {invalid_fraction(matrix)} was provided."
+    )
+
+
+def parse_fractions(fractions: NDArray) -> NDArray:
+    """Parses vector of string fractions in form \"x/y\"
+    where x, y are integers. Integers out of the int64 range
+    are parsed one by one as Python integers.
+
+    Raises:
+        ValueError: If fraction is not valid or y is zero.
+    """
+    parts = np.char.partition(fractions, "/")
+
+    try:
+        numerator = parts[..., 0].astype(np.int64)
+        denominator = parts[..., 2].astype(np.int64)
+    except OverflowError:
+        return np.array(
+            [parse_fraction(fraction) for fraction in fractions], dtype="f8"
+        )
+
+    if not denominator.all():
+        raise ValueError("Denominator must not be zero.")
+
+    return numerator / denominator
+
+
+def parse_fraction(fraction: str) -> float:
+    """Parses one string fraction in form \"x/y\" with Python integers.
+
+    Raises:
+        ValueError: If fraction is not valid, y is zero or the value
+            is out of the float range.
+    """
+    numerator, _, denominator = fraction.partition("/")
+
+    try:
+        return int(numerator) / int(denominator)
+    except (ZeroDivisionError, OverflowError) as error:
+        raise ValueError(f"Invalid fraction {fraction}.") from error
+
+
+def invalid_fraction(matrix: NDArray) -> str:
+    "Returns the first value of matrix that is not a number or fraction."
+    for value in matrix.flat:
+        value = str(value)
+
         try:
-            numerator, denominator = fraction.split("/")
-            matrix[mask] = int(numerator) / int(denominator)
-        except Exception:
-            raise ValueError(
-                "Data must be number of fraction in form \"x/y\" "
-                "where x, y is numbers and y must not be zero. "
-                f"Value {fraction} was provided."
-            )
-
-    return matrix.astype("f8")
+            if "/" in value:
+                numerator, denominator = value.split("/")
+                int(numerator) / int(denominator)
+            else:
+                float(value)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return value
+
+
+def content_hash(*values: NDArray | str | float | None) -> str:
+    """Returns hash of the content of arrays and parameters. Arrays
+    with the same values, dtype and shape have the same hash regardless
+    of their memory layout, so the hash identifies a decision problem.
+
+    Args:
+        values (NDArray | str | float | None): Hashed arrays and parameters.
+
+    Returns hexadecimal BLAKE2b digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    for value in values:
+        array = np.asarray(value)
+
+        if array.dtype.hasobject:
+            digest.update(f"object:{value!r};".encode("utf-8"))
+            continue
+
+        digest.update(f"{array.dtype.str}{array.shape};".encode("ascii"))
+        digest.update(np.ascontiguousarray(array).data)
+
+    return digest.hexdigest()
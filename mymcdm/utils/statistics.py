@@ -0,0 +1,192 @@
+"""Column statistics of alternative matrices.
+
+Statistics of all columns are computed in one pass over blocks of rows,
+so each block is read from the memory only once. The same statistics
+can be passed to more normalization methods.
+"""
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .config import get_accumulate_dtype
+
+STATISTICS: Final = ("max", "min", "sum", "sum_squares", "sum_reciprocals", "sum_logs")
+
+BLOCK_SIZE: Final = 2**16
+"Number of rows of the alternative matrix in one block."
+
+
+class ColumnStatistics:
+    """Statistics of the columns of alternative matrix or stack
+    of alternative matrices. Statistics that were not requested are None.
+
+    Attributes:
+        fields (tuple[str, ...]): Names of the computed statistics.
+        count (int): Number of alternatives.
+        max (NDArray | None): Maximum of each column.
+        min (NDArray | None): Minimum of each column.
+        sum (NDArray | None): Sum of each column.
+        sum_squares (NDArray | None): Sum of squares of each column.
+        sum_reciprocals (NDArray | None): Sum of reciprocal values
+            of each column.
+        sum_logs (NDArray | None): Sum of natural logarithms
+            of each column.
+    """
+
+    def __init__(self, shape: tuple[int, ...], fields: tuple[str, ...] = STATISTICS):
+        """
+        Args:
+            shape (tuple[int, ...]): Shape of the statistics, that is shape
+                of the alternative matrix without the axis of alternatives.
+            fields (tuple[str, ...], optional): Names of the statistics.
+                Defaults to all statistics.
+
+        Raises:
+            ValueError: If name of the statistic is unknown.
+        """
+        for field in fields:
+            if field not in STATISTICS:
+                raise ValueError(
+                    f"Unknown statistic \"{field}\". Expected one of {STATISTICS}."
+                )
+
+        dtype = get_accumulate_dtype()
+
+        self.fields = tuple(fields)
+        self.count = 0
+
+        self.max = np.full(shape, -np.inf, dtype) if "max" in fields else None
+        self.min = np.full(shape, np.inf, dtype) if "min" in fields else None
+
+        for field in STATISTICS[2:]:
+            value = np.zeros(shape, dtype) if field in fields else None
+            setattr(self, field, value)
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: NDArray,
+        fields: tuple[str, ...] = STATISTICS,
+        block_size: int = BLOCK_SIZE,
+    ) -> "ColumnStatistics":
+        """Computes statistics of the matrix in one pass over blocks of rows.
+
+        Args:
+            matrix (NDArray): Alternative matrix or stack of alternative
+                matrices, alternatives are on the axis -2.
+            fields (tuple[str, ...], optional): Names of the statistics.
+                Defaults to all statistics.
+            block_size (int, optional): Number of rows in one block.
+                Defaults to 65536.
+        """
+        matrix = np.asarray(matrix)
+        statistics = cls(matrix.shape[:-2] + matrix.shape[-1:], fields)
+
+        for start in range(0, matrix.shape[-2], block_size):
+            statistics.update(matrix[..., start:start + block_size, :])
+
+        return statistics
+
+    def update(self, block: NDArray):
+        """Adds rows of the block to the statistics.
+
+        Args:
+            block (NDArray): Rows of the alternative matrix.
+        """
+        dtype = get_accumulate_dtype()
+
+        if self.max is not None:
+            np.maximum(self.max, block.max(axis=-2), out=self.max)
+
+        if self.min is not None:
+            np.minimum(self.min, block.min(axis=-2), out=self.min)
+
+        if self.sum is not None:
+            self.sum += np.sum(block, axis=-2, dtype=dtype)
+
+        if self.sum_squares is not None:
+            self.sum_squares += np.einsum(
+                "...ij,...ij->...j", block, block, dtype=dtype
+            )
+
+        with np.errstate(divide="ignore"):
+            if self.sum_reciprocals is not None:
+                self.sum_reciprocals += np.sum(1 / block, axis=-2, dtype=dtype)
+
+            if self.sum_logs is not None:
+                self.sum_logs += np.sum(np.log(block), axis=-2, dtype=dtype)
+
+        self.count += block.shape[-2]
+
+    def merge(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        """Adds statistics of other rows of the same alternative matrix.
+
+        Args:
+            other (ColumnStatistics): Statistics of other rows.
+
+        Raises:
+            ValueError: If the statistics do not have the same fields.
+
+        Returns the statistics itself.
+        """
+        if self.fields != other.fields:
+            raise ValueError("Merged statistics must have the same fields.")
+
+        if self.max is not None:
+            np.maximum(self.max, other.max, out=self.max)
+
+        if self.min is not None:
+            np.minimum(self.min, other.min, out=self.min)
+
+        for field in STATISTICS[2:]:
+            value = getattr(self, field)
+
+            if value is not None:
+                value += getattr(other, field)
+
+        self.count += other.count
+
+        return self
+
+    def require(self, fields: tuple[str, ...], shape: tuple[int, ...]):
+        """Checks that the statistics have the columns of the matrix
+        of the given shape and contain the given fields. The matrix
+        can be only a chunk of the matrix of the statistics.
+
+        Raises:
+            ValueError: If shape of the statistics is not correct.
+            ValueError: If some statistic is missing.
+        """
+        expected = tuple(shape[:-2]) + tuple(shape[-1:])
+        value = getattr(self, self.fields[0]) if self.fields else None
+
+        if value is not None and value.shape != expected:
+            raise ValueError(
+                "Column statistics do not belong to the alternative matrix."
+            )
+
+        missing = [field for field in fields if field not in self.fields]
+
+        if missing:
+            raise ValueError(f"Missing column statistics {missing}.")
+
+
+def column_statistics(
+    matrix: NDArray,
+    statistics: ColumnStatistics | None,
+    fields: tuple[str, ...],
+) -> ColumnStatistics:
+    """Returns given statistics of the matrix or computes them
+    if they are not given.
+
+    Raises:
+        ValueError: If given statistics do not belong to the matrix.
+        ValueError: If some statistic is missing.
+    """
+    if statistics is None:
+        return ColumnStatistics.from_matrix(matrix, fields)
+
+    statistics.require(fields, matrix.shape)
+
+    return statistics
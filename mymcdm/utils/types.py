@@ -3,15 +3,48 @@
 from typing import TypedDict
 from pathlib import Path
 
+import numpy as np
 from pandas import DataFrame, Series
 from numpy.typing import NDArray
 
 
+class DtypePolicy(TypedDict):
+    """Floating point precision typed dictionary.
+
+    Attributes:
+        dtype (numpy.dtype): Working dtype of the matrices and vectors.
+        accumulate (numpy.dtype): Dtype of the reductions over alternatives.
+    """
+
+    dtype: np.dtype
+    accumulate: np.dtype
+
+
+class DominanceRelation(TypedDict):
+    """Compact dominance relation typed dictionary from ELECTRE method.
+    Alternative k dominates alternative l when there is an edge (k, l)
+    or the bit l is set in row k. Only one of the forms is present,
+    the other values are None.
+
+    Attributes:
+        size (int): Number of alternatives.
+        rows (NDArray | None): Dominating alternatives of the edges.
+        cols (NDArray | None): Dominated alternatives of the edges.
+        bits (NDArray | None): Dominance matrix packed by rows
+            with numpy.packbits.
+    """
+
+    size: int
+    rows: NDArray | None
+    cols: NDArray | None
+    bits: NDArray | None
+
+
 class Result(TypedDict):
     """Result typed dictionary from decision method.
 
     Attributes:
-        decision (DataFrame): Decision result.
+        decision (DataFrame | DominanceRelation): Decision result.
         alternatives (DataFrame): Alternative Dataframe.
             weights (Series): Weight Series.
         criteria_type (NDArray): Binary vector that indicates whether
@@ -23,7 +56,7 @@ class Result(TypedDict):
         path (Path | str | None): Path to the output file.
     """
 
-    decision: DataFrame
+    decision: DataFrame | DominanceRelation
     alternatives: DataFrame
     weights: Series
     criteria_type: NDArray
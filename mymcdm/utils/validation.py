@@ -1,11 +1,122 @@
-"Functions for validating data."
+"""Functions for validating data.
+
+In the "once" validation level passed checks are recorded on the data
+(array or dataframe) and repeated checks of the same data are skipped.
+Record is dropped when the data is garbage collected or its shape
+or dtypes change.
+Checks of the values ("normalized", "column_sums") are recorded only
+on read-only arrays and on data created by the package, because values
+of writeable data can change without changing the data object.
+"""
+import weakref
 from math import isclose
 from functools import wraps
+from typing import Any, Final
 
 import numpy as np
 from pandas import DataFrame
 from numpy.typing import NDArray
 
+from .config import get_dtype, get_validation
+from .statistics import ColumnStatistics
+from .workspace import NormalizationWorkspace
+
+VALUE_CHECKS: Final = ("normalized", "column_sums")
+
+_records: dict[int, tuple[weakref.ref, tuple, set[str]]] = {}
+
+
+def data_layout(data: Any) -> tuple:
+    """Returns shape and dtypes of the data, which must not change
+    for the recorded checks to stay valid."""
+    if isinstance(data, DataFrame):
+        return data.shape, tuple(data.dtypes)
+
+    return np.shape(data), getattr(data, "dtype", None)
+
+
+def alternatives_check(min_rows: int = 2) -> str:
+    "Returns name of the alternative matrix check with the minimal number of rows."
+    return f"alternatives:{min_rows}"
+
+
+def is_checked(data: Any, *checks: str) -> bool:
+    """Returns True if the checks of the data can be skipped, that is
+    in the "trusted" validation level or in the "once" level if the data
+    passed the checks."""
+    level = get_validation()
+
+    if level != "once":
+        return level == "trusted"
+
+    record = _records.get(id(data))
+
+    return (
+        record is not None
+        and record[0]() is data
+        and record[1] == data_layout(data)
+        and record[2].issuperset(checks)
+    )
+
+
+def record_checks(data: Any, *checks: str, owned: bool = False):
+    """Records checks passed by the data in the "once" validation level.
+
+    Args:
+        data (Any): Array or dataframe.
+        checks (str): Names of the passed checks.
+        owned (bool, optional): Data was created by the package and it is
+            not modified, so also checks of the values are recorded.
+            Defaults to False.
+    """
+    if get_validation() != "once":
+        return
+
+    writeable = not isinstance(data, np.ndarray) or data.flags.writeable
+
+    if writeable and not owned:
+        checks = tuple(check for check in checks if check not in VALUE_CHECKS)
+
+    if not checks:
+        return
+
+    key = id(data)
+    record = _records.get(key)
+    layout = data_layout(data)
+
+    if record is None or record[0]() is not data or record[1] != layout:
+        try:
+            reference = weakref.ref(data, lambda ref: forget_checks(key, ref))
+        except TypeError:
+            # Lists and other values without weak references are not recorded
+            return
+
+        record = (reference, layout, set())
+        _records[key] = record
+
+    record[2].update(checks)
+
+
+def forget_checks(key: int, reference: weakref.ref):
+    "Removes record of garbage collected data."
+    record = _records.get(key)
+
+    if record is not None and record[0] is reference:
+        del _records[key]
+
+
+def all_finite(matrix: NDArray) -> bool:
+    """Returns True if matrix contains only finite numbers. Values are read
+    in one pass by a sum, which is not finite if some value is NaN
+    or infinity. Only a sum that overflows is checked value by value."""
+    if not np.issubdtype(matrix.dtype, np.inexact):
+        return True
+
+    if np.isfinite(np.add.reduce(matrix, axis=None)):
+        return True
+
+    return bool(np.isfinite(matrix).all())
+
 
 def valid_normalized_matrix(matrix: NDArray) -> NDArray:
     """Checks if matrix is normalized in range [0, 1].
@@ -13,40 +124,72 @@ def valid_normalized_matrix(matrix: NDArray) -> NDArray:
     Raises:
         ValueError: If number in matrix is not in range [0,1].
     """
-    is_numer_in_range = np.logical_and(matrix >= 0, matrix <= 1)
-    if not is_numer_in_range.all():
+    if is_checked(matrix, "normalized"):
+        return matrix
+
+    # Minimum and maximum are NaN if some value is NaN
+    if matrix.size and not (np.min(matrix) >= 0 and np.max(matrix) <= 1):
         raise ValueError(
             "Data must be normalized (into the range [0, 1]) "
             "in order to apply scoring methods."
         )
 
+    record_checks(matrix, "normalized")
+
     return matrix
 
 
-def valid_scoring_args(a_dataframe: DataFrame, w_vector: NDArray):
-    """Checks scoring arguments.
+def valid_scoring_args(a_dataframe: DataFrame | NDArray, w_vector: NDArray):
+    """Checks scoring arguments. Alternatives can be dataframe or array,
+    weight vector can be also matrix where each row is one weight vector.
 
     Raises:
         ValueError: If shapes of the alternative dataframe and
             weight vector are not correct.
         ValueError: If sum of the weights is not 1.
     """
-    valid_alternative_matrix(a_dataframe.to_numpy())
+    valid_alternative_matrix(a_dataframe)
+    valid_weight_vector(w_vector, a_dataframe.shape[-1])
 
-    if a_dataframe.shape[1] != len(w_vector):
+
+def valid_weight_vector(w_vector: NDArray, row_size: int):
+    """Checks weight vector or matrix where each row is one weight vector.
+
+    Raises:
+        ValueError: If size of the weight vector is not equal
+            to number of columns of alternative matrix.
+        ValueError: If sum of the weights is not 1.
+        ValueError: If weight is not finite in the "strict" validation level.
+    """
+    if get_validation() == "trusted":
+        return
+
+    w_vector = np.asarray(w_vector)
+
+    if get_validation() == "strict" and not all_finite(w_vector):
+        raise ValueError("Weight vector must contain only finite numbers.")
+
+    if row_size != w_vector.shape[-1]:
         raise ValueError(
             "Alternative matrix must have "
             "number of columns equal to size of weight vector."
         )
 
-    weights_sum = np.sum(w_vector)
+    # Rounding error of the weights in single precision
+    rel_tol = 1e-09
 
-    if not isclose(weights_sum, 1):
-        raise ValueError(f"Sum of the weight vector is {weights_sum} and must be 1.")
+    if np.issubdtype(w_vector.dtype, np.floating):
+        rel_tol = max(rel_tol, row_size * np.finfo(w_vector.dtype).eps)
+
+    for weights_sum in np.atleast_1d(np.sum(w_vector, axis=-1)).flat:
+        if not isclose(weights_sum, 1, rel_tol=rel_tol):
+            raise ValueError(
+                f"Sum of the weight vector is {weights_sum} and must be 1."
+            )
 
 
 def valid_scoring_args_extended(
-    a_dataframe: DataFrame, w_vector: NDArray, criteria_type: NDArray
+    a_dataframe: DataFrame | NDArray, w_vector: NDArray, criteria_type: NDArray
 ):
     """Checks scoring arguments.
 
@@ -57,31 +200,54 @@ def valid_scoring_args_extended(
     """
     valid_scoring_args(a_dataframe, w_vector)
 
-    if criteria_type is not None and len(criteria_type) != len(w_vector):
+    if get_validation() == "trusted":
+        return
+
+    if criteria_type is not None and len(criteria_type) != np.shape(w_vector)[-1]:
         raise ValueError(
             "Criteria type and weight vector must have same size."
         )
 
 
-def valid_alternative_matrix(input: any):
-    """Checks if input value is valid alternative matrix.
+def valid_alternative_matrix(input: any, min_rows: int = 2):
+    """Checks if input value is valid alternative matrix
+    or stack of alternative matrices.
+
+    Args:
+        input (any): Checked value, array or dataframe.
+        min_rows (int, optional): Minimal number of rows. Defaults to 2.
 
     Raises:
         ValueError: If matrix do not contains only int or float
         ValueError: If matrix is not ndarray and do not have more than one row.
+        ValueError: If matrix contains NaN or infinity
+            in the "strict" validation level.
     """
+    if is_checked(input, alternatives_check(min_rows)):
+        return
+
+    matrix = np.asarray(input) if isinstance(input, DataFrame) else input
+
     # Check if matrix is ndarray and have more than one row
-    if isinstance(input, np.ndarray) and np.atleast_2d(input).shape[0] <= 1:
+    if isinstance(matrix, np.ndarray) and np.atleast_2d(matrix).shape[-2] < min_rows:
         raise ValueError(
             "Matrix must be numpy array with more than one row."
         )
 
     # Check if matrix contains only int or float
-    if not (input.dtype == np.dtype(float) or input.dtype == np.dtype(int)):
+    is_integer = np.issubdtype(matrix.dtype, np.integer)
+    is_float = np.issubdtype(matrix.dtype, np.floating)
+
+    if not (is_integer or is_float):
         raise ValueError(
             "Matrix must contain integer of float."
         )
 
+    if get_validation() == "strict" and not all_finite(matrix):
+        raise ValueError("Matrix must contain only finite numbers.")
+
+    record_checks(input, alternatives_check(min_rows))
+
 
 def validate_pam(fun):
     """Decorator that checks point alocation method input.
@@ -111,26 +277,43 @@ def validate_pam(fun):
 
 
 def validate_normalization_input(fun):
-    """Decorator that checks normalization input.
+    """Decorator that checks normalization input. Input can be
+    alternative matrix or stack of alternative matrices.
+
+    The decorator also chooses the output buffer of the normalization,
+    which is the out argument, the input matrix (if copy is False and
+    the matrix has the working dtype) or a new matrix.
 
     Raises:
         ValueError: If shapes of the alternative matrix and
             attributes type vector are not correct.
+        ValueError: If shape of the output buffer is not correct.
     """
     @wraps(fun)
-    def wrapper(matrix: NDArray, attributes_type: NDArray = None):
-        valid_alternative_matrix(matrix)
+    def wrapper(
+        matrix: NDArray,
+        attributes_type: NDArray = None,
+        copy: bool = True,
+        out: NDArray | NormalizationWorkspace = None,
+        statistics: ColumnStatistics = None,
+    ):
+        # Chunk normalized with statistics of the whole matrix can have one row
+        valid_alternative_matrix(matrix, 1 if statistics is not None else 2)
 
-        # Set matrix type to float
-        matrix = matrix.astype(float)
+        out = normalization_output(matrix, copy, out)
 
-        row_size = matrix.shape[1]
+        # Values are converted to the output dtype before the normalization
+        if matrix.dtype != out.dtype:
+            np.copyto(out, matrix)
+            matrix = out
+
+        row_size = matrix.shape[-1]
 
         # Default type of attributes is benefitial
         if attributes_type is None:
             attributes_type = np.full(row_size, True)
 
-            return fun(matrix, attributes_type)
+            return fun(matrix, attributes_type, copy, out, statistics)
 
         types = np.atleast_1d(attributes_type)
         types_size = types.shape[0]
@@ -142,6 +325,37 @@ def validate_normalization_input(fun):
                 f"Expected {row_size} got {types_size}."
             )
 
-        return fun(matrix, attributes_type)
+        return fun(matrix, types.astype(bool), copy, out, statistics)
 
     return wrapper
+
+
+def normalization_output(
+    matrix: NDArray, copy: bool, out: NDArray | NormalizationWorkspace
+) -> NDArray:
+    """Returns output buffer of the normalization in the working dtype.
+
+    Raises:
+        ValueError: If shape of the output buffer is not correct.
+        ValueError: If output buffer is not floating point array.
+    """
+    if isinstance(out, NormalizationWorkspace):
+        return out.buffer(matrix.shape)
+
+    if out is not None:
+        if out.shape != matrix.shape:
+            raise ValueError(
+                f"Output has shape {out.shape}, expected {matrix.shape}."
+            )
+
+        if not np.issubdtype(out.dtype, np.floating):
+            raise ValueError("Output must contain float.")
+
+        return out
+
+    dtype = get_dtype()
+
+    if not copy and matrix.dtype == dtype and matrix.flags.writeable:
+        return matrix
+
+    return np.empty(matrix.shape, dtype)
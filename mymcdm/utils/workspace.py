@@ -0,0 +1,39 @@
+"Reusable buffers for normalization methods."
+import numpy as np
+from numpy.typing import NDArray, DTypeLike
+
+from .config import get_dtype
+
+
+class NormalizationWorkspace:
+    """Preallocated output buffer that can be passed as out argument
+    of normalization methods. Normalizing many matrices of the same shape
+    with one workspace does not allocate new matrices.
+
+    Attributes:
+        matrix (NDArray): Buffer of the normalized matrix.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: DTypeLike = None):
+        """
+        Args:
+            shape (tuple[int, ...]): Shape of the alternative matrix
+                or stack of alternative matrices.
+            dtype (DTypeLike, optional): Dtype of the buffer.
+                Defaults to None, which uses the working dtype.
+        """
+        dtype = get_dtype() if dtype is None else dtype
+        self.matrix = np.empty(shape, dtype)
+
+    def buffer(self, shape: tuple[int, ...]) -> NDArray:
+        """Returns output buffer for the matrix of the given shape.
+
+        Raises:
+            ValueError: If shape of the workspace is different.
+        """
+        if self.matrix.shape != tuple(shape):
+            raise ValueError(
+                f"Workspace has shape {self.matrix.shape}, expected {tuple(shape)}."
+            )
+
+        return self.matrix
@@ -4,6 +4,7 @@ from .entropy import entropy_method
 from .mean import mean_weight
 from .statistical import standard_deviation, svp, critic
 from .point_alocation import pam
+from .objective import objective_weights, WeightingMoments
 
 __all__ = [
     "pairwise_comparisons",
@@ -15,4 +16,6 @@ __all__ = [
     "svp",
     "critic",
     "pam",
+    "objective_weights",
+    "WeightingMoments",
 ]
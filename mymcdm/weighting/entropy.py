@@ -3,12 +3,9 @@ Entropy weights method.
 
 References: [3]
 """
-from math import log
-
-import numpy as np
 from numpy.typing import NDArray
 
-from ..normalization.sum import sum
+from .objective import WeightingMoments
 from ..utils.validation import valid_alternative_matrix
 
 
@@ -22,23 +19,13 @@ def entropy_method(a_matrix: NDArray, attributes_type: NDArray = None) -> NDArra
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
 
+    Entropy of the sum normalized columns is computed from sums
+    accumulated block by block, see WeightingMoments.
+
     Returns weight vector.
     """
     valid_alternative_matrix(a_matrix)
 
-    row_size = a_matrix.shape[1]
-
-    if attributes_type is None:
-        attributes_type = np.full(row_size, True)
-
-    column_size, _ = a_matrix.shape
-
-    normalized, _ = sum(a_matrix, attributes_type)
-
-    log_matrix = np.log(normalized)
-    sum_matrix = np.sum(normalized * log_matrix, axis=0)
-
-    e_matrix = -sum_matrix / log(column_size)
+    moments = WeightingMoments.from_matrix(a_matrix, attributes_type, comoments=False)
 
-    diversity_degree = 1 - e_matrix
-    return diversity_degree / np.sum(diversity_degree)
+    return moments.weights("entropy")
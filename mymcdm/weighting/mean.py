@@ -6,6 +6,8 @@ References: [3]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.config import get_dtype
+
 
 def mean_weight(size: int) -> NDArray:
     """Returns vector of size n that contains 1/n values.
@@ -21,4 +23,4 @@ def mean_weight(size: int) -> NDArray:
             than zero. Got {size}"""
         )
 
-    return np.full(size, 1 / size)
+    return np.full(size, 1 / size, dtype=get_dtype())
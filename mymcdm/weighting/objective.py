@@ -0,0 +1,358 @@
+"""
+Objective weighting methods computed together in one pass.
+
+References: [3]
+"""
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..utils.config import get_dtype, get_accumulate_dtype
+from ..utils.statistics import BLOCK_SIZE
+from ..utils.validation import valid_alternative_matrix
+
+OBJECTIVE_METHODS: Final = ("entropy", "standard_deviation", "svp", "critic")
+
+
+def objective_weights(
+    a_matrix: NDArray,
+    methods: list[str] | tuple[str, ...] = OBJECTIVE_METHODS,
+    attributes_type: NDArray = None,
+    block_size: int = BLOCK_SIZE,
+) -> dict[str, NDArray]:
+    """Calculates weights of more objective weighting methods
+    with one pass over the alternative matrix.
+
+    Args:
+        a_matrix (NDArray): Alternative matrix.
+        methods (list[str] | tuple[str, ...], optional): Names of the methods,
+            any of "entropy", "standard_deviation", "svp" and "critic".
+            Defaults to all methods.
+        attributes_type (NDArray, optional):
+            Binary vector that indicates whether
+            the attribute is beneficial (True) or cost (False).
+            Defaults sets all attributes as benefitial.
+        block_size (int, optional): Number of rows in one block.
+            Defaults to 65536.
+
+    Raises:
+        ValueError: If name of the method is unknown.
+
+    Moments of the columns and the entropy sums are accumulated block
+    by block, so no normalized matrix is created. CRITIC method uses
+    correlation between the criteria.
+
+    Returns dictionary with weight vector of each method.
+    """
+    valid_alternative_matrix(a_matrix)
+
+    for method in methods:
+        if method not in OBJECTIVE_METHODS:
+            raise ValueError(
+                f"Unknown weighting method \"{method}\". "
+                f"Expected one of {OBJECTIVE_METHODS}."
+            )
+
+    moments = WeightingMoments.from_matrix(
+        a_matrix,
+        attributes_type,
+        entropy="entropy" in methods,
+        comoments="critic" in methods,
+        block_size=block_size,
+    )
+
+    return {method: moments.weights(method) for method in methods}
+
+
+class WeightingMoments:
+    """Statistics of the alternative matrix needed by objective weighting
+    methods. Mean and centered second moments are updated block by block
+    with the pairwise formula of Chan et al., so they are accurate
+    also for columns with large mean.
+
+    Statistics can be updated with chunks of the alternative matrix
+    and statistics of different chunks (for example computed by other
+    processes) can be merged, the weights of the whole matrix are then
+    obtained with weights method.
+
+    Attributes:
+        count (int): Number of alternatives.
+        mean (NDArray): Mean of each column.
+        m2 (NDArray): Sum of squared deviations of each column or matrix
+            of sums of products of deviations of each pair of columns.
+        max (NDArray): Maximum of each column.
+        min (NDArray): Minimum of each column.
+        entropy_sums (NDArray | None): Sums of values, values times
+            their logarithms, reciprocal values and logarithms divided
+            by values of each column.
+    """
+
+    def __init__(
+        self,
+        row_size: int,
+        attributes_type: NDArray = None,
+        entropy: bool = True,
+        comoments: bool = True,
+    ):
+        """
+        Args:
+            row_size (int): Number of criteria.
+            attributes_type (NDArray, optional):
+                Binary vector that indicates whether
+                the attribute is beneficial (True) or cost (False).
+                Defaults sets all attributes as benefitial.
+            entropy (bool, optional): Accumulates sums of the entropy
+                method. Defaults to True.
+            comoments (bool, optional): Accumulates products of deviations
+                of each pair of columns needed by CRITIC method.
+                Defaults to True.
+
+        Raises:
+            ValueError: If size of attributes type is not correct.
+        """
+        if attributes_type is None:
+            attributes_type = np.full(row_size, True)
+
+        attributes_type = np.asarray(attributes_type, dtype=bool)
+
+        if attributes_type.shape != (row_size,):
+            raise ValueError(
+                "Wrong size of attributes_type argument. "
+                f"Expected {row_size} got {attributes_type.shape[0]}."
+            )
+
+        dtype = get_accumulate_dtype()
+
+        self.attributes_type = attributes_type
+        self.count = 0
+        self.mean = np.zeros(row_size, dtype)
+        self.m2 = np.zeros((row_size, row_size) if comoments else row_size, dtype)
+        self.max = np.full(row_size, -np.inf, dtype)
+        self.min = np.full(row_size, np.inf, dtype)
+        self.entropy_sums = np.zeros((4, row_size), dtype) if entropy else None
+
+    @classmethod
+    def from_matrix(
+        cls,
+        a_matrix: NDArray,
+        attributes_type: NDArray = None,
+        entropy: bool = True,
+        comoments: bool = True,
+        block_size: int = BLOCK_SIZE,
+    ) -> "WeightingMoments":
+        """Computes statistics of the alternative matrix in blocks of rows.
+
+        Args:
+            a_matrix (NDArray): Alternative matrix or its chunk.
+            attributes_type (NDArray, optional):
+                Binary vector that indicates whether
+                the attribute is beneficial (True) or cost (False).
+                Defaults sets all attributes as benefitial.
+            entropy (bool, optional): Accumulates sums of the entropy
+                method. Defaults to True.
+            comoments (bool, optional): Accumulates products of deviations
+                of each pair of columns needed by CRITIC method.
+                Defaults to True.
+            block_size (int, optional): Number of rows in one block.
+                Defaults to 65536.
+        """
+        moments = cls(a_matrix.shape[1], attributes_type, entropy, comoments)
+
+        for start in range(0, a_matrix.shape[0], block_size):
+            moments.update(a_matrix[start:start + block_size])
+
+        return moments
+
+    def update(self, block: NDArray):
+        """Adds rows of the block to the statistics.
+
+        Args:
+            block (NDArray): Rows of the alternative matrix.
+        """
+        block = np.asarray(block, dtype=get_accumulate_dtype())
+        block_count = block.shape[0]
+
+        if block_count == 0:
+            return
+
+        block_mean = np.mean(block, axis=0)
+        centered = block - block_mean
+
+        if self.m2.ndim == 2:
+            block_m2 = centered.T @ centered
+        else:
+            block_m2 = np.einsum("ij,ij->j", centered, centered)
+
+        self.merge_moments(block_count, block_mean, block_m2)
+
+        np.maximum(self.max, np.max(block, axis=0), out=self.max)
+        np.minimum(self.min, np.min(block, axis=0), out=self.min)
+
+        if self.entropy_sums is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_block = np.log(block)
+
+                self.entropy_sums[0] += np.sum(block, axis=0)
+                self.entropy_sums[1] += np.sum(block * log_block, axis=0)
+                self.entropy_sums[2] += np.sum(1 / block, axis=0)
+                self.entropy_sums[3] += np.sum(log_block / block, axis=0)
+
+    def merge(self, other: "WeightingMoments") -> "WeightingMoments":
+        """Adds statistics of other rows of the same alternative matrix.
+
+        Args:
+            other (WeightingMoments): Statistics of other rows.
+
+        Raises:
+            ValueError: If the statistics were not created
+                with the same arguments.
+
+        Returns the statistics itself.
+        """
+        is_same = (
+            self.m2.shape == other.m2.shape
+            and (self.entropy_sums is None) == (other.entropy_sums is None)
+            and np.array_equal(self.attributes_type, other.attributes_type)
+        )
+
+        if not is_same:
+            raise ValueError(
+                "Merged statistics must be created with the same arguments."
+            )
+
+        if other.count == 0:
+            return self
+
+        self.merge_moments(other.count, other.mean, other.m2)
+
+        np.maximum(self.max, other.max, out=self.max)
+        np.minimum(self.min, other.min, out=self.min)
+
+        if self.entropy_sums is not None:
+            self.entropy_sums += other.entropy_sums
+
+        return self
+
+    def merge_moments(self, count: int, mean: NDArray, m2: NDArray):
+        "Merges count, mean and second moments of other rows."
+        total = self.count + count
+        delta = mean - self.mean
+
+        if self.m2.ndim == 2:
+            correction = np.outer(delta, delta)
+        else:
+            correction = delta * delta
+
+        self.m2 += m2 + correction * (self.count * count / total)
+        self.mean += delta * (count / total)
+        self.count = total
+
+    def variance(self) -> NDArray:
+        "Returns population variance of each column."
+        m2 = np.diagonal(self.m2) if self.m2.ndim == 2 else self.m2
+
+        return m2 / self.count
+
+    def correlation(self) -> NDArray:
+        """Returns correlation matrix of the columns of max-min normalized
+        matrix. Correlation with a column of equal values is zero.
+
+        Raises:
+            ValueError: If products of deviations were not accumulated.
+        """
+        if self.m2.ndim != 2:
+            raise ValueError("Correlation requires accumulated comoments.")
+
+        deviation = np.sqrt(np.diagonal(self.m2))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = self.m2 / np.outer(deviation, deviation)
+
+        correlation[~np.isfinite(correlation)] = 0.0
+        np.clip(correlation, -1.0, 1.0, out=correlation)
+
+        # Cost criteria are reversed by max-min normalization
+        sign = np.where(self.attributes_type, 1.0, -1.0)
+
+        return correlation * np.outer(sign, sign)
+
+    def weights(self, method: str) -> NDArray:
+        """Returns weight vector of the objective weighting method.
+
+        Args:
+            method (str): One of "entropy", "standard_deviation",
+                "svp" and "critic".
+
+        Raises:
+            ValueError: If name of the method is unknown.
+            ValueError: If needed statistics were not accumulated.
+        """
+        match method:
+            case "entropy":
+                weights = self.entropy_diversity()
+            case "standard_deviation":
+                weights = np.sqrt(self.variance())
+            case "svp":
+                weights = self.variance()
+            case "critic":
+                weights = self.critic_information()
+            case _:
+                raise ValueError(
+                    f"Unknown weighting method \"{method}\". "
+                    f"Expected one of {OBJECTIVE_METHODS}."
+                )
+
+        return (weights / np.sum(weights)).astype(get_dtype())
+
+    def entropy_diversity(self) -> NDArray:
+        """Returns degree of diversity of each column of the entropy method.
+        Entropy of the sum normalized column is computed from the sums
+        of the original values.
+
+        Raises:
+            ValueError: If entropy sums were not accumulated.
+            ValueError: If sum of column or sum of inverted values
+                on column is zero.
+        """
+        if self.entropy_sums is None:
+            raise ValueError("Entropy method requires accumulated entropy sums.")
+
+        total, x_log_x, reciprocal, log_over_x = self.entropy_sums
+
+        for idx, is_beneficial in enumerate(self.attributes_type):
+            if is_beneficial and total[idx] == 0:
+                raise ValueError(f"The sum of column {idx} must not be zero.")
+
+            if not is_beneficial and reciprocal[idx] == 0:
+                raise ValueError(
+                    f"The sum of inverted values on row {idx} "
+                    "must not be zero."
+                )
+
+        # Sum of p * log(p) for p = x / sum(x) or p = (1 / x) / sum(1 / x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            benefitial = x_log_x / total - np.log(total)
+            cost = -log_over_x / reciprocal - np.log(reciprocal)
+
+        p_log_p = np.where(self.attributes_type, benefitial, cost)
+        entropy = -p_log_p / np.log(self.count)
+
+        return 1 - entropy
+
+    def critic_information(self) -> NDArray:
+        """Returns amount of information of each column of CRITIC method,
+        which is standard deviation of the max-min normalized column times
+        sum of one minus correlations with all columns.
+
+        Raises:
+            ValueError: If products of deviations were not accumulated.
+        """
+        correlation = self.correlation()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deviation = np.sqrt(self.variance()) / (self.max - self.min)
+
+        deviation[self.max == self.min] = 0.0
+
+        return deviation * np.sum(1 - correlation, axis=1)
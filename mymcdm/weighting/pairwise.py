@@ -6,6 +6,9 @@ References: [3] [7] [8]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.cache import DecisionCache
+from ..utils.config import get_dtype
+from ..utils.misc import content_hash
 from ..utils.validation import valid_alternative_matrix as valid_comparsion_matrix
 
 RANDOM_INDEX = {
@@ -28,15 +31,23 @@ RANDOM_INDEX = {
 "Saaty's random index estimates."
 
 
-def pairwise_comparisons(matrix: NDArray) -> tuple[NDArray, int | None]:
+def pairwise_comparisons(
+    matrix: NDArray, cache: DecisionCache = None
+) -> tuple[NDArray, int | None]:
     """Compute priority of comparsion matrix.
 
     Args:
         matrix (NDArray): Comparsion matrix.
+        cache (DecisionCache, optional): Cache of the priority vectors.
+            Defaults to None.
 
     Returns priority vector and consistency ratio (CR). If size of the matrix
     exceeds random index size then returns Null instead CR.
     """
+    if cache is not None:
+        key = content_hash(matrix, get_dtype())
+        return cache.cached("pairwise", key, lambda: pairwise_comparisons(matrix))
+
     valid_comparsion_matrix(matrix)
 
     priority, eigenvalue = eigenvector_method(matrix)
@@ -57,17 +68,20 @@ def eigenvector_method(matrix: NDArray) -> NDArray:
 
     norm_eig_vec = max_eig_vec / np.sum(max_eig_vec)
 
-    return norm_eig_vec.real, max_eig_val.real
+    return norm_eig_vec.real.astype(get_dtype()), max_eig_val.real
 
 
 def pairwise_alternatives(
     comparsion_matrices: list[NDArray] | NDArray,
+    cache: DecisionCache = None,
 ) -> tuple[NDArray, list[int | None]]:
     """Takes list of comparsion matrices and compute
     alternative matrix using parwise comparsion.
 
     Args:
         comparsion_matrices (list[NDArray] | NDArray): List of comparsion matrices.
+        cache (DecisionCache, optional): Cache of the priority vectors.
+            Defaults to None.
 
     Returns alternative matrix and consistency ratio of comparsions.
     """
@@ -75,7 +89,7 @@ def pairwise_alternatives(
     a_matrix = []
 
     for matrix in comparsion_matrices:
-        priority, cr = pairwise_comparisons(matrix)
+        priority, cr = pairwise_comparisons(matrix, cache)
 
         a_matrix.append(priority)
         cr_vector.append(cr)
@@ -6,6 +6,7 @@ References: [3]
 import numpy as np
 from numpy.typing import NDArray
 
+from ..utils.config import get_dtype
 from ..utils.validation import validate_pam
 
 
@@ -31,4 +32,4 @@ def pam(matrix: NDArray) -> NDArray:
         sum = np.sum(row)
         w_vector.append(row / sum)
 
-    return np.sum(w_vector, axis=0) / n
+    return (np.sum(w_vector, axis=0) / n).astype(get_dtype())
@@ -3,10 +3,10 @@ Methods for calculating weights using statistics.
 
 References: [3]
 """
-import numpy as np
 from numpy.typing import NDArray
 
-from ..normalization.max_min import max_min
+from .objective import WeightingMoments
+from ..utils.statistics import BLOCK_SIZE
 from ..utils.validation import valid_alternative_matrix
 
 
@@ -20,8 +20,8 @@ def standard_deviation(a_matrix: NDArray) -> NDArray:
     """
     valid_alternative_matrix(a_matrix)
 
-    sd_vector = np.std(a_matrix, axis=0)
-    return sd_vector / np.sum(sd_vector)
+    moments = WeightingMoments.from_matrix(a_matrix, entropy=False, comoments=False)
+    return moments.weights("standard_deviation")
 
 
 def svp(a_matrix: NDArray) -> NDArray:
@@ -34,11 +34,15 @@ def svp(a_matrix: NDArray) -> NDArray:
     """
     valid_alternative_matrix(a_matrix)
 
-    sv_vector = np.var(a_matrix, axis=0)
-    return sv_vector / np.sum(sv_vector)
+    moments = WeightingMoments.from_matrix(a_matrix, entropy=False, comoments=False)
+    return moments.weights("svp")
 
 
-def critic(a_matrix: NDArray, attributes_type: NDArray = None) -> NDArray:
+def critic(
+    a_matrix: NDArray,
+    attributes_type: NDArray = None,
+    block_size: int = BLOCK_SIZE,
+) -> NDArray:
     """Calculates weights using Criteria importance through inter-criteria method.
 
     Args:
@@ -47,22 +51,21 @@ def critic(a_matrix: NDArray, attributes_type: NDArray = None) -> NDArray:
             Binary vector that indicates whether
             the attribute is beneficial (True) or cost (False).
             Defaults sets all attributes as benefitial.
+        block_size (int, optional): Number of rows in one block.
+            Defaults to 65536.
+
+    Correlation between the criteria of the max-min normalized matrix
+    is computed from the covariance matrix accumulated block by block,
+    so the memory does not depend on the number of alternatives.
+    Criterion with equal values has zero standard deviation
+    and zero correlation with other criteria.
 
     Returns weight vector.
     """
     valid_alternative_matrix(a_matrix)
 
-    row_size = a_matrix.shape[1]
-
-    if attributes_type is None:
-        attributes_type = np.full(row_size, True)
-
-    normalized, _ = max_min(a_matrix, attributes_type)
-
-    correlation_coef = np.corrcoef(normalized)
-    correlation_coef = correlation_coef[0:row_size, 0:row_size]
-
-    sd = np.std(normalized, axis=0)
-    beta_vector = sd * np.sum(1 - correlation_coef, axis=1)
+    moments = WeightingMoments.from_matrix(
+        a_matrix, attributes_type, entropy=False, block_size=block_size
+    )
 
-    return beta_vector / np.sum(beta_vector)
+    return moments.weights("critic")
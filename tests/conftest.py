@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def a_matrix():
+    "Alternative matrix of five alternatives and four criteria."
+    return np.array([
+        [250, 16, 12, 5],
+        [200, 16, 8, 3],
+        [300, 32, 16, 4],
+        [275, 32, 8, 4],
+        [225, 16, 16, 2],
+    ])
+
+
+@pytest.fixture
+def w_vector():
+    "Equal weights of the four criteria."
+    return np.array([0.25, 0.25, 0.25, 0.25])
+
+
+@pytest.fixture
+def criteria_type():
+    "The first criterion is cost, the other criteria are beneficial."
+    return np.array([False, True, True, True])
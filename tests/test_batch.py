@@ -0,0 +1,20 @@
+import numpy as np
+
+from mymcdm.main import decision_array, decision_batch
+
+
+def test_batch_vikor_ranks_match_decision_array():
+    generator = np.random.default_rng(7)
+    a_stack = generator.integers(1, 4, size=(6, 8, 3)).astype(float)
+    w_matrix = generator.dirichlet(np.ones(3), size=6)
+    criteria_type = np.array([True, False, True])
+
+    score, rank = decision_batch(a_stack, w_matrix, criteria_type, "MAX", "VIKOR")
+
+    for i in range(a_stack.shape[0]):
+        expected_score, expected_rank = decision_array(
+            a_stack[i], w_matrix[i], criteria_type, "MAX", "VIKOR"
+        )
+
+        np.testing.assert_allclose(score[i], expected_score)
+        np.testing.assert_array_equal(rank[i], expected_rank)
@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from mymcdm.main import decision, normalize
+from mymcdm.utils import dtype_policy
+from mymcdm.utils.cache import DecisionCache
+
+
+def test_cache_hit_is_not_changed_by_caller(a_matrix, w_vector, tmp_path):
+    for cache in (DecisionCache(), DecisionCache(folder=tmp_path)):
+        first = decision(a_matrix, w_vector, None, "MAX", "TOPSIS", cache=cache)
+        expected = first["decision"].copy()
+
+        first["decision"].iloc[0, 0] = 999
+        first["alternatives"].iloc[0, 0] = 999
+
+        second = decision(a_matrix, w_vector, None, "MAX", "TOPSIS", cache=cache)
+
+        assert cache.counters("decision")["hits"] == 1
+        assert second["decision"].equals(expected)
+        assert second["alternatives"] is not first["alternatives"]
+        assert second["alternatives"].iloc[0, 0] != 999
+
+
+def test_cache_disk_tier_matches_memory_tier(a_matrix, w_vector, tmp_path):
+    cache = DecisionCache(folder=tmp_path)
+    first = decision(a_matrix, w_vector, None, "MAX", "WSM", cache=cache)
+    first["decision"].iloc[0, 0] = 999
+
+    other = DecisionCache(folder=tmp_path)
+    from_memory = decision(a_matrix, w_vector, None, "MAX", "WSM", cache=cache)
+    from_disk = decision(a_matrix, w_vector, None, "MAX", "WSM", cache=other)
+
+    assert other.counters("decision")["disk_hits"] == 1
+    assert from_memory["decision"].equals(from_disk["decision"])
+
+
+def test_cache_key_contains_working_dtype(a_matrix):
+    cache = DecisionCache()
+
+    with dtype_policy("float32"):
+        single, _ = normalize("MAX", a_matrix, None, cache=cache)
+
+    double, _ = normalize("MAX", a_matrix, None, cache=cache)
+
+    assert single.dtype == np.float32
+    assert double.dtype == np.float64
+    assert cache.counters("normalized")["hits"] == 0
+
+
+def test_cache_hit_arrays_are_not_shared(a_matrix, w_vector, criteria_type, tmp_path):
+    for cache in (DecisionCache(), DecisionCache(folder=tmp_path)):
+        first = decision(
+            a_matrix, w_vector, criteria_type, "MAX", "ELECTRE_BLOCKED", cache=cache
+        )
+        expected = first["decision"]["rows"].copy()
+        expected_type = first["criteria_type"].copy()
+
+        first["decision"]["rows"][:] = -1
+        first["criteria_type"][:] = False
+
+        second = decision(
+            a_matrix, w_vector, criteria_type, "MAX", "ELECTRE_BLOCKED", cache=cache
+        )
+
+        np.testing.assert_array_equal(second["decision"]["rows"], expected)
+        np.testing.assert_array_equal(second["criteria_type"], expected_type)
+
+
+def test_cached_arrays_are_read_only(a_matrix):
+    cache = DecisionCache()
+
+    for _ in range(2):
+        normalized, _ = normalize("MAX", a_matrix, None, cache=cache)
+        assert not normalized.flags.writeable
+
+
+def test_disk_tier_size_is_limited(tmp_path):
+    cache = DecisionCache(max_items=0, folder=tmp_path, max_bytes=2000)
+
+    for size in range(2, 12):
+        cache.put("values", str(size), np.ones(size * 10))
+
+    files = list(tmp_path.glob("*/*.pkl"))
+
+    assert cache.counters("values")["disk_evictions"] > 0
+    assert sum(path.stat().st_size for path in files) <= 2000
+    assert (tmp_path / "values" / "11.pkl") in files
+
+
+def test_disk_tier_concurrent_writes_of_same_key(tmp_path):
+    cache = DecisionCache(folder=tmp_path)
+    value = np.arange(100_000)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: cache.put("values", "key", value), range(32)))
+
+    assert not list(tmp_path.glob("*/*.tmp"))
+    np.testing.assert_array_equal(
+        DecisionCache(folder=tmp_path).get("values", "key"), value
+    )
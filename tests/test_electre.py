@@ -0,0 +1,22 @@
+import numpy as np
+
+from mymcdm.main import decision
+
+
+def test_decision_passes_electre_blocked_options():
+    a_matrix = np.array([[250, 16, 12], [200, 16, 8], [300, 32, 16], [275, 32, 8]])
+    w_vector = np.array([0.5, 0.3, 0.2])
+
+    edges = decision(a_matrix, w_vector, None, "MAX", "ELECTRE_BLOCKED")
+    bitset = decision(
+        a_matrix, w_vector, None, "MAX", "ELECTRE_BLOCKED",
+        memory_limit=64, dominance_output="bitset",
+    )
+
+    assert edges["decision"]["bits"] is None
+    assert bitset["decision"]["rows"] is None
+
+    dense = np.unpackbits(bitset["decision"]["bits"], axis=1, count=4)
+    np.testing.assert_array_equal(
+        np.argwhere(dense).T, [edges["decision"]["rows"], edges["decision"]["cols"]]
+    )
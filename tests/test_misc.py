@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from mymcdm.utils import replace_fractions
+
+
+def test_replace_fractions_keeps_baseline_values():
+    assert replace_fractions("7/8") == 0.875
+
+    np.testing.assert_array_equal(
+        replace_fractions([["12", "1/4"], [0.5, "1/30000000000000000000"]]),
+        [[12, 0.25], [0.5, 1 / 30000000000000000000]],
+    )
+
+
+@pytest.mark.parametrize(
+    "matrix", [[None, "1/2"], [True, "1/2"], [["1", "1/2"], ["1"]], ["1/0"]]
+)
+def test_replace_fractions_rejects_invalid_values(matrix):
+    with pytest.raises(ValueError):
+        replace_fractions(matrix)
@@ -0,0 +1,66 @@
+import numpy as np
+
+from mymcdm.main import normalize, method_scores
+from mymcdm.methods import promethee
+from mymcdm.methods.vikor import vikor_scores
+from mymcdm.prepared import PreparedDecision
+from mymcdm.utils import frame_alternatives
+
+
+A_MATRIX = np.array([
+    [250, 16, 0, 5],
+    [200, 16, 0, 3],
+    [300, 32, 0, 4],
+    [275, 32, 0, 4],
+    [225, 16, 0, 2],
+])
+CRITERIA_TYPE = np.array([False, True, True, True])
+
+
+def weight_vectors():
+    w_vector = np.array([0.4, 0.3, 0.2, 0.1])
+    yield w_vector
+
+    # Single weight changes with the other weights rescaled
+    for index, weight in ((0, 0.1), (3, 0.6), (1, 0.0)):
+        w_vector = w_vector.copy()
+        w_vector[index] = weight
+        yield w_vector / w_vector.sum()
+
+
+def test_prepared_scores_match_method_scores_with_nan_column():
+    normalized, criteria_type = normalize("MAX", A_MATRIX, CRITERIA_TYPE)
+
+    for d_method in ("WSM", "WPM", "WPM_LOG", "TOPSIS", "VIKOR", "PROMETHEE"):
+        prepared = PreparedDecision(A_MATRIX, CRITERIA_TYPE, "MAX", d_method)
+
+        for w_vector in weight_vectors():
+            expected = method_scores(d_method, normalized, w_vector, criteria_type)
+
+            np.testing.assert_allclose(
+                prepared.score(w_vector), expected, rtol=1e-12, err_msg=d_method
+            )
+
+
+def test_prepared_method_settings():
+    a_matrix = A_MATRIX[:, [0, 1, 3]]
+    normalized, criteria_type = normalize("MAX", a_matrix, None)
+
+    vikor = PreparedDecision(a_matrix, None, "MAX", "VIKOR", v_value=0.2)
+    flows = PreparedDecision(
+        a_matrix, None, "MAX", "PROMETHEE",
+        preference="linear", q_threshold=0.1, p_threshold=0.5,
+    )
+
+    for w_vector in np.array([[0.5, 0.3, 0.2], [0.2, 0.3, 0.5]]):
+        np.testing.assert_allclose(
+            vikor.score(w_vector),
+            vikor_scores(normalized, w_vector, criteria_type, 0.2),
+        )
+        np.testing.assert_allclose(
+            flows.score(w_vector),
+            promethee(
+                frame_alternatives(normalized), w_vector, criteria_type,
+                "linear", 0.1, 0.5,
+            ),
+        )
@@ -0,0 +1,54 @@
+import numpy as np
+
+from mymcdm.inout import ResultLog, ResultStore, read_result_log, result_hash
+from mymcdm.main import decision
+
+
+def test_store_hash_does_not_depend_on_append(a_matrix, w_vector, tmp_path):
+    with ResultStore(tmp_path / "results.db") as store:
+        result = decision(a_matrix, w_vector, None, "MAX", "TOPSIS", store=store)
+        store.append(result)
+
+        found = store.query(problem_hash=result_hash(result))
+
+        assert found["id"].shape == (2,)
+        assert found["hash"][0] == found["hash"][1]
+
+
+def test_log_hash_does_not_depend_on_append(a_matrix, w_vector, tmp_path):
+    path = tmp_path / "results.jsonl"
+
+    with ResultLog(path) as log:
+        result = decision(a_matrix, w_vector, None, "MAX", "TOPSIS", store=log)
+        log.append(result)
+
+    hashes = [record["hash"] for record in read_result_log(path)]
+
+    assert hashes == [result_hash(result)] * 2
+
+
+def test_log_is_written_without_close(a_matrix, w_vector, tmp_path):
+    path = tmp_path / "results.jsonl"
+    result = decision(a_matrix, w_vector, None, "MAX", "TOPSIS")
+
+    log = ResultLog(path)
+    log.append(result)
+    del log
+
+    assert [record["hash"] for record in read_result_log(path)] == [
+        result_hash(result)
+    ]
+
+
+def test_log_reads_only_rotated_files(a_matrix, w_vector, tmp_path):
+    path = tmp_path / "results.jsonl"
+    result = decision(a_matrix, w_vector, None, "MAX", "TOPSIS")
+
+    (tmp_path / "results.backup.jsonl").write_text("not a record\n")
+
+    with ResultLog(path, max_bytes=1, buffer_size=0) as log:
+        log.append(result)
+        log.append(result)
+
+    assert len(list(tmp_path.glob("results.2*.jsonl"))) == 2
+    assert len(list(read_result_log(path))) == 2
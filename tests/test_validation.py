@@ -0,0 +1,38 @@
+import warnings
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from mymcdm.main import decision
+from mymcdm.utils import validation_level
+from mymcdm.utils.validation import valid_alternative_matrix
+
+
+def test_record_does_not_skip_stricter_min_rows():
+    with validation_level("once"):
+        matrix = np.ones((2, 3))
+        valid_alternative_matrix(matrix)
+
+        with pytest.raises(ValueError):
+            valid_alternative_matrix(matrix, 3)
+
+
+def test_record_is_dropped_after_dtype_change():
+    with validation_level("once"):
+        dataframe = DataFrame(np.ones((3, 2)))
+        valid_alternative_matrix(dataframe)
+
+        # Setting a string upcasts the column to object with the same shape
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            dataframe.iloc[0, 0] = "x"
+
+        with pytest.raises(ValueError):
+            valid_alternative_matrix(dataframe)
+
+
+def test_normalized_input_is_checked_as_alternatives():
+    with validation_level("once"):
+        with pytest.raises(ValueError, match="more than one row"):
+            decision(np.array([[0.5, 0.2]]), [0.5, 0.5], None, None, "WSM")
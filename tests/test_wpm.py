@@ -0,0 +1,16 @@
+import warnings
+
+import numpy as np
+
+from mymcdm.main import decision_batch
+
+
+def test_wpm_log_of_negative_log_normalized_values_does_not_warn():
+    # LOG normalization of a column with values below and above 1
+    a_stack = np.array([[[0.5, 2.0], [2.0, 3.0], [4.0, 1.5]]])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        score, _ = decision_batch(a_stack, [0.5, 0.5], None, "LOG", "WPM_LOG")
+
+    assert np.isnan(score).any()